@@ -0,0 +1,1190 @@
+/* File: _fortfilemodule.c
+ * This file is auto-generated with f2py (version:1.21.6).
+ * f2py is a Fortran to Python Interface Generator (FPIG), Second Edition,
+ * written by Pearu Peterson <pearu@cens.ioc.ee>.
+ * Generation date: Sun Oct 18 21:23:23 2026
+ * Do not edit this file directly unless you know what you are doing!!!
+ */
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*********************** See f2py2e/cfuncs.py: includes ***********************/
+#include <stdarg.h>
+#include "Python.h"
+#include "fortranobject.h"
+#include <string.h>
+#include <math.h>
+
+/**************** See f2py2e/rules.py: mod_rules['modulebody'] ****************/
+static PyObject *_fortfile_error;
+static PyObject *_fortfile_module;
+
+/*********************** See f2py2e/cfuncs.py: typedefs ***********************/
+typedef char * string;
+#ifdef _WIN32
+typedef __int64 long_long;
+#else
+typedef long long long_long;
+typedef unsigned long long unsigned_long_long;
+#endif
+
+
+/****************** See f2py2e/cfuncs.py: typedefs_generated ******************/
+/*need_typedefs_generated*/
+
+/********************** See f2py2e/cfuncs.py: cppmacros **********************/
+\
+#define FAILNULL(p) do {                                            \
+    if ((p) == NULL) {                                              \
+        PyErr_SetString(PyExc_MemoryError, "NULL pointer found");   \
+        goto capi_fail;                                             \
+    }                                                               \
+} while (0)
+
+#define STRINGMALLOC(str,len)\
+    if ((str = (string)malloc(sizeof(char)*(len+1))) == NULL) {\
+        PyErr_SetString(PyExc_MemoryError, "out of memory");\
+        goto capi_fail;\
+    } else {\
+        (str)[len] = '\0';\
+    }
+
+#if defined(PREPEND_FORTRAN)
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F
+#else
+#define F_FUNC(f,F) _##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F##_
+#else
+#define F_FUNC(f,F) _##f##_
+#endif
+#endif
+#else
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F
+#else
+#define F_FUNC(f,F) f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F##_
+#else
+#define F_FUNC(f,F) f##_
+#endif
+#endif
+#endif
+#if defined(UNDERSCORE_G77)
+#define F_FUNC_US(f,F) F_FUNC(f##_,F##_)
+#else
+#define F_FUNC_US(f,F) F_FUNC(f,F)
+#endif
+
+#ifdef DEBUGCFUNCS
+#define CFUNCSMESS(mess) fprintf(stderr,"debug-capi:"mess);
+#define CFUNCSMESSPY(mess,obj) CFUNCSMESS(mess) \
+    PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+    fprintf(stderr,"\n");
+#else
+#define CFUNCSMESS(mess)
+#define CFUNCSMESSPY(mess,obj)
+#endif
+
+#ifndef max
+#define max(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef min
+#define min(a,b) ((a < b) ? (a) : (b))
+#endif
+#ifndef MAX
+#define MAX(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef MIN
+#define MIN(a,b) ((a < b) ? (a) : (b))
+#endif
+
+#define rank(var) var ## _Rank
+#define shape(var,dim) var ## _Dims[dim]
+#define old_rank(var) (PyArray_NDIM((PyArrayObject *)(capi_ ## var ## _tmp)))
+#define old_shape(var,dim) PyArray_DIM(((PyArrayObject *)(capi_ ## var ## _tmp)),dim)
+#define fshape(var,dim) shape(var,rank(var)-dim-1)
+#define len(var) shape(var,0)
+#define flen(var) fshape(var,0)
+#define old_size(var) PyArray_SIZE((PyArrayObject *)(capi_ ## var ## _tmp))
+/* #define index(i) capi_i ## i */
+#define slen(var) capi_ ## var ## _len
+#define size(var, ...) f2py_size((PyArrayObject *)(capi_ ## var ## _tmp), ## __VA_ARGS__, -1)
+
+#define STRINGFREE(str) do {if (!(str == NULL)) free(str);} while (0)
+
+#define STRINGCOPYN(to,from,buf_size)                           \
+    do {                                                        \
+        int _m = (buf_size);                                    \
+        char *_to = (to);                                       \
+        char *_from = (from);                                   \
+        FAILNULL(_to); FAILNULL(_from);                         \
+        (void)strncpy(_to, _from, sizeof(char)*_m);             \
+        _to[_m-1] = '\0';                                      \
+        /* Padding with spaces instead of nulls */              \
+        for (_m -= 2; _m >= 0 && _to[_m] == '\0'; _m--) {      \
+            _to[_m] = ' ';                                      \
+        }                                                       \
+    } while (0)
+
+
+/************************ See f2py2e/cfuncs.py: cfuncs ************************/
+static int f2py_size(PyArrayObject* var, ...)
+{
+  npy_int sz = 0;
+  npy_int dim;
+  npy_int rank;
+  va_list argp;
+  va_start(argp, var);
+  dim = va_arg(argp, npy_int);
+  if (dim==-1)
+    {
+      sz = PyArray_SIZE(var);
+    }
+  else
+    {
+      rank = PyArray_NDIM(var);
+      if (dim>=1 && dim<=rank)
+        sz = PyArray_DIM(var, dim-1);
+      else
+        fprintf(stderr, "f2py_size: 2nd argument value=%d fails to satisfy 1<=value<=%d. Result will be 0.\n", dim, rank);
+    }
+  va_end(argp);
+  return sz;
+}
+
+static int
+int_from_pyobj(int* v, PyObject *obj, const char *errmess)
+{
+    PyObject* tmp = NULL;
+
+    if (PyLong_Check(obj)) {
+        *v = Npy__PyLong_AsInt(obj);
+        return !(*v == -1 && PyErr_Occurred());
+    }
+
+    tmp = PyNumber_Long(obj);
+    if (tmp) {
+        *v = Npy__PyLong_AsInt(tmp);
+        Py_DECREF(tmp);
+        return !(*v == -1 && PyErr_Occurred());
+    }
+
+    if (PyComplex_Check(obj)) {
+        PyErr_Clear();
+        tmp = PyObject_GetAttrString(obj,"real");
+    }
+    else if (PyBytes_Check(obj) || PyUnicode_Check(obj)) {
+        /*pass*/;
+    }
+    else if (PySequence_Check(obj)) {
+        PyErr_Clear();
+        tmp = PySequence_GetItem(obj, 0);
+    }
+
+    if (tmp) {
+        if (int_from_pyobj(v, tmp, errmess)) {
+            Py_DECREF(tmp);
+            return 1;
+        }
+        Py_DECREF(tmp);
+    }
+
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err == NULL) {
+            err = _fortfile_error;
+        }
+        PyErr_SetString(err, errmess);
+    }
+    return 0;
+}
+
+static int
+long_long_from_pyobj(long_long* v, PyObject *obj, const char *errmess)
+{
+    PyObject* tmp = NULL;
+
+    if (PyLong_Check(obj)) {
+        *v = PyLong_AsLongLong(obj);
+        return !(*v == -1 && PyErr_Occurred());
+    }
+
+    tmp = PyNumber_Long(obj);
+    if (tmp) {
+        *v = PyLong_AsLongLong(tmp);
+        Py_DECREF(tmp);
+        return !(*v == -1 && PyErr_Occurred());
+    }
+
+    if (PyComplex_Check(obj)) {
+        PyErr_Clear();
+        tmp = PyObject_GetAttrString(obj,"real");
+    }
+    else if (PyBytes_Check(obj) || PyUnicode_Check(obj)) {
+        /*pass*/;
+    }
+    else if (PySequence_Check(obj)) {
+        PyErr_Clear();
+        tmp = PySequence_GetItem(obj, 0);
+    }
+
+    if (tmp) {
+        if (long_long_from_pyobj(v, tmp, errmess)) {
+            Py_DECREF(tmp);
+            return 1;
+        }
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err == NULL) {
+            err = _fortfile_error;
+        }
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+static int
+string_from_pyobj(string *str,int *len,const string inistr,PyObject *obj,const char *errmess)
+{
+    PyArrayObject *arr = NULL;
+    PyObject *tmp = NULL;
+#ifdef DEBUGCFUNCS
+fprintf(stderr,"string_from_pyobj(str='%s',len=%d,inistr='%s',obj=%p)\n",(char*)str,*len,(char *)inistr,obj);
+#endif
+    if (obj == Py_None) {
+        if (*len == -1)
+            *len = strlen(inistr); /* Will this cause problems? */
+        STRINGMALLOC(*str,*len);
+        STRINGCOPYN(*str,inistr,*len+1);
+        return 1;
+    }
+    if (PyArray_Check(obj)) {
+        if ((arr = (PyArrayObject *)obj) == NULL)
+            goto capi_fail;
+        if (!ISCONTIGUOUS(arr)) {
+            PyErr_SetString(PyExc_ValueError,"array object is non-contiguous.");
+            goto capi_fail;
+        }
+        if (*len == -1)
+            *len = (PyArray_ITEMSIZE(arr))*PyArray_SIZE(arr);
+        STRINGMALLOC(*str,*len);
+        STRINGCOPYN(*str,PyArray_DATA(arr),*len+1);
+        return 1;
+    }
+    if (PyBytes_Check(obj)) {
+        tmp = obj;
+        Py_INCREF(tmp);
+    }
+    else if (PyUnicode_Check(obj)) {
+        tmp = PyUnicode_AsASCIIString(obj);
+    }
+    else {
+        PyObject *tmp2;
+        tmp2 = PyObject_Str(obj);
+        if (tmp2) {
+            tmp = PyUnicode_AsASCIIString(tmp2);
+            Py_DECREF(tmp2);
+        }
+        else {
+            tmp = NULL;
+        }
+    }
+    if (tmp == NULL) goto capi_fail;
+    if (*len == -1)
+        *len = PyBytes_GET_SIZE(tmp);
+    STRINGMALLOC(*str,*len);
+    STRINGCOPYN(*str,PyBytes_AS_STRING(tmp),*len+1);
+    Py_DECREF(tmp);
+    return 1;
+capi_fail:
+    Py_XDECREF(tmp);
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err == NULL) {
+            err = _fortfile_error;
+        }
+        PyErr_SetString(err, errmess);
+    }
+    return 0;
+}
+
+
+/********************* See f2py2e/cfuncs.py: userincludes *********************/
+/*need_userincludes*/
+
+/********************* See f2py2e/capi_rules.py: usercode *********************/
+
+
+/* See f2py2e/rules.py */
+extern void F_FUNC(seek,SEEK)(int*,long_long*,int*,int*);
+extern void F_FUNC(tell,TELL)(int*,long_long*);
+extern void F_FUNC(freefileunit,FREEFILEUNIT)(int*,int*);
+extern void F_FUNC(frewind,FREWIND)(int*,int*);
+extern void F_FUNC(fbackspace,FBACKSPACE)(int*,int*);
+extern void F_FUNC(fopen,FOPEN)(int*,int*,string,int*,size_t);
+extern void F_FUNC_US(fadvance_one_line,FADVANCE_ONE_LINE)(int*,int*,int*);
+extern void F_FUNC(fisopen,FISOPEN)(int*,int*,int*);
+extern void F_FUNC(fclose,FCLOSE)(int*,int*);
+/*eof externroutines*/
+
+/******************** See f2py2e/capi_rules.py: usercode1 ********************/
+
+
+/******************* See f2py2e/cb_rules.py: buildcallback *******************/
+/*need_callbacks*/
+
+/*********************** See f2py2e/rules.py: buildapi ***********************/
+
+/************************************ seek ************************************/
+static char doc_f2py_rout__fortfile_seek[] = "\
+status = seek(unit,offset,whence)\n\nWrapper for ``seek``.\
+\n\nParameters\n----------\n"
+"unit : input int\n"
+"offset : input long\n"
+"whence : input int\n"
+"\nReturns\n-------\n"
+"status : int";
+/* extern void F_FUNC(seek,SEEK)(int*,long_long*,int*,int*); */
+static PyObject *f2py_rout__fortfile_seek(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,long_long*,int*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+  int unit = 0;
+  PyObject *unit_capi = Py_None;
+  long_long offset = 0;
+  PyObject *offset_capi = Py_None;
+  int whence = 0;
+  PyObject *whence_capi = Py_None;
+  int status = 0;
+    static char *capi_kwlist[] = {"unit","offset","whence",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOO|:_fortfile.seek",\
+        capi_kwlist,&unit_capi,&offset_capi,&whence_capi))
+        return NULL;
+/*frompyobj*/
+  /* Processing variable unit */
+    f2py_success = int_from_pyobj(&unit,unit_capi,"_fortfile.seek() 1st argument (unit) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable offset */
+    f2py_success = long_long_from_pyobj(&offset,offset_capi,"_fortfile.seek() 2nd argument (offset) can't be converted to long_long");
+  if (f2py_success) {
+  /* Processing variable whence */
+    f2py_success = int_from_pyobj(&whence,whence_capi,"_fortfile.seek() 3rd argument (whence) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable status */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&unit,&offset,&whence,&status);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("i",status);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable status */
+  } /*if (f2py_success) of whence*/
+  /* End of cleaning variable whence */
+  } /*if (f2py_success) of offset*/
+  /* End of cleaning variable offset */
+  } /*if (f2py_success) of unit*/
+  /* End of cleaning variable unit */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/******************************** end of seek ********************************/
+
+/************************************ tell ************************************/
+static char doc_f2py_rout__fortfile_tell[] = "\
+offset = tell(unit)\n\nWrapper for ``tell``.\
+\n\nParameters\n----------\n"
+"unit : input int\n"
+"\nReturns\n-------\n"
+"offset : long";
+/* extern void F_FUNC(tell,TELL)(int*,long_long*); */
+static PyObject *f2py_rout__fortfile_tell(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,long_long*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+  int unit = 0;
+  PyObject *unit_capi = Py_None;
+  long_long offset = 0;
+    static char *capi_kwlist[] = {"unit",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "O|:_fortfile.tell",\
+        capi_kwlist,&unit_capi))
+        return NULL;
+/*frompyobj*/
+  /* Processing variable unit */
+    f2py_success = int_from_pyobj(&unit,unit_capi,"_fortfile.tell() 1st argument (unit) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable offset */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&unit,&offset);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("L",offset);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable offset */
+  } /*if (f2py_success) of unit*/
+  /* End of cleaning variable unit */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/******************************** end of tell ********************************/
+
+/******************************** freefileunit ********************************/
+static char doc_f2py_rout__fortfile_freefileunit[] = "\
+funit = freefileunit([uu])\n\nWrapper for ``freefileunit``.\
+\n\nOther Parameters\n----------------\n"
+"uu : input int, optional\n    Default: -1\n"
+"\nReturns\n-------\n"
+"funit : int";
+/* extern void F_FUNC(freefileunit,FREEFILEUNIT)(int*,int*); */
+static PyObject *f2py_rout__fortfile_freefileunit(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+  int uu = 0;
+  PyObject *uu_capi = Py_None;
+  int funit = 0;
+    static char *capi_kwlist[] = {"uu",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "|O:_fortfile.freefileunit",\
+        capi_kwlist,&uu_capi))
+        return NULL;
+/*frompyobj*/
+  /* Processing variable uu */
+  if (uu_capi == Py_None) uu = -1; else
+    f2py_success = int_from_pyobj(&uu,uu_capi,"_fortfile.freefileunit() 1st keyword (uu) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable funit */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&uu,&funit);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("i",funit);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable funit */
+  } /*if (f2py_success) of uu*/
+  /* End of cleaning variable uu */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/**************************** end of freefileunit ****************************/
+
+/********************************** frewind **********************************/
+static char doc_f2py_rout__fortfile_frewind[] = "\
+frewind(funit,[debug])\n\nWrapper for ``frewind``.\
+\n\nParameters\n----------\n"
+"funit : input int\n"
+"\nOther Parameters\n----------------\n"
+"debug : input int, optional\n    Default: 0";
+/* extern void F_FUNC(frewind,FREWIND)(int*,int*); */
+static PyObject *f2py_rout__fortfile_frewind(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+  int funit = 0;
+  PyObject *funit_capi = Py_None;
+  int debug = 0;
+  PyObject *debug_capi = Py_None;
+    static char *capi_kwlist[] = {"funit","debug",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "O|O:_fortfile.frewind",\
+        capi_kwlist,&funit_capi,&debug_capi))
+        return NULL;
+/*frompyobj*/
+  /* Processing variable funit */
+    f2py_success = int_from_pyobj(&funit,funit_capi,"_fortfile.frewind() 1st argument (funit) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable debug */
+  if (debug_capi == Py_None) debug = 0; else
+    f2py_success = int_from_pyobj(&debug,debug_capi,"_fortfile.frewind() 1st keyword (debug) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&funit,&debug);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of debug*/
+  /* End of cleaning variable debug */
+  } /*if (f2py_success) of funit*/
+  /* End of cleaning variable funit */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/******************************* end of frewind *******************************/
+
+/********************************* fbackspace *********************************/
+static char doc_f2py_rout__fortfile_fbackspace[] = "\
+fbackspace(funit,[debug])\n\nWrapper for ``fbackspace``.\
+\n\nParameters\n----------\n"
+"funit : input int\n"
+"\nOther Parameters\n----------------\n"
+"debug : input int, optional\n    Default: 0";
+/* extern void F_FUNC(fbackspace,FBACKSPACE)(int*,int*); */
+static PyObject *f2py_rout__fortfile_fbackspace(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+  int funit = 0;
+  PyObject *funit_capi = Py_None;
+  int debug = 0;
+  PyObject *debug_capi = Py_None;
+    static char *capi_kwlist[] = {"funit","debug",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "O|O:_fortfile.fbackspace",\
+        capi_kwlist,&funit_capi,&debug_capi))
+        return NULL;
+/*frompyobj*/
+  /* Processing variable funit */
+    f2py_success = int_from_pyobj(&funit,funit_capi,"_fortfile.fbackspace() 1st argument (funit) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable debug */
+  if (debug_capi == Py_None) debug = 0; else
+    f2py_success = int_from_pyobj(&debug,debug_capi,"_fortfile.fbackspace() 1st keyword (debug) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&funit,&debug);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of debug*/
+  /* End of cleaning variable debug */
+  } /*if (f2py_success) of funit*/
+  /* End of cleaning variable funit */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/***************************** end of fbackspace *****************************/
+
+/*********************************** fopen ***********************************/
+static char doc_f2py_rout__fortfile_fopen[] = "\
+funit = fopen(fname,[uu,debug])\n\nWrapper for ``fopen``.\
+\n\nParameters\n----------\n"
+"fname : input string(len=-1)\n"
+"\nOther Parameters\n----------------\n"
+"uu : input int, optional\n    Default: -1\n"
+"debug : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"funit : int";
+/* extern void F_FUNC(fopen,FOPEN)(int*,int*,string,int*,size_t); */
+static PyObject *f2py_rout__fortfile_fopen(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,string,int*,size_t)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+  int funit = 0;
+  int uu = 0;
+  PyObject *uu_capi = Py_None;
+  string fname = NULL;
+  int slen(fname);
+  PyObject *fname_capi = Py_None;
+  int debug = 0;
+  PyObject *debug_capi = Py_None;
+    static char *capi_kwlist[] = {"fname","uu","debug",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "O|OO:_fortfile.fopen",\
+        capi_kwlist,&fname_capi,&uu_capi,&debug_capi))
+        return NULL;
+/*frompyobj*/
+  /* Processing variable funit */
+  /* Processing variable uu */
+  if (uu_capi == Py_None) uu = -1; else
+    f2py_success = int_from_pyobj(&uu,uu_capi,"_fortfile.fopen() 1st keyword (uu) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable fname */
+  slen(fname) = -1;
+  f2py_success = string_from_pyobj(&fname,&slen(fname),"",fname_capi,"string_from_pyobj failed in converting 1st argument `fname' of _fortfile.fopen to C string");
+  if (f2py_success) {
+  /* Processing variable debug */
+  if (debug_capi == Py_None) debug = 0; else
+    f2py_success = int_from_pyobj(&debug,debug_capi,"_fortfile.fopen() 2nd keyword (debug) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&funit,&uu,fname,&debug,slen(fname));
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("i",funit);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of debug*/
+  /* End of cleaning variable debug */
+    STRINGFREE(fname);
+  }  /*if (f2py_success) of fname*/
+  /* End of cleaning variable fname */
+  } /*if (f2py_success) of uu*/
+  /* End of cleaning variable uu */
+  /* End of cleaning variable funit */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/******************************** end of fopen ********************************/
+
+/***************************** fadvance_one_line *****************************/
+static char doc_f2py_rout__fortfile_fadvance_one_line[] = "\
+success = fadvance_one_line(funit,[debug])\n\nWrapper for ``fadvance_one_line``.\
+\n\nParameters\n----------\n"
+"funit : input int\n"
+"\nOther Parameters\n----------------\n"
+"debug : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"success : int";
+/* extern void F_FUNC_US(fadvance_one_line,FADVANCE_ONE_LINE)(int*,int*,int*); */
+static PyObject *f2py_rout__fortfile_fadvance_one_line(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+  int success = 0;
+  int funit = 0;
+  PyObject *funit_capi = Py_None;
+  int debug = 0;
+  PyObject *debug_capi = Py_None;
+    static char *capi_kwlist[] = {"funit","debug",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "O|O:_fortfile.fadvance_one_line",\
+        capi_kwlist,&funit_capi,&debug_capi))
+        return NULL;
+/*frompyobj*/
+  /* Processing variable success */
+  /* Processing variable funit */
+    f2py_success = int_from_pyobj(&funit,funit_capi,"_fortfile.fadvance_one_line() 1st argument (funit) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable debug */
+  if (debug_capi == Py_None) debug = 0; else
+    f2py_success = int_from_pyobj(&debug,debug_capi,"_fortfile.fadvance_one_line() 1st keyword (debug) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&success,&funit,&debug);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("i",success);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of debug*/
+  /* End of cleaning variable debug */
+  } /*if (f2py_success) of funit*/
+  /* End of cleaning variable funit */
+  /* End of cleaning variable success */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/************************** end of fadvance_one_line **************************/
+
+/********************************** fisopen **********************************/
+static char doc_f2py_rout__fortfile_fisopen[] = "\
+isopen = fisopen(funit,[debug])\n\nWrapper for ``fisopen``.\
+\n\nParameters\n----------\n"
+"funit : input int\n"
+"\nOther Parameters\n----------------\n"
+"debug : input int, optional\n    Default: 0\n"
+"\nReturns\n-------\n"
+"isopen : int";
+/* extern void F_FUNC(fisopen,FISOPEN)(int*,int*,int*); */
+static PyObject *f2py_rout__fortfile_fisopen(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+  int funit = 0;
+  PyObject *funit_capi = Py_None;
+  int isopen = 0;
+  int debug = 0;
+  PyObject *debug_capi = Py_None;
+    static char *capi_kwlist[] = {"funit","debug",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "O|O:_fortfile.fisopen",\
+        capi_kwlist,&funit_capi,&debug_capi))
+        return NULL;
+/*frompyobj*/
+  /* Processing variable funit */
+    f2py_success = int_from_pyobj(&funit,funit_capi,"_fortfile.fisopen() 1st argument (funit) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable isopen */
+  /* Processing variable debug */
+  if (debug_capi == Py_None) debug = 0; else
+    f2py_success = int_from_pyobj(&debug,debug_capi,"_fortfile.fisopen() 1st keyword (debug) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&funit,&isopen,&debug);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("i",isopen);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of debug*/
+  /* End of cleaning variable debug */
+  /* End of cleaning variable isopen */
+  } /*if (f2py_success) of funit*/
+  /* End of cleaning variable funit */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/******************************* end of fisopen *******************************/
+
+/*********************************** fclose ***********************************/
+static char doc_f2py_rout__fortfile_fclose[] = "\
+fclose(funit,[debug])\n\nWrapper for ``fclose``.\
+\n\nParameters\n----------\n"
+"funit : input int\n"
+"\nOther Parameters\n----------------\n"
+"debug : input int, optional\n    Default: 0";
+/* extern void F_FUNC(fclose,FCLOSE)(int*,int*); */
+static PyObject *f2py_rout__fortfile_fclose(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+  int funit = 0;
+  PyObject *funit_capi = Py_None;
+  int debug = 0;
+  PyObject *debug_capi = Py_None;
+    static char *capi_kwlist[] = {"funit","debug",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "O|O:_fortfile.fclose",\
+        capi_kwlist,&funit_capi,&debug_capi))
+        return NULL;
+/*frompyobj*/
+  /* Processing variable funit */
+    f2py_success = int_from_pyobj(&funit,funit_capi,"_fortfile.fclose() 1st argument (funit) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable debug */
+  if (debug_capi == Py_None) debug = 0; else
+    f2py_success = int_from_pyobj(&debug,debug_capi,"_fortfile.fclose() 1st keyword (debug) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&funit,&debug);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of debug*/
+  /* End of cleaning variable debug */
+  } /*if (f2py_success) of funit*/
+  /* End of cleaning variable funit */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/******************************* end of fclose *******************************/
+/*eof body*/
+
+/******************* See f2py2e/f90mod_rules.py: buildhooks *******************/
+/*need_f90modhooks*/
+
+/************** See f2py2e/rules.py: module_rules['modulebody'] **************/
+
+/******************* See f2py2e/common_rules.py: buildhooks *******************/
+
+/*need_commonhooks*/
+
+/**************************** See f2py2e/rules.py ****************************/
+
+static FortranDataDef f2py_routine_defs[] = {
+  {"seek",-1,{{-1}},0,(char *)F_FUNC(seek,SEEK),(f2py_init_func)f2py_rout__fortfile_seek,doc_f2py_rout__fortfile_seek},
+  {"tell",-1,{{-1}},0,(char *)F_FUNC(tell,TELL),(f2py_init_func)f2py_rout__fortfile_tell,doc_f2py_rout__fortfile_tell},
+  {"freefileunit",-1,{{-1}},0,(char *)F_FUNC(freefileunit,FREEFILEUNIT),(f2py_init_func)f2py_rout__fortfile_freefileunit,doc_f2py_rout__fortfile_freefileunit},
+  {"frewind",-1,{{-1}},0,(char *)F_FUNC(frewind,FREWIND),(f2py_init_func)f2py_rout__fortfile_frewind,doc_f2py_rout__fortfile_frewind},
+  {"fbackspace",-1,{{-1}},0,(char *)F_FUNC(fbackspace,FBACKSPACE),(f2py_init_func)f2py_rout__fortfile_fbackspace,doc_f2py_rout__fortfile_fbackspace},
+  {"fopen",-1,{{-1}},0,(char *)F_FUNC(fopen,FOPEN),(f2py_init_func)f2py_rout__fortfile_fopen,doc_f2py_rout__fortfile_fopen},
+  {"fadvance_one_line",-1,{{-1}},0,(char *)F_FUNC_US(fadvance_one_line,FADVANCE_ONE_LINE),(f2py_init_func)f2py_rout__fortfile_fadvance_one_line,doc_f2py_rout__fortfile_fadvance_one_line},
+  {"fisopen",-1,{{-1}},0,(char *)F_FUNC(fisopen,FISOPEN),(f2py_init_func)f2py_rout__fortfile_fisopen,doc_f2py_rout__fortfile_fisopen},
+  {"fclose",-1,{{-1}},0,(char *)F_FUNC(fclose,FCLOSE),(f2py_init_func)f2py_rout__fortfile_fclose,doc_f2py_rout__fortfile_fclose},
+
+/*eof routine_defs*/
+  {NULL}
+};
+
+static PyMethodDef f2py_module_methods[] = {
+
+  {NULL,NULL}
+};
+
+static struct PyModuleDef moduledef = {
+  PyModuleDef_HEAD_INIT,
+  "_fortfile",
+  NULL,
+  -1,
+  f2py_module_methods,
+  NULL,
+  NULL,
+  NULL,
+  NULL
+};
+
+PyMODINIT_FUNC PyInit__fortfile(void) {
+  int i;
+  PyObject *m,*d, *s, *tmp;
+  m = _fortfile_module = PyModule_Create(&moduledef);
+  Py_SET_TYPE(&PyFortran_Type, &PyType_Type);
+  import_array();
+  if (PyErr_Occurred())
+    {PyErr_SetString(PyExc_ImportError, "can't initialize module _fortfile (failed to import numpy)"); return m;}
+  d = PyModule_GetDict(m);
+  s = PyUnicode_FromString("1.21.6");
+  PyDict_SetItemString(d, "__version__", s);
+  Py_DECREF(s);
+  s = PyUnicode_FromString(
+    "This module '_fortfile' is auto-generated with f2py (version:1.21.6).\nFunctions:\n"
+"  status = seek(unit,offset,whence)\n"
+"  offset = tell(unit)\n"
+"  funit = freefileunit(uu=-1)\n"
+"  frewind(funit,debug=0)\n"
+"  fbackspace(funit,debug=0)\n"
+"  funit = fopen(fname,uu=-1,debug=0)\n"
+"  success = fadvance_one_line(funit,debug=0)\n"
+"  isopen = fisopen(funit,debug=0)\n"
+"  fclose(funit,debug=0)\n"
+".");
+  PyDict_SetItemString(d, "__doc__", s);
+  Py_DECREF(s);
+  s = PyUnicode_FromString("1.21.6");
+  PyDict_SetItemString(d, "__f2py_numpy_version__", s);
+  Py_DECREF(s);
+  _fortfile_error = PyErr_NewException ("_fortfile.error", NULL, NULL);
+  /*
+   * Store the error object inside the dict, so that it could get deallocated.
+   * (in practice, this is a module, so it likely will not and cannot.)
+   */
+  PyDict_SetItemString(d, "__fortfile_error", _fortfile_error);
+  Py_DECREF(_fortfile_error);
+  for(i=0;f2py_routine_defs[i].name!=NULL;i++) {
+    tmp = PyFortranObject_NewAsAttr(&f2py_routine_defs[i]);
+    PyDict_SetItemString(d, f2py_routine_defs[i].name, tmp);
+    Py_DECREF(tmp);
+  }
+
+
+
+
+
+
+
+
+
+/*eof initf2pywraphooks*/
+/*eof initf90modhooks*/
+
+/*eof initcommonhooks*/
+
+
+#ifdef F2PY_REPORT_ATEXIT
+  if (! PyErr_Occurred())
+    on_exit(f2py_report_on_exit,(void*)"_fortfile");
+#endif
+  return m;
+}
+#ifdef __cplusplus
+}
+#endif
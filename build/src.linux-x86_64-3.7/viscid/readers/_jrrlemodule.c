@@ -0,0 +1,1941 @@
+/* File: _jrrlemodule.c
+ * This file is auto-generated with f2py (version:1.21.6).
+ * f2py is a Fortran to Python Interface Generator (FPIG), Second Edition,
+ * written by Pearu Peterson <pearu@cens.ioc.ee>.
+ * Generation date: Sun Oct 18 21:23:23 2026
+ * Do not edit this file directly unless you know what you are doing!!!
+ */
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/*********************** See f2py2e/cfuncs.py: includes ***********************/
+#include "Python.h"
+#include <stdarg.h>
+#include "fortranobject.h"
+#include <string.h>
+#include <math.h>
+
+/**************** See f2py2e/rules.py: mod_rules['modulebody'] ****************/
+static PyObject *_jrrle_error;
+static PyObject *_jrrle_module;
+
+/*********************** See f2py2e/cfuncs.py: typedefs ***********************/
+typedef char * string;
+
+/****************** See f2py2e/cfuncs.py: typedefs_generated ******************/
+/*need_typedefs_generated*/
+
+/********************** See f2py2e/cfuncs.py: cppmacros **********************/
+#define STRINGMALLOC(str,len)\
+    if ((str = (string)malloc(sizeof(char)*(len+1))) == NULL) {\
+        PyErr_SetString(PyExc_MemoryError, "out of memory");\
+        goto capi_fail;\
+    } else {\
+        (str)[len] = '\0';\
+    }
+
+#define PRINTPYOBJERR(obj)\
+    fprintf(stderr,"_jrrle.error is related to ");\
+    PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+    fprintf(stderr,"\n");
+
+\
+#define FAILNULL(p) do {                                            \
+    if ((p) == NULL) {                                              \
+        PyErr_SetString(PyExc_MemoryError, "NULL pointer found");   \
+        goto capi_fail;                                             \
+    }                                                               \
+} while (0)
+
+#if defined(PREPEND_FORTRAN)
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F
+#else
+#define F_FUNC(f,F) _##f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) _##F##_
+#else
+#define F_FUNC(f,F) _##f##_
+#endif
+#endif
+#else
+#if defined(NO_APPEND_FORTRAN)
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F
+#else
+#define F_FUNC(f,F) f
+#endif
+#else
+#if defined(UPPERCASE_FORTRAN)
+#define F_FUNC(f,F) F##_
+#else
+#define F_FUNC(f,F) f##_
+#endif
+#endif
+#endif
+#if defined(UNDERSCORE_G77)
+#define F_FUNC_US(f,F) F_FUNC(f##_,F##_)
+#else
+#define F_FUNC_US(f,F) F_FUNC(f,F)
+#endif
+
+#define rank(var) var ## _Rank
+#define shape(var,dim) var ## _Dims[dim]
+#define old_rank(var) (PyArray_NDIM((PyArrayObject *)(capi_ ## var ## _tmp)))
+#define old_shape(var,dim) PyArray_DIM(((PyArrayObject *)(capi_ ## var ## _tmp)),dim)
+#define fshape(var,dim) shape(var,rank(var)-dim-1)
+#define len(var) shape(var,0)
+#define flen(var) fshape(var,0)
+#define old_size(var) PyArray_SIZE((PyArrayObject *)(capi_ ## var ## _tmp))
+/* #define index(i) capi_i ## i */
+#define slen(var) capi_ ## var ## _len
+#define size(var, ...) f2py_size((PyArrayObject *)(capi_ ## var ## _tmp), ## __VA_ARGS__, -1)
+
+#define STRINGFREE(str) do {if (!(str == NULL)) free(str);} while (0)
+
+#ifdef DEBUGCFUNCS
+#define CFUNCSMESS(mess) fprintf(stderr,"debug-capi:"mess);
+#define CFUNCSMESSPY(mess,obj) CFUNCSMESS(mess) \
+    PyObject_Print((PyObject *)obj,stderr,Py_PRINT_RAW);\
+    fprintf(stderr,"\n");
+#else
+#define CFUNCSMESS(mess)
+#define CFUNCSMESSPY(mess,obj)
+#endif
+
+#ifndef max
+#define max(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef min
+#define min(a,b) ((a < b) ? (a) : (b))
+#endif
+#ifndef MAX
+#define MAX(a,b) ((a > b) ? (a) : (b))
+#endif
+#ifndef MIN
+#define MIN(a,b) ((a < b) ? (a) : (b))
+#endif
+
+#define CHECKSCALAR(check,tcheck,name,show,var)\
+    if (!(check)) {\
+        char errstring[256];\
+        sprintf(errstring, "%s: "show, "("tcheck") failed for "name, var);\
+        PyErr_SetString(_jrrle_error,errstring);\
+        /*goto capi_fail;*/\
+    } else 
+#define STRINGCOPYN(to,from,buf_size)                           \
+    do {                                                        \
+        int _m = (buf_size);                                    \
+        char *_to = (to);                                       \
+        char *_from = (from);                                   \
+        FAILNULL(_to); FAILNULL(_from);                         \
+        (void)strncpy(_to, _from, sizeof(char)*_m);             \
+        _to[_m-1] = '\0';                                      \
+        /* Padding with spaces instead of nulls */              \
+        for (_m -= 2; _m >= 0 && _to[_m] == '\0'; _m--) {      \
+            _to[_m] = ' ';                                      \
+        }                                                       \
+    } while (0)
+
+
+/************************ See f2py2e/cfuncs.py: cfuncs ************************/
+static int
+double_from_pyobj(double* v, PyObject *obj, const char *errmess)
+{
+    PyObject* tmp = NULL;
+    if (PyFloat_Check(obj)) {
+        *v = PyFloat_AsDouble(obj);
+        return !(*v == -1.0 && PyErr_Occurred());
+    }
+
+    tmp = PyNumber_Float(obj);
+    if (tmp) {
+        *v = PyFloat_AsDouble(tmp);
+        Py_DECREF(tmp);
+        return !(*v == -1.0 && PyErr_Occurred());
+    }
+
+    if (PyComplex_Check(obj)) {
+        PyErr_Clear();
+        tmp = PyObject_GetAttrString(obj,"real");
+    }
+    else if (PyBytes_Check(obj) || PyUnicode_Check(obj)) {
+        /*pass*/;
+    }
+    else if (PySequence_Check(obj)) {
+        PyErr_Clear();
+        tmp = PySequence_GetItem(obj, 0);
+    }
+
+    if (tmp) {
+        if (double_from_pyobj(v,tmp,errmess)) {Py_DECREF(tmp); return 1;}
+        Py_DECREF(tmp);
+    }
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err==NULL) err = _jrrle_error;
+        PyErr_SetString(err,errmess);
+    }
+    return 0;
+}
+
+static int f2py_size(PyArrayObject* var, ...)
+{
+  npy_int sz = 0;
+  npy_int dim;
+  npy_int rank;
+  va_list argp;
+  va_start(argp, var);
+  dim = va_arg(argp, npy_int);
+  if (dim==-1)
+    {
+      sz = PyArray_SIZE(var);
+    }
+  else
+    {
+      rank = PyArray_NDIM(var);
+      if (dim>=1 && dim<=rank)
+        sz = PyArray_DIM(var, dim-1);
+      else
+        fprintf(stderr, "f2py_size: 2nd argument value=%d fails to satisfy 1<=value<=%d. Result will be 0.\n", dim, rank);
+    }
+  va_end(argp);
+  return sz;
+}
+
+static int try_pyarr_from_string(PyObject *obj,const string str) {
+    PyArrayObject *arr = NULL;
+    if (PyArray_Check(obj) && (!((arr = (PyArrayObject *)obj) == NULL)))
+        { STRINGCOPYN(PyArray_DATA(arr),str,PyArray_NBYTES(arr)); }
+    return 1;
+capi_fail:
+    PRINTPYOBJERR(obj);
+    PyErr_SetString(_jrrle_error,"try_pyarr_from_string failed");
+    return 0;
+}
+
+static int
+int_from_pyobj(int* v, PyObject *obj, const char *errmess)
+{
+    PyObject* tmp = NULL;
+
+    if (PyLong_Check(obj)) {
+        *v = Npy__PyLong_AsInt(obj);
+        return !(*v == -1 && PyErr_Occurred());
+    }
+
+    tmp = PyNumber_Long(obj);
+    if (tmp) {
+        *v = Npy__PyLong_AsInt(tmp);
+        Py_DECREF(tmp);
+        return !(*v == -1 && PyErr_Occurred());
+    }
+
+    if (PyComplex_Check(obj)) {
+        PyErr_Clear();
+        tmp = PyObject_GetAttrString(obj,"real");
+    }
+    else if (PyBytes_Check(obj) || PyUnicode_Check(obj)) {
+        /*pass*/;
+    }
+    else if (PySequence_Check(obj)) {
+        PyErr_Clear();
+        tmp = PySequence_GetItem(obj, 0);
+    }
+
+    if (tmp) {
+        if (int_from_pyobj(v, tmp, errmess)) {
+            Py_DECREF(tmp);
+            return 1;
+        }
+        Py_DECREF(tmp);
+    }
+
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err == NULL) {
+            err = _jrrle_error;
+        }
+        PyErr_SetString(err, errmess);
+    }
+    return 0;
+}
+
+static int
+string_from_pyobj(string *str,int *len,const string inistr,PyObject *obj,const char *errmess)
+{
+    PyArrayObject *arr = NULL;
+    PyObject *tmp = NULL;
+#ifdef DEBUGCFUNCS
+fprintf(stderr,"string_from_pyobj(str='%s',len=%d,inistr='%s',obj=%p)\n",(char*)str,*len,(char *)inistr,obj);
+#endif
+    if (obj == Py_None) {
+        if (*len == -1)
+            *len = strlen(inistr); /* Will this cause problems? */
+        STRINGMALLOC(*str,*len);
+        STRINGCOPYN(*str,inistr,*len+1);
+        return 1;
+    }
+    if (PyArray_Check(obj)) {
+        if ((arr = (PyArrayObject *)obj) == NULL)
+            goto capi_fail;
+        if (!ISCONTIGUOUS(arr)) {
+            PyErr_SetString(PyExc_ValueError,"array object is non-contiguous.");
+            goto capi_fail;
+        }
+        if (*len == -1)
+            *len = (PyArray_ITEMSIZE(arr))*PyArray_SIZE(arr);
+        STRINGMALLOC(*str,*len);
+        STRINGCOPYN(*str,PyArray_DATA(arr),*len+1);
+        return 1;
+    }
+    if (PyBytes_Check(obj)) {
+        tmp = obj;
+        Py_INCREF(tmp);
+    }
+    else if (PyUnicode_Check(obj)) {
+        tmp = PyUnicode_AsASCIIString(obj);
+    }
+    else {
+        PyObject *tmp2;
+        tmp2 = PyObject_Str(obj);
+        if (tmp2) {
+            tmp = PyUnicode_AsASCIIString(tmp2);
+            Py_DECREF(tmp2);
+        }
+        else {
+            tmp = NULL;
+        }
+    }
+    if (tmp == NULL) goto capi_fail;
+    if (*len == -1)
+        *len = PyBytes_GET_SIZE(tmp);
+    STRINGMALLOC(*str,*len);
+    STRINGCOPYN(*str,PyBytes_AS_STRING(tmp),*len+1);
+    Py_DECREF(tmp);
+    return 1;
+capi_fail:
+    Py_XDECREF(tmp);
+    {
+        PyObject* err = PyErr_Occurred();
+        if (err == NULL) {
+            err = _jrrle_error;
+        }
+        PyErr_SetString(err, errmess);
+    }
+    return 0;
+}
+
+static int
+float_from_pyobj(float* v, PyObject *obj, const char *errmess)
+{
+    double d=0.0;
+    if (double_from_pyobj(&d,obj,errmess)) {
+        *v = (float)d;
+        return 1;
+    }
+    return 0;
+}
+
+
+/********************* See f2py2e/cfuncs.py: userincludes *********************/
+/*need_userincludes*/
+
+/********************* See f2py2e/capi_rules.py: usercode *********************/
+
+
+/* See f2py2e/rules.py */
+extern void F_FUNC_US(inquire_next,INQUIRE_NEXT)(int*,int*,int*,int*,int*,int*,int*,string,string,size_t,size_t);
+extern void F_FUNC_US(read_jrrle1d,READ_JRRLE1D)(int*,float*,int*,string,int*,int*,size_t);
+extern void F_FUNC_US(read_jrrle2d,READ_JRRLE2D)(int*,float*,int*,string,int*,int*,size_t);
+extern void F_FUNC_US(read_jrrle3d,READ_JRRLE3D)(int*,float*,int*,string,int*,int*,size_t);
+extern void F_FUNC_US(write_jrrle1d,WRITE_JRRLE1D)(int*,float*,int*,string,string,int*,size_t,size_t);
+extern void F_FUNC_US(write_jrrle2d,WRITE_JRRLE2D)(int*,float*,int*,int*,string,string,int*,size_t,size_t);
+extern void F_FUNC_US(write_jrrle3d,WRITE_JRRLE3D)(int*,float*,int*,int*,int*,string,string,int*,size_t,size_t);
+extern void F_FUNC(end0,END0)(string,int*,size_t);
+extern void F_FUNC(rdn2,RDN2)(int*,float*,int*,string,int*,float*,size_t);
+extern void F_FUNC(wrndec,WRNDEC)(int*,int*,int*);
+extern void F_FUNC(wrn2,WRN2)(int*,float*,int*,string,int*,float*,size_t);
+extern void F_FUNC(wrnenc,WRNENC)(int*,int*,int*);
+/*eof externroutines*/
+
+/******************** See f2py2e/capi_rules.py: usercode1 ********************/
+
+
+/******************* See f2py2e/cb_rules.py: buildcallback *******************/
+/*need_callbacks*/
+
+/*********************** See f2py2e/rules.py: buildapi ***********************/
+
+/******************************** inquire_next ********************************/
+static char doc_f2py_rout__jrrle_inquire_next[] = "\
+found_field,ndim,nx,ny,nz,it = inquire_next(iu,varname,tstring)\n\nWrapper for ``inquire_next``.\
+\n\nParameters\n----------\n"
+"iu : input int\n"
+"varname : in/output rank-0 array(string(len=80),'c')\n"
+"tstring : in/output rank-0 array(string(len=80),'c')\n"
+"\nReturns\n-------\n"
+"found_field : int\n"
+"ndim : int\n"
+"nx : int\n"
+"ny : int\n"
+"nz : int\n"
+"it : int";
+/* extern void F_FUNC_US(inquire_next,INQUIRE_NEXT)(int*,int*,int*,int*,int*,int*,int*,string,string,size_t,size_t); */
+static PyObject *f2py_rout__jrrle_inquire_next(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*,int*,int*,int*,int*,string,string,size_t,size_t)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+  int found_field = 0;
+  int iu = 0;
+  PyObject *iu_capi = Py_None;
+  int ndim = 0;
+  int nx = 0;
+  int ny = 0;
+  int nz = 0;
+  int it = 0;
+  string varname = NULL;
+  int slen(varname);
+  PyObject *varname_capi = Py_None;
+  string tstring = NULL;
+  int slen(tstring);
+  PyObject *tstring_capi = Py_None;
+    static char *capi_kwlist[] = {"iu","varname","tstring",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOO|:_jrrle.inquire_next",\
+        capi_kwlist,&iu_capi,&varname_capi,&tstring_capi))
+        return NULL;
+/*frompyobj*/
+  /* Processing variable iu */
+    f2py_success = int_from_pyobj(&iu,iu_capi,"_jrrle.inquire_next() 1st argument (iu) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable varname */
+  slen(varname) = 80;
+  f2py_success = string_from_pyobj(&varname,&slen(varname),"",varname_capi,"string_from_pyobj failed in converting 2nd argument `varname' of _jrrle.inquire_next to C string");
+  if (f2py_success) {
+  /* Processing variable tstring */
+  slen(tstring) = 80;
+  f2py_success = string_from_pyobj(&tstring,&slen(tstring),"",tstring_capi,"string_from_pyobj failed in converting 3rd argument `tstring' of _jrrle.inquire_next to C string");
+  if (f2py_success) {
+  /* Processing variable ndim */
+  /* Processing variable nx */
+  /* Processing variable ny */
+  /* Processing variable nz */
+  /* Processing variable it */
+  /* Processing variable found_field */
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&found_field,&iu,&ndim,&nx,&ny,&nz,&it,varname,tstring,slen(varname),slen(tstring));
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+  f2py_success = try_pyarr_from_string(varname_capi,varname);
+  if (f2py_success) {
+  f2py_success = try_pyarr_from_string(tstring_capi,tstring);
+  if (f2py_success) {
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("iiiiii",found_field,ndim,nx,ny,nz,it);
+/*closepyobjfrom*/
+  } /*if (f2py_success) of tstring pyobjfrom*/
+  } /*if (f2py_success) of varname pyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  /* End of cleaning variable found_field */
+  /* End of cleaning variable it */
+  /* End of cleaning variable nz */
+  /* End of cleaning variable ny */
+  /* End of cleaning variable nx */
+  /* End of cleaning variable ndim */
+    STRINGFREE(tstring);
+  }  /*if (f2py_success) of tstring*/
+  /* End of cleaning variable tstring */
+    STRINGFREE(varname);
+  }  /*if (f2py_success) of varname*/
+  /* End of cleaning variable varname */
+  } /*if (f2py_success) of iu*/
+  /* End of cleaning variable iu */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/**************************** end of inquire_next ****************************/
+
+/******************************** read_jrrle1d ********************************/
+static char doc_f2py_rout__jrrle_read_jrrle1d[] = "\
+success = read_jrrle1d(iu,a1,l1,read_ascii,[nx])\n\nWrapper for ``read_jrrle1d``.\
+\n\nParameters\n----------\n"
+"iu : input int\n"
+"a1 :  rank-1 array('f') with bounds (nx)\n"
+"l1 :  string(len=-1)\n"
+"read_ascii : input int\n"
+"\nOther Parameters\n----------------\n"
+"nx : input int, optional\n    Default: len(a1)\n"
+"\nReturns\n-------\n"
+"success : int";
+/* extern void F_FUNC_US(read_jrrle1d,READ_JRRLE1D)(int*,float*,int*,string,int*,int*,size_t); */
+static PyObject *f2py_rout__jrrle_read_jrrle1d(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,int*,string,int*,int*,size_t)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+  int iu = 0;
+  PyObject *iu_capi = Py_None;
+  float *a1 = NULL;
+  npy_intp a1_Dims[1] = {-1};
+  const int a1_Rank = 1;
+  PyArrayObject *capi_a1_tmp = NULL;
+  int capi_a1_intent = 0;
+  PyObject *a1_capi = Py_None;
+  int nx = 0;
+  PyObject *nx_capi = Py_None;
+  string l1 = NULL;
+  int slen(l1);
+  PyObject *l1_capi = Py_None;
+  int read_ascii = 0;
+  PyObject *read_ascii_capi = Py_None;
+  int success = 0;
+    static char *capi_kwlist[] = {"iu","a1","l1","read_ascii","nx",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOO|O:_jrrle.read_jrrle1d",\
+        capi_kwlist,&iu_capi,&a1_capi,&l1_capi,&read_ascii_capi,&nx_capi))
+        return NULL;
+/*frompyobj*/
+  /* Processing variable iu */
+    f2py_success = int_from_pyobj(&iu,iu_capi,"_jrrle.read_jrrle1d() 1st argument (iu) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable a1 */
+  ;
+  capi_a1_intent |= F2PY_INTENT_INPLACE;
+  capi_a1_tmp = array_from_pyobj(NPY_FLOAT,a1_Dims,a1_Rank,capi_a1_intent,a1_capi);
+  if (capi_a1_tmp == NULL) {
+    PyObject *exc, *val, *tb;
+    PyErr_Fetch(&exc, &val, &tb);
+    PyErr_SetString(exc ? exc : _jrrle_error,"failed in converting 2nd argument `a1' of _jrrle.read_jrrle1d to C/Fortran array" );
+    npy_PyErr_ChainExceptionsCause(exc, val, tb);
+  } else {
+    a1 = (float *)(PyArray_DATA(capi_a1_tmp));
+
+  /* Processing variable l1 */
+  slen(l1) = -1;
+  f2py_success = string_from_pyobj(&l1,&slen(l1),"",l1_capi,"string_from_pyobj failed in converting 3rd argument `l1' of _jrrle.read_jrrle1d to C string");
+  if (f2py_success) {
+  /* Processing variable read_ascii */
+    read_ascii = (int)PyObject_IsTrue(read_ascii_capi);
+    f2py_success = 1;
+  if (f2py_success) {
+  /* Processing variable success */
+  /* Processing variable nx */
+  if (nx_capi == Py_None) nx = len(a1); else
+    f2py_success = int_from_pyobj(&nx,nx_capi,"_jrrle.read_jrrle1d() 1st keyword (nx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(a1)>=nx,"len(a1)>=nx","1st keyword nx","read_jrrle1d:nx=%d",nx) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&iu,a1,&nx,l1,&read_ascii,&success,slen(l1));
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("i",success);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(a1)>=nx)*/
+  } /*if (f2py_success) of nx*/
+  /* End of cleaning variable nx */
+  /* End of cleaning variable success */
+  } /*if (f2py_success) of read_ascii*/
+  /* End of cleaning variable read_ascii */
+    STRINGFREE(l1);
+  }  /*if (f2py_success) of l1*/
+  /* End of cleaning variable l1 */
+  if((PyObject *)capi_a1_tmp!=a1_capi) {
+    Py_XDECREF(capi_a1_tmp); }
+  }  /*if (capi_a1_tmp == NULL) ... else of a1*/
+  /* End of cleaning variable a1 */
+  } /*if (f2py_success) of iu*/
+  /* End of cleaning variable iu */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/**************************** end of read_jrrle1d ****************************/
+
+/******************************** read_jrrle2d ********************************/
+static char doc_f2py_rout__jrrle_read_jrrle2d[] = "\
+success = read_jrrle2d(iu,a1,l1,read_ascii,[nx])\n\nWrapper for ``read_jrrle2d``.\
+\n\nParameters\n----------\n"
+"iu : input int\n"
+"a1 :  rank-1 array('f') with bounds (nx)\n"
+"l1 :  string(len=-1)\n"
+"read_ascii : input int\n"
+"\nOther Parameters\n----------------\n"
+"nx : input int, optional\n    Default: len(a1)\n"
+"\nReturns\n-------\n"
+"success : int";
+/* extern void F_FUNC_US(read_jrrle2d,READ_JRRLE2D)(int*,float*,int*,string,int*,int*,size_t); */
+static PyObject *f2py_rout__jrrle_read_jrrle2d(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,int*,string,int*,int*,size_t)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+  int iu = 0;
+  PyObject *iu_capi = Py_None;
+  float *a1 = NULL;
+  npy_intp a1_Dims[1] = {-1};
+  const int a1_Rank = 1;
+  PyArrayObject *capi_a1_tmp = NULL;
+  int capi_a1_intent = 0;
+  PyObject *a1_capi = Py_None;
+  int nx = 0;
+  PyObject *nx_capi = Py_None;
+  string l1 = NULL;
+  int slen(l1);
+  PyObject *l1_capi = Py_None;
+  int read_ascii = 0;
+  PyObject *read_ascii_capi = Py_None;
+  int success = 0;
+    static char *capi_kwlist[] = {"iu","a1","l1","read_ascii","nx",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOO|O:_jrrle.read_jrrle2d",\
+        capi_kwlist,&iu_capi,&a1_capi,&l1_capi,&read_ascii_capi,&nx_capi))
+        return NULL;
+/*frompyobj*/
+  /* Processing variable iu */
+    f2py_success = int_from_pyobj(&iu,iu_capi,"_jrrle.read_jrrle2d() 1st argument (iu) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable a1 */
+  ;
+  capi_a1_intent |= F2PY_INTENT_INPLACE;
+  capi_a1_tmp = array_from_pyobj(NPY_FLOAT,a1_Dims,a1_Rank,capi_a1_intent,a1_capi);
+  if (capi_a1_tmp == NULL) {
+    PyObject *exc, *val, *tb;
+    PyErr_Fetch(&exc, &val, &tb);
+    PyErr_SetString(exc ? exc : _jrrle_error,"failed in converting 2nd argument `a1' of _jrrle.read_jrrle2d to C/Fortran array" );
+    npy_PyErr_ChainExceptionsCause(exc, val, tb);
+  } else {
+    a1 = (float *)(PyArray_DATA(capi_a1_tmp));
+
+  /* Processing variable l1 */
+  slen(l1) = -1;
+  f2py_success = string_from_pyobj(&l1,&slen(l1),"",l1_capi,"string_from_pyobj failed in converting 3rd argument `l1' of _jrrle.read_jrrle2d to C string");
+  if (f2py_success) {
+  /* Processing variable read_ascii */
+    read_ascii = (int)PyObject_IsTrue(read_ascii_capi);
+    f2py_success = 1;
+  if (f2py_success) {
+  /* Processing variable success */
+  /* Processing variable nx */
+  if (nx_capi == Py_None) nx = len(a1); else
+    f2py_success = int_from_pyobj(&nx,nx_capi,"_jrrle.read_jrrle2d() 1st keyword (nx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(a1)>=nx,"len(a1)>=nx","1st keyword nx","read_jrrle2d:nx=%d",nx) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&iu,a1,&nx,l1,&read_ascii,&success,slen(l1));
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("i",success);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(a1)>=nx)*/
+  } /*if (f2py_success) of nx*/
+  /* End of cleaning variable nx */
+  /* End of cleaning variable success */
+  } /*if (f2py_success) of read_ascii*/
+  /* End of cleaning variable read_ascii */
+    STRINGFREE(l1);
+  }  /*if (f2py_success) of l1*/
+  /* End of cleaning variable l1 */
+  if((PyObject *)capi_a1_tmp!=a1_capi) {
+    Py_XDECREF(capi_a1_tmp); }
+  }  /*if (capi_a1_tmp == NULL) ... else of a1*/
+  /* End of cleaning variable a1 */
+  } /*if (f2py_success) of iu*/
+  /* End of cleaning variable iu */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/**************************** end of read_jrrle2d ****************************/
+
+/******************************** read_jrrle3d ********************************/
+static char doc_f2py_rout__jrrle_read_jrrle3d[] = "\
+success = read_jrrle3d(iu,a1,l1,read_ascii,[nx])\n\nWrapper for ``read_jrrle3d``.\
+\n\nParameters\n----------\n"
+"iu : input int\n"
+"a1 :  rank-1 array('f') with bounds (nx)\n"
+"l1 :  string(len=-1)\n"
+"read_ascii : input int\n"
+"\nOther Parameters\n----------------\n"
+"nx : input int, optional\n    Default: len(a1)\n"
+"\nReturns\n-------\n"
+"success : int";
+/* extern void F_FUNC_US(read_jrrle3d,READ_JRRLE3D)(int*,float*,int*,string,int*,int*,size_t); */
+static PyObject *f2py_rout__jrrle_read_jrrle3d(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,int*,string,int*,int*,size_t)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+  int iu = 0;
+  PyObject *iu_capi = Py_None;
+  float *a1 = NULL;
+  npy_intp a1_Dims[1] = {-1};
+  const int a1_Rank = 1;
+  PyArrayObject *capi_a1_tmp = NULL;
+  int capi_a1_intent = 0;
+  PyObject *a1_capi = Py_None;
+  int nx = 0;
+  PyObject *nx_capi = Py_None;
+  string l1 = NULL;
+  int slen(l1);
+  PyObject *l1_capi = Py_None;
+  int read_ascii = 0;
+  PyObject *read_ascii_capi = Py_None;
+  int success = 0;
+    static char *capi_kwlist[] = {"iu","a1","l1","read_ascii","nx",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOO|O:_jrrle.read_jrrle3d",\
+        capi_kwlist,&iu_capi,&a1_capi,&l1_capi,&read_ascii_capi,&nx_capi))
+        return NULL;
+/*frompyobj*/
+  /* Processing variable iu */
+    f2py_success = int_from_pyobj(&iu,iu_capi,"_jrrle.read_jrrle3d() 1st argument (iu) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable a1 */
+  ;
+  capi_a1_intent |= F2PY_INTENT_INPLACE;
+  capi_a1_tmp = array_from_pyobj(NPY_FLOAT,a1_Dims,a1_Rank,capi_a1_intent,a1_capi);
+  if (capi_a1_tmp == NULL) {
+    PyObject *exc, *val, *tb;
+    PyErr_Fetch(&exc, &val, &tb);
+    PyErr_SetString(exc ? exc : _jrrle_error,"failed in converting 2nd argument `a1' of _jrrle.read_jrrle3d to C/Fortran array" );
+    npy_PyErr_ChainExceptionsCause(exc, val, tb);
+  } else {
+    a1 = (float *)(PyArray_DATA(capi_a1_tmp));
+
+  /* Processing variable l1 */
+  slen(l1) = -1;
+  f2py_success = string_from_pyobj(&l1,&slen(l1),"",l1_capi,"string_from_pyobj failed in converting 3rd argument `l1' of _jrrle.read_jrrle3d to C string");
+  if (f2py_success) {
+  /* Processing variable read_ascii */
+    read_ascii = (int)PyObject_IsTrue(read_ascii_capi);
+    f2py_success = 1;
+  if (f2py_success) {
+  /* Processing variable success */
+  /* Processing variable nx */
+  if (nx_capi == Py_None) nx = len(a1); else
+    f2py_success = int_from_pyobj(&nx,nx_capi,"_jrrle.read_jrrle3d() 1st keyword (nx) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(a1)>=nx,"len(a1)>=nx","1st keyword nx","read_jrrle3d:nx=%d",nx) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&iu,a1,&nx,l1,&read_ascii,&success,slen(l1));
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("i",success);
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(a1)>=nx)*/
+  } /*if (f2py_success) of nx*/
+  /* End of cleaning variable nx */
+  /* End of cleaning variable success */
+  } /*if (f2py_success) of read_ascii*/
+  /* End of cleaning variable read_ascii */
+    STRINGFREE(l1);
+  }  /*if (f2py_success) of l1*/
+  /* End of cleaning variable l1 */
+  if((PyObject *)capi_a1_tmp!=a1_capi) {
+    Py_XDECREF(capi_a1_tmp); }
+  }  /*if (capi_a1_tmp == NULL) ... else of a1*/
+  /* End of cleaning variable a1 */
+  } /*if (f2py_success) of iu*/
+  /* End of cleaning variable iu */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/**************************** end of read_jrrle3d ****************************/
+
+/******************************* write_jrrle1d *******************************/
+static char doc_f2py_rout__jrrle_write_jrrle1d[] = "\
+write_jrrle1d(iu,a1,nx,l1,l2,it)\n\nWrapper for ``write_jrrle1d``.\
+\n\nParameters\n----------\n"
+"iu : input int\n"
+"a1 : input rank-1 array('f') with bounds (*)\n"
+"nx : input int\n"
+"l1 : input string(len=80)\n"
+"l2 : input string(len=80)\n"
+"it : input int";
+/* extern void F_FUNC_US(write_jrrle1d,WRITE_JRRLE1D)(int*,float*,int*,string,string,int*,size_t,size_t); */
+static PyObject *f2py_rout__jrrle_write_jrrle1d(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,int*,string,string,int*,size_t,size_t)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+  int iu = 0;
+  PyObject *iu_capi = Py_None;
+  float *a1 = NULL;
+  npy_intp a1_Dims[1] = {-1};
+  const int a1_Rank = 1;
+  PyArrayObject *capi_a1_tmp = NULL;
+  int capi_a1_intent = 0;
+  PyObject *a1_capi = Py_None;
+  int nx = 0;
+  PyObject *nx_capi = Py_None;
+  string l1 = NULL;
+  int slen(l1);
+  PyObject *l1_capi = Py_None;
+  string l2 = NULL;
+  int slen(l2);
+  PyObject *l2_capi = Py_None;
+  int it = 0;
+  PyObject *it_capi = Py_None;
+    static char *capi_kwlist[] = {"iu","a1","nx","l1","l2","it",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOOO|:_jrrle.write_jrrle1d",\
+        capi_kwlist,&iu_capi,&a1_capi,&nx_capi,&l1_capi,&l2_capi,&it_capi))
+        return NULL;
+/*frompyobj*/
+  /* Processing variable iu */
+    f2py_success = int_from_pyobj(&iu,iu_capi,"_jrrle.write_jrrle1d() 1st argument (iu) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable l1 */
+  slen(l1) = 80;
+  f2py_success = string_from_pyobj(&l1,&slen(l1),"",l1_capi,"string_from_pyobj failed in converting 4th argument `l1' of _jrrle.write_jrrle1d to C string");
+  if (f2py_success) {
+  /* Processing variable l2 */
+  slen(l2) = 80;
+  f2py_success = string_from_pyobj(&l2,&slen(l2),"",l2_capi,"string_from_pyobj failed in converting 5th argument `l2' of _jrrle.write_jrrle1d to C string");
+  if (f2py_success) {
+  /* Processing variable a1 */
+  ;
+  capi_a1_intent |= F2PY_INTENT_IN;
+  capi_a1_tmp = array_from_pyobj(NPY_FLOAT,a1_Dims,a1_Rank,capi_a1_intent,a1_capi);
+  if (capi_a1_tmp == NULL) {
+    PyObject *exc, *val, *tb;
+    PyErr_Fetch(&exc, &val, &tb);
+    PyErr_SetString(exc ? exc : _jrrle_error,"failed in converting 2nd argument `a1' of _jrrle.write_jrrle1d to C/Fortran array" );
+    npy_PyErr_ChainExceptionsCause(exc, val, tb);
+  } else {
+    a1 = (float *)(PyArray_DATA(capi_a1_tmp));
+
+  /* Processing variable nx */
+    f2py_success = int_from_pyobj(&nx,nx_capi,"_jrrle.write_jrrle1d() 3rd argument (nx) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable it */
+    f2py_success = int_from_pyobj(&it,it_capi,"_jrrle.write_jrrle1d() 6th argument (it) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&iu,a1,&nx,l1,l2,&it,slen(l1),slen(l2));
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of it*/
+  /* End of cleaning variable it */
+  } /*if (f2py_success) of nx*/
+  /* End of cleaning variable nx */
+  if((PyObject *)capi_a1_tmp!=a1_capi) {
+    Py_XDECREF(capi_a1_tmp); }
+  }  /*if (capi_a1_tmp == NULL) ... else of a1*/
+  /* End of cleaning variable a1 */
+    STRINGFREE(l2);
+  }  /*if (f2py_success) of l2*/
+  /* End of cleaning variable l2 */
+    STRINGFREE(l1);
+  }  /*if (f2py_success) of l1*/
+  /* End of cleaning variable l1 */
+  } /*if (f2py_success) of iu*/
+  /* End of cleaning variable iu */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/**************************** end of write_jrrle1d ****************************/
+
+/******************************* write_jrrle2d *******************************/
+static char doc_f2py_rout__jrrle_write_jrrle2d[] = "\
+write_jrrle2d(iu,a1,nx,ny,l1,l2,it)\n\nWrapper for ``write_jrrle2d``.\
+\n\nParameters\n----------\n"
+"iu : input int\n"
+"a1 : input rank-1 array('f') with bounds (*)\n"
+"nx : input int\n"
+"ny : input int\n"
+"l1 : input string(len=80)\n"
+"l2 : input string(len=80)\n"
+"it : input int";
+/* extern void F_FUNC_US(write_jrrle2d,WRITE_JRRLE2D)(int*,float*,int*,int*,string,string,int*,size_t,size_t); */
+static PyObject *f2py_rout__jrrle_write_jrrle2d(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,int*,int*,string,string,int*,size_t,size_t)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+  int iu = 0;
+  PyObject *iu_capi = Py_None;
+  float *a1 = NULL;
+  npy_intp a1_Dims[1] = {-1};
+  const int a1_Rank = 1;
+  PyArrayObject *capi_a1_tmp = NULL;
+  int capi_a1_intent = 0;
+  PyObject *a1_capi = Py_None;
+  int nx = 0;
+  PyObject *nx_capi = Py_None;
+  int ny = 0;
+  PyObject *ny_capi = Py_None;
+  string l1 = NULL;
+  int slen(l1);
+  PyObject *l1_capi = Py_None;
+  string l2 = NULL;
+  int slen(l2);
+  PyObject *l2_capi = Py_None;
+  int it = 0;
+  PyObject *it_capi = Py_None;
+    static char *capi_kwlist[] = {"iu","a1","nx","ny","l1","l2","it",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOOOO|:_jrrle.write_jrrle2d",\
+        capi_kwlist,&iu_capi,&a1_capi,&nx_capi,&ny_capi,&l1_capi,&l2_capi,&it_capi))
+        return NULL;
+/*frompyobj*/
+  /* Processing variable iu */
+    f2py_success = int_from_pyobj(&iu,iu_capi,"_jrrle.write_jrrle2d() 1st argument (iu) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable l1 */
+  slen(l1) = 80;
+  f2py_success = string_from_pyobj(&l1,&slen(l1),"",l1_capi,"string_from_pyobj failed in converting 5th argument `l1' of _jrrle.write_jrrle2d to C string");
+  if (f2py_success) {
+  /* Processing variable l2 */
+  slen(l2) = 80;
+  f2py_success = string_from_pyobj(&l2,&slen(l2),"",l2_capi,"string_from_pyobj failed in converting 6th argument `l2' of _jrrle.write_jrrle2d to C string");
+  if (f2py_success) {
+  /* Processing variable a1 */
+  ;
+  capi_a1_intent |= F2PY_INTENT_IN;
+  capi_a1_tmp = array_from_pyobj(NPY_FLOAT,a1_Dims,a1_Rank,capi_a1_intent,a1_capi);
+  if (capi_a1_tmp == NULL) {
+    PyObject *exc, *val, *tb;
+    PyErr_Fetch(&exc, &val, &tb);
+    PyErr_SetString(exc ? exc : _jrrle_error,"failed in converting 2nd argument `a1' of _jrrle.write_jrrle2d to C/Fortran array" );
+    npy_PyErr_ChainExceptionsCause(exc, val, tb);
+  } else {
+    a1 = (float *)(PyArray_DATA(capi_a1_tmp));
+
+  /* Processing variable nx */
+    f2py_success = int_from_pyobj(&nx,nx_capi,"_jrrle.write_jrrle2d() 3rd argument (nx) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ny */
+    f2py_success = int_from_pyobj(&ny,ny_capi,"_jrrle.write_jrrle2d() 4th argument (ny) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable it */
+    f2py_success = int_from_pyobj(&it,it_capi,"_jrrle.write_jrrle2d() 7th argument (it) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&iu,a1,&nx,&ny,l1,l2,&it,slen(l1),slen(l2));
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of it*/
+  /* End of cleaning variable it */
+  } /*if (f2py_success) of ny*/
+  /* End of cleaning variable ny */
+  } /*if (f2py_success) of nx*/
+  /* End of cleaning variable nx */
+  if((PyObject *)capi_a1_tmp!=a1_capi) {
+    Py_XDECREF(capi_a1_tmp); }
+  }  /*if (capi_a1_tmp == NULL) ... else of a1*/
+  /* End of cleaning variable a1 */
+    STRINGFREE(l2);
+  }  /*if (f2py_success) of l2*/
+  /* End of cleaning variable l2 */
+    STRINGFREE(l1);
+  }  /*if (f2py_success) of l1*/
+  /* End of cleaning variable l1 */
+  } /*if (f2py_success) of iu*/
+  /* End of cleaning variable iu */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/**************************** end of write_jrrle2d ****************************/
+
+/******************************* write_jrrle3d *******************************/
+static char doc_f2py_rout__jrrle_write_jrrle3d[] = "\
+write_jrrle3d(iu,a1,nx,ny,nz,l1,l2,it)\n\nWrapper for ``write_jrrle3d``.\
+\n\nParameters\n----------\n"
+"iu : input int\n"
+"a1 : input rank-1 array('f') with bounds (*)\n"
+"nx : input int\n"
+"ny : input int\n"
+"nz : input int\n"
+"l1 : input string(len=80)\n"
+"l2 : input string(len=80)\n"
+"it : input int";
+/* extern void F_FUNC_US(write_jrrle3d,WRITE_JRRLE3D)(int*,float*,int*,int*,int*,string,string,int*,size_t,size_t); */
+static PyObject *f2py_rout__jrrle_write_jrrle3d(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,int*,int*,int*,string,string,int*,size_t,size_t)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+  int iu = 0;
+  PyObject *iu_capi = Py_None;
+  float *a1 = NULL;
+  npy_intp a1_Dims[1] = {-1};
+  const int a1_Rank = 1;
+  PyArrayObject *capi_a1_tmp = NULL;
+  int capi_a1_intent = 0;
+  PyObject *a1_capi = Py_None;
+  int nx = 0;
+  PyObject *nx_capi = Py_None;
+  int ny = 0;
+  PyObject *ny_capi = Py_None;
+  int nz = 0;
+  PyObject *nz_capi = Py_None;
+  string l1 = NULL;
+  int slen(l1);
+  PyObject *l1_capi = Py_None;
+  string l2 = NULL;
+  int slen(l2);
+  PyObject *l2_capi = Py_None;
+  int it = 0;
+  PyObject *it_capi = Py_None;
+    static char *capi_kwlist[] = {"iu","a1","nx","ny","nz","l1","l2","it",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOOOOO|:_jrrle.write_jrrle3d",\
+        capi_kwlist,&iu_capi,&a1_capi,&nx_capi,&ny_capi,&nz_capi,&l1_capi,&l2_capi,&it_capi))
+        return NULL;
+/*frompyobj*/
+  /* Processing variable iu */
+    f2py_success = int_from_pyobj(&iu,iu_capi,"_jrrle.write_jrrle3d() 1st argument (iu) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable l1 */
+  slen(l1) = 80;
+  f2py_success = string_from_pyobj(&l1,&slen(l1),"",l1_capi,"string_from_pyobj failed in converting 6th argument `l1' of _jrrle.write_jrrle3d to C string");
+  if (f2py_success) {
+  /* Processing variable l2 */
+  slen(l2) = 80;
+  f2py_success = string_from_pyobj(&l2,&slen(l2),"",l2_capi,"string_from_pyobj failed in converting 7th argument `l2' of _jrrle.write_jrrle3d to C string");
+  if (f2py_success) {
+  /* Processing variable a1 */
+  ;
+  capi_a1_intent |= F2PY_INTENT_IN;
+  capi_a1_tmp = array_from_pyobj(NPY_FLOAT,a1_Dims,a1_Rank,capi_a1_intent,a1_capi);
+  if (capi_a1_tmp == NULL) {
+    PyObject *exc, *val, *tb;
+    PyErr_Fetch(&exc, &val, &tb);
+    PyErr_SetString(exc ? exc : _jrrle_error,"failed in converting 2nd argument `a1' of _jrrle.write_jrrle3d to C/Fortran array" );
+    npy_PyErr_ChainExceptionsCause(exc, val, tb);
+  } else {
+    a1 = (float *)(PyArray_DATA(capi_a1_tmp));
+
+  /* Processing variable nx */
+    f2py_success = int_from_pyobj(&nx,nx_capi,"_jrrle.write_jrrle3d() 3rd argument (nx) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable ny */
+    f2py_success = int_from_pyobj(&ny,ny_capi,"_jrrle.write_jrrle3d() 4th argument (ny) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable nz */
+    f2py_success = int_from_pyobj(&nz,nz_capi,"_jrrle.write_jrrle3d() 5th argument (nz) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable it */
+    f2py_success = int_from_pyobj(&it,it_capi,"_jrrle.write_jrrle3d() 8th argument (it) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&iu,a1,&nx,&ny,&nz,l1,l2,&it,slen(l1),slen(l2));
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of it*/
+  /* End of cleaning variable it */
+  } /*if (f2py_success) of nz*/
+  /* End of cleaning variable nz */
+  } /*if (f2py_success) of ny*/
+  /* End of cleaning variable ny */
+  } /*if (f2py_success) of nx*/
+  /* End of cleaning variable nx */
+  if((PyObject *)capi_a1_tmp!=a1_capi) {
+    Py_XDECREF(capi_a1_tmp); }
+  }  /*if (capi_a1_tmp == NULL) ... else of a1*/
+  /* End of cleaning variable a1 */
+    STRINGFREE(l2);
+  }  /*if (f2py_success) of l2*/
+  /* End of cleaning variable l2 */
+    STRINGFREE(l1);
+  }  /*if (f2py_success) of l1*/
+  /* End of cleaning variable l1 */
+  } /*if (f2py_success) of iu*/
+  /* End of cleaning variable iu */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/**************************** end of write_jrrle3d ****************************/
+
+/************************************ end0 ************************************/
+static char doc_f2py_rout__jrrle_end0[] = "\
+end0(r,m)\n\nWrapper for ``end0``.\
+\n\nParameters\n----------\n"
+"r : input string(len=80)\n"
+"m : input int";
+/* extern void F_FUNC(end0,END0)(string,int*,size_t); */
+static PyObject *f2py_rout__jrrle_end0(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(string,int*,size_t)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+  string r = NULL;
+  int slen(r);
+  PyObject *r_capi = Py_None;
+  int m = 0;
+  PyObject *m_capi = Py_None;
+    static char *capi_kwlist[] = {"r","m",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OO|:_jrrle.end0",\
+        capi_kwlist,&r_capi,&m_capi))
+        return NULL;
+/*frompyobj*/
+  /* Processing variable m */
+    f2py_success = int_from_pyobj(&m,m_capi,"_jrrle.end0() 2nd argument (m) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable r */
+  slen(r) = 80;
+  f2py_success = string_from_pyobj(&r,&slen(r),"",r_capi,"string_from_pyobj failed in converting 1st argument `r' of _jrrle.end0 to C string");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(r,&m,slen(r));
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+    STRINGFREE(r);
+  }  /*if (f2py_success) of r*/
+  /* End of cleaning variable r */
+  } /*if (f2py_success) of m*/
+  /* End of cleaning variable m */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/******************************** end of end0 ********************************/
+
+/************************************ rdn2 ************************************/
+static char doc_f2py_rout__jrrle_rdn2[] = "\
+rdn2(fileno,a,n,cid,it,rid)\n\nWrapper for ``rdn2``.\
+\n\nParameters\n----------\n"
+"fileno : input int\n"
+"a : input rank-1 array('f') with bounds (*)\n"
+"n : input int\n"
+"cid : input string(len=8)\n"
+"it : input int\n"
+"rid : input float";
+/* extern void F_FUNC(rdn2,RDN2)(int*,float*,int*,string,int*,float*,size_t); */
+static PyObject *f2py_rout__jrrle_rdn2(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,int*,string,int*,float*,size_t)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+  int fileno = 0;
+  PyObject *fileno_capi = Py_None;
+  float *a = NULL;
+  npy_intp a_Dims[1] = {-1};
+  const int a_Rank = 1;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  PyObject *a_capi = Py_None;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  string cid = NULL;
+  int slen(cid);
+  PyObject *cid_capi = Py_None;
+  int it = 0;
+  PyObject *it_capi = Py_None;
+  float rid = 0;
+  PyObject *rid_capi = Py_None;
+    static char *capi_kwlist[] = {"fileno","a","n","cid","it","rid",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOOO|:_jrrle.rdn2",\
+        capi_kwlist,&fileno_capi,&a_capi,&n_capi,&cid_capi,&it_capi,&rid_capi))
+        return NULL;
+/*frompyobj*/
+  /* Processing variable a */
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    PyObject *exc, *val, *tb;
+    PyErr_Fetch(&exc, &val, &tb);
+    PyErr_SetString(exc ? exc : _jrrle_error,"failed in converting 2nd argument `a' of _jrrle.rdn2 to C/Fortran array" );
+    npy_PyErr_ChainExceptionsCause(exc, val, tb);
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable n */
+    f2py_success = int_from_pyobj(&n,n_capi,"_jrrle.rdn2() 3rd argument (n) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable cid */
+  slen(cid) = 8;
+  f2py_success = string_from_pyobj(&cid,&slen(cid),"",cid_capi,"string_from_pyobj failed in converting 4th argument `cid' of _jrrle.rdn2 to C string");
+  if (f2py_success) {
+  /* Processing variable fileno */
+    f2py_success = int_from_pyobj(&fileno,fileno_capi,"_jrrle.rdn2() 1st argument (fileno) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable it */
+    f2py_success = int_from_pyobj(&it,it_capi,"_jrrle.rdn2() 5th argument (it) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable rid */
+    f2py_success = float_from_pyobj(&rid,rid_capi,"_jrrle.rdn2() 6th argument (rid) can't be converted to float");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&fileno,a,&n,cid,&it,&rid,slen(cid));
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of rid*/
+  /* End of cleaning variable rid */
+  } /*if (f2py_success) of it*/
+  /* End of cleaning variable it */
+  } /*if (f2py_success) of fileno*/
+  /* End of cleaning variable fileno */
+    STRINGFREE(cid);
+  }  /*if (f2py_success) of cid*/
+  /* End of cleaning variable cid */
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/******************************** end of rdn2 ********************************/
+
+/*********************************** wrndec ***********************************/
+static char doc_f2py_rout__jrrle_wrndec[] = "\
+wrndec(fileno,expandeddatout,n)\n\nWrapper for ``wrndec``.\
+\n\nParameters\n----------\n"
+"fileno : input int\n"
+"expandeddatout : input rank-1 array('i') with bounds (64)\n"
+"n : input int";
+/* extern void F_FUNC(wrndec,WRNDEC)(int*,int*,int*); */
+static PyObject *f2py_rout__jrrle_wrndec(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+  int fileno = 0;
+  PyObject *fileno_capi = Py_None;
+  int *expandeddatout = NULL;
+  npy_intp expandeddatout_Dims[1] = {-1};
+  const int expandeddatout_Rank = 1;
+  PyArrayObject *capi_expandeddatout_tmp = NULL;
+  int capi_expandeddatout_intent = 0;
+  PyObject *expandeddatout_capi = Py_None;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+    static char *capi_kwlist[] = {"fileno","expandeddatout","n",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOO|:_jrrle.wrndec",\
+        capi_kwlist,&fileno_capi,&expandeddatout_capi,&n_capi))
+        return NULL;
+/*frompyobj*/
+  /* Processing variable fileno */
+    f2py_success = int_from_pyobj(&fileno,fileno_capi,"_jrrle.wrndec() 1st argument (fileno) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+    f2py_success = int_from_pyobj(&n,n_capi,"_jrrle.wrndec() 3rd argument (n) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable expandeddatout */
+  expandeddatout_Dims[0]=64;
+  capi_expandeddatout_intent |= F2PY_INTENT_IN;
+  capi_expandeddatout_tmp = array_from_pyobj(NPY_INT,expandeddatout_Dims,expandeddatout_Rank,capi_expandeddatout_intent,expandeddatout_capi);
+  if (capi_expandeddatout_tmp == NULL) {
+    PyObject *exc, *val, *tb;
+    PyErr_Fetch(&exc, &val, &tb);
+    PyErr_SetString(exc ? exc : _jrrle_error,"failed in converting 2nd argument `expandeddatout' of _jrrle.wrndec to C/Fortran array" );
+    npy_PyErr_ChainExceptionsCause(exc, val, tb);
+  } else {
+    expandeddatout = (int *)(PyArray_DATA(capi_expandeddatout_tmp));
+
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&fileno,expandeddatout,&n);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  if((PyObject *)capi_expandeddatout_tmp!=expandeddatout_capi) {
+    Py_XDECREF(capi_expandeddatout_tmp); }
+  }  /*if (capi_expandeddatout_tmp == NULL) ... else of expandeddatout*/
+  /* End of cleaning variable expandeddatout */
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of fileno*/
+  /* End of cleaning variable fileno */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/******************************* end of wrndec *******************************/
+
+/************************************ wrn2 ************************************/
+static char doc_f2py_rout__jrrle_wrn2[] = "\
+wrn2(iu,a,cid,it,rid,[n])\n\nWrapper for ``wrn2``.\
+\n\nParameters\n----------\n"
+"iu : input int\n"
+"a : input rank-1 array('f') with bounds (n)\n"
+"cid : input string(len=8)\n"
+"it : input int\n"
+"rid : input float\n"
+"\nOther Parameters\n----------------\n"
+"n : input int, optional\n    Default: len(a)";
+/* extern void F_FUNC(wrn2,WRN2)(int*,float*,int*,string,int*,float*,size_t); */
+static PyObject *f2py_rout__jrrle_wrn2(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,float*,int*,string,int*,float*,size_t)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+  int iu = 0;
+  PyObject *iu_capi = Py_None;
+  float *a = NULL;
+  npy_intp a_Dims[1] = {-1};
+  const int a_Rank = 1;
+  PyArrayObject *capi_a_tmp = NULL;
+  int capi_a_intent = 0;
+  PyObject *a_capi = Py_None;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+  string cid = NULL;
+  int slen(cid);
+  PyObject *cid_capi = Py_None;
+  int it = 0;
+  PyObject *it_capi = Py_None;
+  float rid = 0;
+  PyObject *rid_capi = Py_None;
+    static char *capi_kwlist[] = {"iu","a","cid","it","rid","n",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOOOO|O:_jrrle.wrn2",\
+        capi_kwlist,&iu_capi,&a_capi,&cid_capi,&it_capi,&rid_capi,&n_capi))
+        return NULL;
+/*frompyobj*/
+  /* Processing variable it */
+    f2py_success = int_from_pyobj(&it,it_capi,"_jrrle.wrn2() 4th argument (it) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable iu */
+    f2py_success = int_from_pyobj(&iu,iu_capi,"_jrrle.wrn2() 1st argument (iu) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable a */
+  ;
+  capi_a_intent |= F2PY_INTENT_IN;
+  capi_a_tmp = array_from_pyobj(NPY_FLOAT,a_Dims,a_Rank,capi_a_intent,a_capi);
+  if (capi_a_tmp == NULL) {
+    PyObject *exc, *val, *tb;
+    PyErr_Fetch(&exc, &val, &tb);
+    PyErr_SetString(exc ? exc : _jrrle_error,"failed in converting 2nd argument `a' of _jrrle.wrn2 to C/Fortran array" );
+    npy_PyErr_ChainExceptionsCause(exc, val, tb);
+  } else {
+    a = (float *)(PyArray_DATA(capi_a_tmp));
+
+  /* Processing variable rid */
+    f2py_success = float_from_pyobj(&rid,rid_capi,"_jrrle.wrn2() 5th argument (rid) can't be converted to float");
+  if (f2py_success) {
+  /* Processing variable cid */
+  slen(cid) = 8;
+  f2py_success = string_from_pyobj(&cid,&slen(cid),"",cid_capi,"string_from_pyobj failed in converting 3rd argument `cid' of _jrrle.wrn2 to C string");
+  if (f2py_success) {
+  /* Processing variable n */
+  if (n_capi == Py_None) n = len(a); else
+    f2py_success = int_from_pyobj(&n,n_capi,"_jrrle.wrn2() 1st keyword (n) can't be converted to int");
+  if (f2py_success) {
+  CHECKSCALAR(len(a)>=n,"len(a)>=n","1st keyword n","wrn2:n=%d",n) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&iu,a,&n,cid,&it,&rid,slen(cid));
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*CHECKSCALAR(len(a)>=n)*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+    STRINGFREE(cid);
+  }  /*if (f2py_success) of cid*/
+  /* End of cleaning variable cid */
+  } /*if (f2py_success) of rid*/
+  /* End of cleaning variable rid */
+  if((PyObject *)capi_a_tmp!=a_capi) {
+    Py_XDECREF(capi_a_tmp); }
+  }  /*if (capi_a_tmp == NULL) ... else of a*/
+  /* End of cleaning variable a */
+  } /*if (f2py_success) of iu*/
+  /* End of cleaning variable iu */
+  } /*if (f2py_success) of it*/
+  /* End of cleaning variable it */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/******************************** end of wrn2 ********************************/
+
+/*********************************** wrnenc ***********************************/
+static char doc_f2py_rout__jrrle_wrnenc[] = "\
+wrnenc(iu,i1,n)\n\nWrapper for ``wrnenc``.\
+\n\nParameters\n----------\n"
+"iu : input int\n"
+"i1 : input rank-1 array('i') with bounds (64)\n"
+"n : input int";
+/* extern void F_FUNC(wrnenc,WRNENC)(int*,int*,int*); */
+static PyObject *f2py_rout__jrrle_wrnenc(const PyObject *capi_self,
+                           PyObject *capi_args,
+                           PyObject *capi_keywds,
+                           void (*f2py_func)(int*,int*,int*)) {
+    PyObject * volatile capi_buildvalue = NULL;
+    volatile int f2py_success = 1;
+/*decl*/
+
+  int iu = 0;
+  PyObject *iu_capi = Py_None;
+  int *i1 = NULL;
+  npy_intp i1_Dims[1] = {-1};
+  const int i1_Rank = 1;
+  PyArrayObject *capi_i1_tmp = NULL;
+  int capi_i1_intent = 0;
+  PyObject *i1_capi = Py_None;
+  int n = 0;
+  PyObject *n_capi = Py_None;
+    static char *capi_kwlist[] = {"iu","i1","n",NULL};
+
+/*routdebugenter*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_clock();
+#endif
+    if (!PyArg_ParseTupleAndKeywords(capi_args,capi_keywds,\
+        "OOO|:_jrrle.wrnenc",\
+        capi_kwlist,&iu_capi,&i1_capi,&n_capi))
+        return NULL;
+/*frompyobj*/
+  /* Processing variable i1 */
+  i1_Dims[0]=64;
+  capi_i1_intent |= F2PY_INTENT_IN;
+  capi_i1_tmp = array_from_pyobj(NPY_INT,i1_Dims,i1_Rank,capi_i1_intent,i1_capi);
+  if (capi_i1_tmp == NULL) {
+    PyObject *exc, *val, *tb;
+    PyErr_Fetch(&exc, &val, &tb);
+    PyErr_SetString(exc ? exc : _jrrle_error,"failed in converting 2nd argument `i1' of _jrrle.wrnenc to C/Fortran array" );
+    npy_PyErr_ChainExceptionsCause(exc, val, tb);
+  } else {
+    i1 = (int *)(PyArray_DATA(capi_i1_tmp));
+
+  /* Processing variable iu */
+    f2py_success = int_from_pyobj(&iu,iu_capi,"_jrrle.wrnenc() 1st argument (iu) can't be converted to int");
+  if (f2py_success) {
+  /* Processing variable n */
+    f2py_success = int_from_pyobj(&n,n_capi,"_jrrle.wrnenc() 3rd argument (n) can't be converted to int");
+  if (f2py_success) {
+/*end of frompyobj*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_start_call_clock();
+#endif
+/*callfortranroutine*/
+        (*f2py_func)(&iu,i1,&n);
+if (PyErr_Occurred())
+  f2py_success = 0;
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_call_clock();
+#endif
+/*end of callfortranroutine*/
+        if (f2py_success) {
+/*pyobjfrom*/
+/*end of pyobjfrom*/
+        CFUNCSMESS("Building return value.\n");
+        capi_buildvalue = Py_BuildValue("");
+/*closepyobjfrom*/
+/*end of closepyobjfrom*/
+        } /*if (f2py_success) after callfortranroutine*/
+/*cleanupfrompyobj*/
+  } /*if (f2py_success) of n*/
+  /* End of cleaning variable n */
+  } /*if (f2py_success) of iu*/
+  /* End of cleaning variable iu */
+  if((PyObject *)capi_i1_tmp!=i1_capi) {
+    Py_XDECREF(capi_i1_tmp); }
+  }  /*if (capi_i1_tmp == NULL) ... else of i1*/
+  /* End of cleaning variable i1 */
+/*end of cleanupfrompyobj*/
+    if (capi_buildvalue == NULL) {
+/*routdebugfailure*/
+    } else {
+/*routdebugleave*/
+    }
+    CFUNCSMESS("Freeing memory.\n");
+/*freemem*/
+#ifdef F2PY_REPORT_ATEXIT
+f2py_stop_clock();
+#endif
+    return capi_buildvalue;
+}
+/******************************* end of wrnenc *******************************/
+/*eof body*/
+
+/******************* See f2py2e/f90mod_rules.py: buildhooks *******************/
+/*need_f90modhooks*/
+
+/************** See f2py2e/rules.py: module_rules['modulebody'] **************/
+
+/******************* See f2py2e/common_rules.py: buildhooks *******************/
+
+/*need_commonhooks*/
+
+/**************************** See f2py2e/rules.py ****************************/
+
+static FortranDataDef f2py_routine_defs[] = {
+  {"inquire_next",-1,{{-1}},0,(char *)F_FUNC_US(inquire_next,INQUIRE_NEXT),(f2py_init_func)f2py_rout__jrrle_inquire_next,doc_f2py_rout__jrrle_inquire_next},
+  {"read_jrrle1d",-1,{{-1}},0,(char *)F_FUNC_US(read_jrrle1d,READ_JRRLE1D),(f2py_init_func)f2py_rout__jrrle_read_jrrle1d,doc_f2py_rout__jrrle_read_jrrle1d},
+  {"read_jrrle2d",-1,{{-1}},0,(char *)F_FUNC_US(read_jrrle2d,READ_JRRLE2D),(f2py_init_func)f2py_rout__jrrle_read_jrrle2d,doc_f2py_rout__jrrle_read_jrrle2d},
+  {"read_jrrle3d",-1,{{-1}},0,(char *)F_FUNC_US(read_jrrle3d,READ_JRRLE3D),(f2py_init_func)f2py_rout__jrrle_read_jrrle3d,doc_f2py_rout__jrrle_read_jrrle3d},
+  {"write_jrrle1d",-1,{{-1}},0,(char *)F_FUNC_US(write_jrrle1d,WRITE_JRRLE1D),(f2py_init_func)f2py_rout__jrrle_write_jrrle1d,doc_f2py_rout__jrrle_write_jrrle1d},
+  {"write_jrrle2d",-1,{{-1}},0,(char *)F_FUNC_US(write_jrrle2d,WRITE_JRRLE2D),(f2py_init_func)f2py_rout__jrrle_write_jrrle2d,doc_f2py_rout__jrrle_write_jrrle2d},
+  {"write_jrrle3d",-1,{{-1}},0,(char *)F_FUNC_US(write_jrrle3d,WRITE_JRRLE3D),(f2py_init_func)f2py_rout__jrrle_write_jrrle3d,doc_f2py_rout__jrrle_write_jrrle3d},
+  {"end0",-1,{{-1}},0,(char *)F_FUNC(end0,END0),(f2py_init_func)f2py_rout__jrrle_end0,doc_f2py_rout__jrrle_end0},
+  {"rdn2",-1,{{-1}},0,(char *)F_FUNC(rdn2,RDN2),(f2py_init_func)f2py_rout__jrrle_rdn2,doc_f2py_rout__jrrle_rdn2},
+  {"wrndec",-1,{{-1}},0,(char *)F_FUNC(wrndec,WRNDEC),(f2py_init_func)f2py_rout__jrrle_wrndec,doc_f2py_rout__jrrle_wrndec},
+  {"wrn2",-1,{{-1}},0,(char *)F_FUNC(wrn2,WRN2),(f2py_init_func)f2py_rout__jrrle_wrn2,doc_f2py_rout__jrrle_wrn2},
+  {"wrnenc",-1,{{-1}},0,(char *)F_FUNC(wrnenc,WRNENC),(f2py_init_func)f2py_rout__jrrle_wrnenc,doc_f2py_rout__jrrle_wrnenc},
+
+/*eof routine_defs*/
+  {NULL}
+};
+
+static PyMethodDef f2py_module_methods[] = {
+
+  {NULL,NULL}
+};
+
+static struct PyModuleDef moduledef = {
+  PyModuleDef_HEAD_INIT,
+  "_jrrle",
+  NULL,
+  -1,
+  f2py_module_methods,
+  NULL,
+  NULL,
+  NULL,
+  NULL
+};
+
+PyMODINIT_FUNC PyInit__jrrle(void) {
+  int i;
+  PyObject *m,*d, *s, *tmp;
+  m = _jrrle_module = PyModule_Create(&moduledef);
+  Py_SET_TYPE(&PyFortran_Type, &PyType_Type);
+  import_array();
+  if (PyErr_Occurred())
+    {PyErr_SetString(PyExc_ImportError, "can't initialize module _jrrle (failed to import numpy)"); return m;}
+  d = PyModule_GetDict(m);
+  s = PyUnicode_FromString("1.21.6");
+  PyDict_SetItemString(d, "__version__", s);
+  Py_DECREF(s);
+  s = PyUnicode_FromString(
+    "This module '_jrrle' is auto-generated with f2py (version:1.21.6).\nFunctions:\n"
+"  found_field,ndim,nx,ny,nz,it = inquire_next(iu,varname,tstring)\n"
+"  success = read_jrrle1d(iu,a1,l1,read_ascii,nx=len(a1))\n"
+"  success = read_jrrle2d(iu,a1,l1,read_ascii,nx=len(a1))\n"
+"  success = read_jrrle3d(iu,a1,l1,read_ascii,nx=len(a1))\n"
+"  write_jrrle1d(iu,a1,nx,l1,l2,it)\n"
+"  write_jrrle2d(iu,a1,nx,ny,l1,l2,it)\n"
+"  write_jrrle3d(iu,a1,nx,ny,nz,l1,l2,it)\n"
+"  end0(r,m)\n"
+"  rdn2(fileno,a,n,cid,it,rid)\n"
+"  wrndec(fileno,expandeddatout,n)\n"
+"  wrn2(iu,a,cid,it,rid,n=len(a))\n"
+"  wrnenc(iu,i1,n)\n"
+".");
+  PyDict_SetItemString(d, "__doc__", s);
+  Py_DECREF(s);
+  s = PyUnicode_FromString("1.21.6");
+  PyDict_SetItemString(d, "__f2py_numpy_version__", s);
+  Py_DECREF(s);
+  _jrrle_error = PyErr_NewException ("_jrrle.error", NULL, NULL);
+  /*
+   * Store the error object inside the dict, so that it could get deallocated.
+   * (in practice, this is a module, so it likely will not and cannot.)
+   */
+  PyDict_SetItemString(d, "__jrrle_error", _jrrle_error);
+  Py_DECREF(_jrrle_error);
+  for(i=0;f2py_routine_defs[i].name!=NULL;i++) {
+    tmp = PyFortranObject_NewAsAttr(&f2py_routine_defs[i]);
+    PyDict_SetItemString(d, f2py_routine_defs[i].name, tmp);
+    Py_DECREF(tmp);
+  }
+
+
+
+
+
+
+
+
+
+
+
+
+/*eof initf2pywraphooks*/
+/*eof initf90modhooks*/
+
+/*eof initcommonhooks*/
+
+
+#ifdef F2PY_REPORT_ATEXIT
+  if (! PyErr_Occurred())
+    on_exit(f2py_report_on_exit,(void*)"_jrrle");
+#endif
+  return m;
+}
+#ifdef __cplusplus
+}
+#endif
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+"""Traces needed for an adaptive vs full resolution topology map
+
+Maps the topology of a dipole + southward IMF on a 1024x1024 plane
+through the dipole axis, both by tracing every seed and with
+:py:func:`viscid.calc_topology_adaptive`.
+"""
+
+from __future__ import division, print_function
+import sys
+
+import numpy as np
+import viscid
+
+
+N = 1024
+
+
+def _main():
+    B = viscid.make_dipole(n=(128, 128, 128), l=(-20, -20, -20),
+                           h=(20, 20, 20))
+    B['z'] -= 0.002
+    seeds = viscid.Plane((0.0, 0.0, 0.0), (0, 1, 0), (1, 0, 0), 30.0, 30.0,
+                         nl=N, nm=N)
+    trace_opts = dict(ibound=2.0)
+
+    tstats = dict()
+    _, topo = viscid.timeit(viscid.calc_streamlines, B, seeds,
+                            output=viscid.OUTPUT_TOPOLOGY, timeit_quiet=True,
+                            timeit_stats=tstats, **trace_opts)
+    print("{0:>10s}: {1:8d} traces {2:.3g} s".format("full", topo.size,
+                                                      tstats['min']))
+
+    for coarse_step in (8, 16, 32, 64):
+        tstats = dict()
+        atopo, nr_traces = viscid.timeit(viscid.calc_topology_adaptive, B,
+                                         seeds, coarse_step=coarse_step,
+                                         trace_opts=trace_opts,
+                                         return_nr_traces=True,
+                                         timeit_quiet=True,
+                                         timeit_stats=tstats)
+        nr_diff = np.sum(atopo.data != topo.data)
+        print("{0:>10s}: {1:8d} traces {2:.3g} s, {3:.1f}x fewer traces, "
+              "{4} seeds differ".format("step " + str(coarse_step), nr_traces,
+                                        tstats['min'], topo.size / nr_traces,
+                                        nr_diff))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(_main())
+
+##
+## EOF
+##
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""Thread scaling of calc_streamlines on AMR vs single patch fields
+
+Builds a dipole field split into patches, then traces the same seeds
+on 1..N threads for both the AMR field and the equivalent single patch
+field.
+"""
+
+from __future__ import division, print_function
+import multiprocessing
+import sys
+
+import numpy as np
+import viscid
+from viscid.amr_grid import AMRGrid
+from viscid.grid import Grid
+
+
+NPATCH = (2, 2, 2)
+N = 48  # cells per patch per axis
+XL, XH = -20.0, 20.0
+
+
+def make_fields():
+    edges = np.linspace(XL, XH, NPATCH[0] + 1)
+    grids = []
+    for i in range(NPATCH[0]):
+        for j in range(NPATCH[1]):
+            for k in range(NPATCH[2]):
+                x = np.linspace(edges[i], edges[i + 1], N + 1)
+                y = np.linspace(edges[j], edges[j + 1], N + 1)
+                z = np.linspace(edges[k], edges[k + 1], N + 1)
+                fld = viscid.empty([x, y, z], nr_comps=3, name='b',
+                                   center='node')
+                viscid.fill_dipole(fld)
+                grid = Grid()
+                grid.set_crds(fld.crds)
+                grid.add_field(fld)
+                grids.append(grid)
+    amr_b = AMRGrid(grids)['b']
+
+    x = np.linspace(XL, XH, NPATCH[0] * N + 1)
+    b = viscid.empty([x, x, x], nr_comps=3, name='b', center='node')
+    viscid.fill_dipole(b)
+    return amr_b, b
+
+def _main():
+    max_threads = multiprocessing.cpu_count()
+    if len(sys.argv) > 1:
+        max_threads = int(sys.argv[1])
+
+    amr_b, b = make_fields()
+    seeds = viscid.Sphere((0.0, 0.0, 0.0), 5.0, ntheta=64, nphi=64)
+    kwargs = dict(ibound=1.0, output=viscid.OUTPUT_TOPOLOGY, chunk_factor=4)
+
+    print("{0:>8s} {1:>12s} {2:>12s}".format("threads", "single (s)",
+                                             "amr (s)"))
+    t1 = {}
+    nr_threads = 1
+    while nr_threads <= max_threads:
+        times = []
+        for fld in (b, amr_b):
+            tstats = dict()
+            viscid.timeit(viscid.calc_streamlines, fld, seeds,
+                          nr_procs=nr_threads, threads=True, timeit_repeat=2,
+                          timeit_quiet=True, timeit_stats=tstats, **kwargs)
+            times.append(tstats['min'])
+        if nr_threads == 1:
+            t1 = times
+        print("{0:>8d} {1:>12.3g} {2:>12.3g}   speedup: {3:.2f}x / {4:.2f}x"
+              "".format(nr_threads, times[0], times[1], t1[0] / times[0],
+                        t1[1] / times[1]))
+        nr_threads *= 2
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(_main())
+
+##
+## EOF
+##
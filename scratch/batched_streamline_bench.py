@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+"""Scalar vs batched streamline engines on uniform / nonuniform grids
+
+Both engines must give the same lines; this prints the time each takes
+and the time per integration step for a few integrators.
+"""
+
+from __future__ import division, print_function
+import sys
+
+import numpy as np
+import viscid
+from viscid.cython import streamline
+
+
+N = 128
+METHODS = ['euler1', 'rk4', 'rk45']
+BATCH_SIZES = [16, 64, 256]
+
+
+def make_flds():
+    x = np.linspace(-20.0, 20.0, N)
+    uniform = viscid.empty([x, x, x], nr_comps=3, name='B', center='node')
+    viscid.fill_dipole(uniform, m=[0.2, 0.3, -0.9])
+
+    x = 20.0 * np.sinh(np.linspace(-2.5, 2.5, N)) / np.sinh(2.5)
+    nonuniform = viscid.empty([x, x, x], nr_comps=3, name='B', center='node')
+    viscid.fill_dipole(nonuniform, m=[0.2, 0.3, -0.9])
+    return [('uniform', uniform), ('nonuniform', nonuniform)]
+
+def _main():
+    seeds = viscid.Sphere((0.0, 0.0, 0.0), 4.0, ntheta=64, nphi=64)
+    print("{0:>10s} {1:>7s} {2:>10s} {3:>10s} {4:>9s}"
+          "".format("grid", "method", "engine", "time (s)", "speedup"))
+    for grid_name, B in make_flds():
+        for method in METHODS:
+            kwargs = dict(ibound=1.0, method=method,
+                          output=viscid.OUTPUT_TOPOLOGY)
+            tstats = dict()
+            ref_topo = viscid.timeit(viscid.calc_streamlines, B, seeds,
+                                     engine='scalar', timeit_repeat=3,
+                                     timeit_quiet=True, timeit_stats=tstats,
+                                     **kwargs)[1]
+            t_scalar = tstats['min']
+            print("{0:>10s} {1:>7s} {2:>10s} {3:>10.3f}"
+                  "".format(grid_name, method, 'scalar', t_scalar))
+            for size in BATCH_SIZES:
+                streamline.batch_size = size
+                tstats = dict()
+                topo = viscid.timeit(viscid.calc_streamlines, B, seeds,
+                                     engine='batched', timeit_repeat=3,
+                                     timeit_quiet=True, timeit_stats=tstats,
+                                     **kwargs)[1]
+                if np.any(topo != ref_topo):
+                    raise RuntimeError("batched engine changed the topology")
+                print("{0:>10s} {1:>7s} {2:>10s} {3:>10.3f} {4:>8.2f}x"
+                      "".format(grid_name, method, 'batch' + str(size),
+                                tstats['min'], t_scalar / tstats['min']))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(_main())
+
+##
+## EOF
+##
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+"""Static vs dynamic seed scheduling for streamlines in a dipole field
+
+Seeds on a plane through the dipole are mostly on closed field lines
+near the middle and open ones near the edges, so contiguous static
+chunks take very different amounts of time. The dynamic schedule
+hands out shrinking batches of seeds as workers free up, so the last
+worker to finish isn't stuck with a whole chunk of closed lines.
+"""
+
+from __future__ import division, print_function
+import sys
+
+import numpy as np
+import viscid
+
+
+NR_PROCS = 4
+NR_SEEDS = (128, 128)
+
+
+def _main():
+    x = 20.0 * np.sinh(np.linspace(-2.5, 2.5, 128)) / np.sinh(2.5)
+    B = viscid.empty([x, x, x], nr_comps=3, name='B', center='node')
+    viscid.fill_dipole(B, m=[0.0, 0.0, -1.0])
+    B['z'] -= 0.002
+
+    seeds = viscid.Plane((0.0, 0.0, 0.0), (0, 1, 0), (1, 0, 0), 30.0, 30.0,
+                         nl=NR_SEEDS[0], nm=NR_SEEDS[1])
+    kwargs = dict(nr_procs=NR_PROCS, ibound=1.0,
+                  output=viscid.OUTPUT_TOPOLOGY)
+    cases = [("static", dict(schedule='static', seed_order='contiguous')),
+             ("static x4", dict(schedule='static', seed_order='contiguous',
+                                chunk_factor=4)),
+             ("strided", dict(schedule='static', seed_order='strided')),
+             ("dynamic", dict(schedule='dynamic', seed_order='contiguous')),
+             ("dyn hilbert", dict(schedule='dynamic', seed_order='hilbert'))]
+
+    print("{0:>12s} {1:>10s}".format("schedule", "time (s)"))
+    ref_topo = None
+    for name, opts in cases:
+        for threads in (True, False):
+            tstats = dict()
+            opts.update(kwargs)
+            _, topo = viscid.timeit(viscid.calc_streamlines, B, seeds,
+                                    threads=threads, timeit_repeat=3,
+                                    timeit_quiet=True, timeit_stats=tstats,
+                                    **opts)
+            print("{0:>12s} {1:>10.3f} ({2})"
+                  "".format(name, tstats['min'],
+                            "threads" if threads else "processes"))
+            if ref_topo is None:
+                ref_topo = np.array(topo)
+            elif not np.all(np.array(topo) == ref_topo):
+                raise RuntimeError("{0} changed the topology".format(name))
+    viscid.parallel.shutdown()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(_main())
+
+##
+## EOF
+##
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+"""Per-call overhead of viscid.parallel.map with and without shared pools
+
+Maps a trivial function over a few items many times, like a time loop
+would, with a fresh pool for each call (persistent=False) and with
+the process-wide pools (persistent=True).
+"""
+
+from __future__ import division, print_function
+import sys
+
+import viscid
+from viscid import parallel
+
+
+NR_PROCS = 4
+NR_CALLS = 50
+
+
+def _noop(i):
+    return i
+
+def _bench(threads, persistent):
+    def _calls():
+        for _ in range(NR_CALLS):
+            parallel.map(NR_PROCS, _noop, [(i, ) for i in range(NR_PROCS)],
+                         threads=threads, persistent=persistent)
+    # the first call makes the shared pool, so warm it up first
+    _calls()
+    tmin, _, _ = viscid.vutil.timereps(3, _calls)
+    return tmin / NR_CALLS
+
+def _main():
+    print("{0:>10s} {1:>14s} {2:>14s} {3:>8s}".format("", "fresh (ms)",
+                                                    "shared (ms)", "speedup"))
+    for threads in (True, False):
+        t_fresh = _bench(threads, False)
+        t_shared = _bench(threads, True)
+        print("{0:>10s} {1:>14.3f} {2:>14.3f} {3:>7.1f}x"
+              "".format("threads" if threads else "processes", 1e3 * t_fresh,
+                        1e3 * t_shared, t_fresh / t_shared))
+    parallel.shutdown()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(_main())
+
+##
+## EOF
+##
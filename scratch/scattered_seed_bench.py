@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""Throughput of interp / streamlines for scattered seeds on a stretched grid
+
+Compares the nonuniform crd lookup table to plain bisection by toggling
+`viscid.cython.cyfield.nonuniform_lut`.
+"""
+
+from __future__ import division, print_function
+
+import numpy as np
+import viscid
+from viscid.cython import cyfield
+
+
+N = (1024, 1024, 8)
+NR_POINTS = 200000
+NR_LINES = 2000
+
+
+def make_stretched_fld():
+    # stretched like an OpenGGCM grid: fine near 0, coarse in the tail
+    x = np.sinh(np.linspace(-4.0, 4.0, N[0])) * 8.0
+    y = np.sinh(np.linspace(-3.0, 3.0, N[1])) * 8.0
+    z = np.linspace(-4.0, 4.0, N[2])
+    fld = viscid.empty((x, y, z), dtype='f4', nr_comps=3, center='node')
+    viscid.fill_dipole(fld)
+    return fld
+
+def make_scattered_seeds(fld):
+    rng = np.random.RandomState(1234)
+    xl, xh = fld.crds.xl_nc, fld.crds.xh_nc
+    pts = rng.uniform(size=(3, NR_POINTS))
+    pts = xl[:, np.newaxis] + pts * (xh - xl)[:, np.newaxis]
+    return viscid.Point(pts)
+
+def bench(name, func, nr_items, *args, **kwargs):
+    results = {}
+    for use_lut in (False, True):
+        cyfield.nonuniform_lut = use_lut
+        tmin, _, _ = viscid.vutil.timereps(3, func, *args, **kwargs)
+        results[use_lut] = tmin
+        print("{0:>12s} lut={1!s:5s} {2:.3g} s, {3:.3g} items/s"
+              "".format(name, use_lut, tmin, nr_items / tmin))
+    print("{0:>12s} lut speedup: {1:.2f}x".format(name, results[False] /
+                                                  results[True]))
+
+def _main():
+    fld = make_stretched_fld()
+    seeds = make_scattered_seeds(fld)
+    line_seeds = viscid.Point(seeds.get_points()[:, :NR_LINES])
+
+    bench("interp", viscid.interp_trilin, NR_POINTS, fld, seeds)
+    bench("nearest", viscid.interp_nearest, NR_POINTS, fld, seeds)
+    bench("streamlines", viscid.calc_streamlines, NR_LINES, fld, line_seeds,
+          ibound=1.0, max_length=20.0, output=viscid.OUTPUT_TOPOLOGY)
+    cyfield.nonuniform_lut = True
+    return 0
+
+if __name__ == "__main__":
+    import sys  # pylint: disable=wrong-import-position,wrong-import-order
+    sys.exit(_main())
+
+##
+## EOF
+##
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+"""Peak memory of J = curl(B) in one go vs in slabs
+
+Numpy allocations are traced with tracemalloc, so the peak doesn't
+include B itself. The slab version writes into a .npy memmap, so its
+peak is just the temporaries of one slab.
+"""
+
+from __future__ import division, print_function
+import os
+import sys
+import tempfile
+import tracemalloc
+
+import numpy as np
+import viscid
+
+
+N = (256, 192, 192)
+
+
+def _peak_mib(func, *args, **kwargs):
+    tracemalloc.start()
+    ret = func(*args, **kwargs)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return ret, peak / 1024**2
+
+def _main():
+    B = viscid.make_dipole(n=N, m=[0.2, 0.3, -0.9], dtype='f4')
+    print("B is {0:.0f} MiB".format(B.data.nbytes / 1024**2))
+
+    print("{0:>8s} {1:>10s} {2:>14s}".format("backend", "slab_size",
+                                             "peak (MiB)"))
+    fname = os.path.join(tempfile.mkdtemp(), "J.npy")
+    for backend in ("numpy", "cython"):
+        ref, peak = _peak_mib(viscid.curl, B, preferred=backend, only=True)
+        print("{0:>8s} {1:>10s} {2:>14.0f}".format(backend, "-", peak))
+        for slab_size in (8, 32):
+            J, peak = _peak_mib(viscid.curl, B, slab_size=slab_size,
+                                out=fname, preferred=backend, only=True)
+            # the dipole is nan at the origin, which assert_array_equal
+            # counts as equal
+            np.testing.assert_array_equal(J.data, ref.data)
+            print("{0:>8s} {1:>10d} {2:>14.0f}".format(backend, slab_size, peak))
+            del J
+    os.remove(fname)
+    os.rmdir(os.path.dirname(fname))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(_main())
+
+##
+## EOF
+##
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+"""numpy vs cython backends of grad / div / curl
+
+The cython backend should give exactly the same numbers; this prints
+the time each backend takes on a dipole field. Set OMP_NUM_THREADS to
+see how the cython stencils scale.
+"""
+
+from __future__ import division, print_function
+import sys
+
+import numpy as np
+import viscid
+
+
+N = (256, 256, 128)
+
+
+def _main():
+    b = viscid.make_dipole(n=N, m=[0.2, 0.3, -0.9], nonuniform=True)
+    b2 = viscid.dot(b, b, preferred='numpy')
+    cases = [('grad', viscid.grad, b2), ('div', viscid.div, b),
+             ('curl', viscid.curl, b)]
+
+    print("{0:>6s} {1:>6s} {2:>10s} {3:>10s} {4:>9s}"
+          "".format("op", "bnd", "numpy (s)", "cython (s)", "speedup"))
+    for name, op, fld in cases:
+        for bnd in (True, False):
+            times = []
+            results = []
+            for backend in ('numpy', 'cython'):
+                tstats = dict()
+                ret = viscid.timeit(op, fld, bnd=bnd, preferred=backend,
+                                    only=True, timeit_repeat=5,
+                                    timeit_quiet=True, timeit_stats=tstats)
+                times.append(tstats['min'])
+                results.append(ret)
+            if name != 'grad' or fld.iscentered('cell'):
+                if not np.array_equal(results[0], results[1]):
+                    raise RuntimeError("cython {0} changed the result"
+                                       "".format(name))
+            print("{0:>6s} {1:>6s} {2:>10.3f} {3:>10.3f} {4:>8.2f}x"
+                  "".format(name, str(bnd), times[0], times[1],
+                            times[0] / times[1]))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(_main())
+
+##
+## EOF
+##
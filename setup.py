@@ -71,9 +71,13 @@ ext_mods = []
 # note that sources should be without extension, .pyx will be
 # appended if building with cython, and .c will be appended
 # if using pre-generated c files
-# dict are kwargs that go into the Extension() constructor
+# dict are kwargs that go into the Extension() constructor, except
+# openmp=True, which adds omp_ccflags / omp_ldflags unless the build is
+# run with --without-openmp
 cy_ccflags = ["-Wno-unused-function"]
 cy_ldflags = []
+omp_ccflags = ["-fopenmp"]
+omp_ldflags = ["-fopenmp"]
 cy_defs = []
 cy_defs.append(["viscid.cython.cycalc",
                 ["viscid/cython/cycalc"],
@@ -99,6 +103,10 @@ cy_defs.append(["viscid.cython.cyamr",
                 ["viscid/cython/cyamr"],
                 dict()
                ])
+cy_defs.append(["viscid.cython.stencil",
+                ["viscid/cython/stencil"],
+                dict(openmp=True)
+               ])
 
 fort_fcflags = []
 fort_ldflags = []
@@ -146,6 +154,13 @@ try:
 except ValueError:
     use_cython = False
 
+try:
+    sys.argv.remove("--without-openmp")
+    use_openmp = False
+except ValueError:
+    # Apple's clang doesn't know -fopenmp
+    use_openmp = sys.platform != "darwin"
+
 # prepare a cute hack to get an `uninstall`
 desired_record_fname = ''
 if 'install' in sys.argv:
@@ -287,9 +302,14 @@ for d in cy_defs:
         continue
 
     src_lst = d[1]
-
-    _ext = Extension(d[0], src_lst, extra_compile_args=cy_ccflags,
-                     extra_link_args=cy_ldflags, **d[2])
+    ext_kwargs = dict(d[2])
+    ccflags, ldflags = list(cy_ccflags), list(cy_ldflags)
+    if ext_kwargs.pop("openmp", False) and use_openmp:
+        ccflags += omp_ccflags
+        ldflags += omp_ldflags
+
+    _ext = Extension(d[0], src_lst, extra_compile_args=ccflags,
+                     extra_link_args=ldflags, **ext_kwargs)
     ext_mods += [_ext]
 
 if has_cython and use_cython:
@@ -94,6 +94,16 @@ def run_test_timeseries(f, main__file__, show=False):
         t[i] = grid.time_as_datetime()
         pressure[i] = grid['pp']['x=10.0f, y=0.0f, z=0.0f']
     plt.plot(t, pressure)
+
+    # the streaming extractor should agree with the loop above, both with
+    # a slice and when interpolating to points
+    _, ts_pressure = viscid.timeseries(f, 'pp', 'x=10.0f, y=0.0f, z=0.0f',
+                                       nr_procs=2)
+    assert np.allclose(ts_pressure, pressure)
+    pts = np.array([[10.0, 8.5, -5.0], [0.0, 0.0, 0.0], [0.0, 1.5, 0.25]])
+    _, ts_b = viscid.timeseries(f, ['b'], pts, nr_procs=2, prefetch=1)
+    for i, grid in enumerate(f.iter_times()):
+        assert np.allclose(ts_b[0][i], viscid.interp(grid['b'], pts, wrap=False))
     plt.ylabel('Pressure')
 
     dateFmt = mdates.DateFormatter('%H:%M:%S')
@@ -3,15 +3,22 @@
 
 from __future__ import print_function
 import argparse
+import copy
 import sys
 import os
+import shutil
+import tempfile
+from xml.etree import ElementTree
 
 import matplotlib.pyplot as plt
+import numpy as np
 
 from viscid_test_common import next_plot_fname
 
 import viscid
 from viscid import vutil
+from viscid.amr_grid import AMRGrid
+from viscid.grid import Grid
 from viscid.plot import vpyplot as vlt
 
 
@@ -24,12 +31,69 @@ def run_test(show=False):
     if show:
         vlt.show()
 
+def run_test_temporal(nr_procs=3):
+    """AMR time steps parsed on a thread pool share a skeleton"""
+    tree = ElementTree.parse(os.path.join(viscid.sample_dir, "amr.xdmf"))
+    temporal = tree.getroot().find("./Domain/Grid")
+    step = temporal.find("./Grid")
+    for i in range(1, 4):
+        new_step = copy.deepcopy(step)
+        new_step.find("./Time").set("Value", str(float(i)))
+        temporal.append(new_step)
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        fname = os.path.join(tmpdir, "amr_temporal.xdmf")
+        tree.write(fname)
+        f = viscid.load_file(fname, nr_procs=nr_procs)
+        grids = list(f.iter_times())
+        if [g.time for g in grids] != [0.0, 1.0, 2.0, 3.0]:
+            raise RuntimeError("time steps are out of order")
+        if not all(g.skeleton is grids[0].skeleton for g in grids):
+            raise RuntimeError("AMR time steps didn't share a skeleton")
+        f.unload()
+    finally:
+        shutil.rmtree(tmpdir)
+
+def run_test_streamlines(nr_procs=2):
+    """Threaded streamlines on a patched dipole match a single patch"""
+    edges = np.linspace(-8.0, 8.0, 3)
+    grids = []
+    for i in range(2):
+        for j in range(2):
+            for k in range(2):
+                crds = [np.linspace(edges[ii], edges[ii + 1], 17)
+                        for ii in (i, j, k)]
+                fld = viscid.empty(crds, nr_comps=3, name='b', center='node')
+                viscid.fill_dipole(fld)
+                grid = Grid()
+                grid.set_crds(fld.crds)
+                grid.add_field(fld)
+                grids.append(grid)
+    amr_b = AMRGrid(grids)['b']
+
+    x = np.linspace(-8.0, 8.0, 33)
+    b = viscid.empty([x, x, x], nr_comps=3, name='b', center='node')
+    viscid.fill_dipole(b)
+
+    seeds = viscid.Sphere((0.0, 0.0, 0.0), 3.0, ntheta=12, nphi=12)
+    _, topo = viscid.calc_streamlines(b, seeds, ibound=1.5,
+                                      output=viscid.OUTPUT_TOPOLOGY)
+    _, amr_topo = viscid.calc_streamlines(amr_b, seeds, ibound=1.5,
+                                          nr_procs=nr_procs,
+                                          output=viscid.OUTPUT_TOPOLOGY)
+    if not np.all(np.array(topo) == np.array(amr_topo)):
+        raise RuntimeError("AMR streamline topology differs from single "
+                           "patch topology")
+
 def _main():
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--show", "--plot", action="store_true")
     args = vutil.common_argparse(parser)
 
     run_test(show=args.show)
+    run_test_temporal()
+    run_test_streamlines()
 
     return 0
 
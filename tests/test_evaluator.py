@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""Test the numexpr evaluator against the numpy one
+
+The numexpr evaluator does the same math one block at a time, so the
+results must be exactly the same as numpy's.
+"""
+
+from __future__ import print_function
+import argparse
+import os
+import sys
+
+import numpy as np
+
+from viscid_test_common import xfail
+
+import viscid
+from viscid import sample_dir
+from viscid import vutil
+from viscid.calculator import evaluator
+
+
+EQUATIONS = ["sqrt(vx**2 + vy**2 + vz**2)",
+             "dot(v, b)",
+             "-cross(v, b)",
+             "b * 2 + 1",
+             "magnitude(b)",
+             "curl(b)",
+             "div(b) + 0 * rr",
+             "dot(curl(b), v) / magnitude(b)",
+             "grad(pp)"]
+
+
+def run_test(grid, slc=None):
+    for eqn in EQUATIONS:
+        a = evaluator._evaluate_numexpr(grid, "result", eqn, slc=slc)
+        b = evaluator._evaluate_numpy(grid, "result", eqn, slc=slc)
+        if a.nr_comps != b.nr_comps or not np.array_equal(a.data, b.data):
+            raise RuntimeError("numexpr evaluator got '{0}' wrong (slc={1})"
+                               "".format(eqn, slc))
+
+def _main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    args = vutil.common_argparse(parser)  # pylint: disable=unused-variable
+
+    if not evaluator._has_numexpr:
+        xfail("Numexpr is not installed")
+    try:
+        f3d = viscid.load_file(os.path.join(sample_dir, 'sample_xdmf.3d.xdmf'))
+        grid = f3d.get_grid()
+    except ImportError:
+        xfail("h5py is not installed")
+
+    evaluator.enabled = True
+    fld = grid["speed=sqrt(vx**2 + vy**2 + vz**2)"]
+    if fld.name != "speed" or fld.nr_comps:
+        raise RuntimeError("evaluated field has the wrong name / type")
+
+    # with small blocks, curl / div / grad need points from their neighbors
+    block_nbytes = evaluator.block_nbytes
+    try:
+        for nbytes in (block_nbytes, 4096):
+            evaluator.block_nbytes = nbytes
+            run_test(grid)
+            run_test(grid, slc="x=2:40, y=3:9")
+        for fld in grid.fields.values():
+            if fld.is_loaded:
+                raise RuntimeError("numexpr evaluator loaded {0}"
+                                   "".format(fld.name))
+    finally:
+        evaluator.block_nbytes = block_nbytes
+
+    # things numexpr doesn't understand fall back to numpy
+    fld = evaluator.evaluate(grid, "result", "cumsum(rr)")
+    if not np.array_equal(fld, np.cumsum(grid['rr'])):
+        raise RuntimeError("fallback to the numpy evaluator is broken")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(_main())
+
+##
+## EOF
+##
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+"""Test that memory mapped fortbin fields read the same as normal reads
+
+Small fortbin files are written in both byte orders, then fields are
+read with and without use_mmap, whole and through __getitem__.
+"""
+
+from __future__ import print_function
+import argparse
+import os
+import shutil
+import struct
+import sys
+import tempfile
+
+import numpy as np
+
+import viscid_test_common  # pylint: disable=unused-import
+
+from viscid import vutil
+from viscid.readers import ggcm_fortbin
+
+
+DIMS = (6, 5, 4)  # xyz
+SLICES = [(slice(1, 3), ),
+          (2, ),
+          (-1, slice(None), 1),
+          (slice(None, None, 2), slice(1, 4)),
+          (slice(None, None, -2), ),
+          (slice(3, 0, -1), 2, slice(None)),
+          (Ellipsis, 0),
+          ([0, 2], )]
+
+
+def write_fortbin(fname, endian, fields, inttime=1200):
+    """Write {name: xyz array} to a fortbin file, return their positions"""
+    positions = {}
+    with open(fname, 'wb') as f:
+        for name, arr in fields:
+            positions[name] = f.tell()
+            f.write(struct.pack(endian + 'iii', 2, inttime, arr.ndim))
+            f.write(struct.pack(endian + '{0}i'.format(arr.ndim), *arr.shape))
+            f.write(name.ljust(80).encode())
+            f.write("time".ljust(80).encode())
+            f.write(arr.astype(endian + 'f4').tobytes(order='F'))
+    return positions
+
+def check_same(a, b, msg):
+    if a.shape != b.shape or not np.array_equal(a, b):
+        raise RuntimeError("mmap read differs: {0}".format(msg))
+
+def run_test(tmpdir, endian):
+    x, y, z = np.meshgrid(*[np.arange(n, dtype='f4') for n in DIMS],
+                          indexing='ij')
+    fields = [("rr", 100.0 * x + 10.0 * y + z), ("pp", x * y - z)]
+    fname = os.path.join(tmpdir, "run.3df.001200.b")
+    positions = write_fortbin(fname, endian, fields)
+
+    fwrap = ggcm_fortbin.GGCMFortbinFileWrapper(fname)
+    for name, arr in fields:
+        wrappers = []
+        for use_mmap in (False, True):
+            dwrap = ggcm_fortbin.FortbinDataWrapper(fwrap, name, DIMS,
+                                                    positions[name])
+            dwrap.use_mmap = use_mmap
+            wrappers.append(dwrap)
+        plain, mapped = wrappers
+
+        msg = "{0} {1}".format(endian, name)
+        check_same(np.array(plain), arr.T, msg + " normal read")
+        check_same(np.array(plain), np.array(mapped), msg)
+        for slc in SLICES:
+            check_same(plain[slc], mapped[slc], "{0} {1}".format(msg, slc))
+            check_same(mapped[slc], arr.T[slc], "{0} {1}".format(msg, slc))
+
+def _main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    args = vutil.common_argparse(parser)  # pylint: disable=unused-variable
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        for endian in ('<', '>'):
+            run_test(tmpdir, endian)
+    finally:
+        shutil.rmtree(tmpdir)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(_main())
+
+##
+## EOF
+##
@@ -8,8 +8,12 @@ reader to inject specific behavior.
 
 from __future__ import print_function
 import argparse
+import shutil
 import sys
 import os
+import tempfile
+
+import numpy as np
 
 import ggcm_test_common
 
@@ -35,8 +39,62 @@ def _main():
     fiof = viscid.load_file(os.path.join(sample_dir, 'sample_jrrle.iof.*'))
     ggcm_test_common.run_test_iof(fiof, __file__, show=args.show)
 
+    _test_index()
+
     return 0
 
+
+def _test_index():
+    """Make sure sidecar indices are written, validated, and used"""
+    from viscid.readers import ggcm_jrrle
+
+    fname = os.path.join(sample_dir, 'sample_jrrle.3df.001200')
+    ref = viscid.load_file(fname)
+
+    index_dir = tempfile.mkdtemp()
+    ggcm_jrrle.use_index = True
+    ggcm_jrrle.index_dir = index_dir
+    try:
+        for _ in range(2):
+            wrapper = ggcm_jrrle.JrrleFileWrapper(fname)
+            with wrapper as w:
+                meta = w.inquire('vx')
+            assert wrapper.seen_all_fields
+            assert meta['dims'] == ref['vx']._src_data.expected_shape
+            assert os.path.isfile(ggcm_jrrle.index_fname(fname))
+
+        # without an index, inquire only tries to load it once
+        os.remove(ggcm_jrrle.index_fname(fname))
+        wrapper = ggcm_jrrle.JrrleFileWrapper(fname)
+        nr_loads = [0]
+        def _counting_load_index(_load_index=wrapper.load_index):
+            nr_loads[0] += 1
+            return _load_index()
+        wrapper.load_index = _counting_load_index
+        with wrapper as w:
+            w.inquire('vx')
+        assert nr_loads[0] == 1, "index loaded {0} times".format(nr_loads[0])
+        assert os.path.isfile(ggcm_jrrle.index_fname(fname))
+
+        wrapper = ggcm_jrrle.JrrleFileWrapper(fname)
+        assert wrapper.load_index()
+        assert list(wrapper.fields_seen.keys()) == [fld.name for fld in ref.iter_fields()]
+
+        f = viscid.load_file(fname, force_reload=True)
+        assert np.all(f['pp'].data == ref['pp'].data)
+        assert np.all(f['vz'].data == ref['vz'].data)
+
+        # a stale index must be ignored
+        with open(ggcm_jrrle.index_fname(fname), 'r') as fin:
+            index = fin.read()
+        with open(ggcm_jrrle.index_fname(fname), 'w') as fout:
+            fout.write(index.replace('"size": ', '"size": 1'))
+        assert not ggcm_jrrle.JrrleFileWrapper(fname).load_index()
+    finally:
+        ggcm_jrrle.use_index = False
+        ggcm_jrrle.index_dir = None
+        shutil.rmtree(index_dir)
+
 if __name__ == "__main__":
     sys.exit(_main())
 
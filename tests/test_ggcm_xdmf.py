@@ -11,6 +11,8 @@ import argparse
 import sys
 import os
 
+import numpy as np
+
 import ggcm_test_common
 
 import viscid
@@ -35,6 +37,19 @@ def _main():
     fiof = viscid.load_file(os.path.join(sample_dir, 'sample_xdmf.iof.xdmf'))
     ggcm_test_common.run_test_iof(fiof, __file__, show=args.show)
 
+    # parsing the time steps on a thread pool should give the same dataset
+    bucket = viscid.readers.vfile_bucket.VFileBucket()
+    par_files = bucket.load_files([os.path.join(sample_dir, 'sample_xdmf.3d.xdmf'),
+                                   os.path.join(sample_dir, 'sample_xdmf.py_0.xdmf')],
+                                  grid_type=ggcm_test_common.MyGGCMGrid,
+                                  nr_procs=3)
+    f2d_par = [f for f in par_files if f.fname == f2d.fname][0]
+    times = [grid.time for grid in f2d.iter_times()]
+    par_times = [grid.time for grid in f2d_par.iter_times()]
+    assert times == par_times, "{0} != {1}".format(times, par_times)
+    for grid, par_grid in zip(f2d.iter_times(), f2d_par.iter_times()):
+        assert np.all(grid['pp'].data == par_grid['pp'].data)
+
     return 0
 
 if __name__ == "__main__":
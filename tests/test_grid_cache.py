@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+"""Test that grids remember derived fields until their sources change"""
+
+from __future__ import print_function
+import argparse
+import sys
+
+import numpy as np
+
+import viscid_test_common  # pylint: disable=unused-import
+
+import viscid
+from viscid import vutil
+from viscid.dataset import DatasetTemporal
+from viscid.grid import Grid
+
+
+class CountingGrid(Grid):
+    cache_derived_fields = True
+    nr_calcs = 0
+
+    def _get_asq(self):
+        CountingGrid.nr_calcs += 1
+        a = self['a']
+        return a.wrap(a.data**2, context=dict(name="asq"))
+
+    def _get_total(self):
+        return self['asq'] + self['b']
+
+    def _get_v(self):
+        return viscid.scalar_fields_to_vector([self['a'], self['b'], self['b']],
+                                              name="v",
+                                              _force_layout=self.force_vector_layout)
+
+
+def make_grid(time, n=32):
+    x = np.linspace(-1.0, 1.0, n)
+    a = viscid.empty([x, x, x], name="a", center="node")
+    b = viscid.empty([x, x, x], name="b", center="node")
+    a[...] = time + 1.0
+    b[...] = 2.0
+    grid = CountingGrid(time=time)
+    grid.set_crds(a.crds)
+    grid.add_field(a, b)
+    return grid
+
+def check_calcs(expected, msg):
+    if CountingGrid.nr_calcs != expected:
+        raise RuntimeError("{0}: calculated asq {1} times, expected {2}"
+                           "".format(msg, CountingGrid.nr_calcs, expected))
+
+def run_test_memoize():
+    CountingGrid.nr_calcs = 0
+    grid = make_grid(0.0)
+    cache = grid.derived_cache
+
+    asq = grid['asq']
+    if grid['asq'] is not asq or cache.hits != 1 or cache.misses != 1:
+        raise RuntimeError("asq wasn't cached")
+    check_calcs(1, "memoize")
+
+    # total is calculated from asq, so it depends on a too
+    total = grid['total']
+    check_calcs(1, "nested lookup")
+    if not np.all(total.data == 3.0):
+        raise RuntimeError("total is wrong")
+
+    # different slices are different entries
+    sub = grid.get_field('asq', slc="x=0:4")
+    if (list(sub.shape) != [4, 32, 32] or
+            grid.get_field('asq', slc="x=0:4") is not sub):
+        raise RuntimeError("sliced asq wasn't cached")
+    check_calcs(2, "sliced")
+
+    # replacing b forgets total, but not asq
+    b = grid['b']
+    del grid['b']
+    grid['b'] = b.wrap(np.zeros_like(b.data), context=dict(name="b"))
+    if grid['asq'] is not asq:
+        raise RuntimeError("asq was forgotten when b changed")
+    if not np.all(grid['total'].data == 1.0):
+        raise RuntimeError("total wasn't recalculated when b changed")
+
+    # replacing a forgets everything
+    a = grid['a']
+    del grid['a']
+    grid.add_field(a.wrap(2.0 * a.data, context=dict(name="a")))
+    if not np.all(grid['total'].data == 4.0):
+        raise RuntimeError("total wasn't recalculated when a changed")
+    check_calcs(3, "after changing a")
+
+    grid.clear_cache()
+    if len(cache):
+        raise RuntimeError("clear_cache didn't forget derived fields")
+
+    CountingGrid.cache_derived_fields = False
+    try:
+        grid['asq']
+        grid['asq']
+        check_calcs(5, "cache_derived_fields=False")
+    finally:
+        CountingGrid.cache_derived_fields = True
+
+def run_test_layout():
+    grid = make_grid(0.0)
+    grid.force_vector_layout = viscid.field.LAYOUT_FLAT
+    v_flat = grid['v']
+    grid.force_vector_layout = viscid.field.LAYOUT_INTERLACED
+    v_interlaced = grid['v']
+    if v_interlaced is v_flat or v_interlaced.layout != "interlaced":
+        raise RuntimeError("got a cached vector with the wrong layout")
+    grid.force_vector_layout = viscid.field.LAYOUT_FLAT
+    if grid['v'] is not v_flat or v_flat.layout != "flat":
+        raise RuntimeError("flat vector wasn't cached")
+    if not np.all(v_flat['x'].data == v_interlaced['x'].data):
+        raise RuntimeError("layouts have different data")
+
+def run_test_shared_budget():
+    dset = DatasetTemporal(name="series")
+    for i in range(4):
+        dset.add(make_grid(float(i)))
+    grids = [child[1] for child in dset.children]
+    if any(g.derived_cache is not dset.derived_cache for g in grids):
+        raise RuntimeError("grids don't share the dataset's cache")
+
+    cache = dset.derived_cache
+    nbytes = grids[0]['a'].data.nbytes
+    cache.max_nbytes = 2 * nbytes
+    CountingGrid.nr_calcs = 0
+    for g in grids:
+        g['asq']
+    check_calcs(4, "filling the cache")
+    if len(cache) != 2 or cache.nbytes != 2 * nbytes or cache.evictions < 2:
+        raise RuntimeError("the cache isn't in budget")
+
+    # the last two grids are still cached, the first was evicted
+    grids[3]['asq']
+    grids[2]['asq']
+    check_calcs(4, "recently used")
+    grids[0]['asq']
+    check_calcs(5, "evicted")
+
+    # clearing one grid doesn't forget the others
+    grids[0].clear_cache()
+    grids[2]['asq']
+    check_calcs(5, "clear one grid")
+
+def _main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    args = vutil.common_argparse(parser)  # pylint: disable=unused-variable
+
+    run_test_memoize()
+    run_test_layout()
+    run_test_shared_budget()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(_main())
+
+##
+## EOF
+##
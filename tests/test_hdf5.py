@@ -55,6 +55,14 @@ def _main():
     if args.show:
         plt.show()
 
+    # all those reads should have shared one pooled file handle
+    pool = viscid.readers.hdf5.h5_file_pool
+    if pool.max_open > 0:
+        assert pool.stats['hits'] > 0, "h5 file pool never hit"
+        assert pool.stats['nr_open'] >= 1
+        f.unload()
+        assert os.path.abspath(h5_fname) not in pool._handles
+
     if not args.keep:
         os.remove(h5_fname)
         os.remove(xdmf_fname)
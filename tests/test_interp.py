@@ -23,6 +23,54 @@ def run_test(fld, seeds, kind, show=False):
     if show:
         vlt.show()
 
+def run_test_many(fields, seeds, kind):
+    """interp_many should match interp one field at a time"""
+    many = viscid.interp_many(fields, seeds, kind=kind, wrap=False)
+    for fld, result in zip(fields, many):
+        single = viscid.interp(fld, seeds, kind=kind, wrap=False)
+        if not np.allclose(single, result):
+            raise RuntimeError("interp_many does not match interp for {0} "
+                               "({1})".format(fld.name, kind))
+
+def run_test_plan(fields, seeds, kind):
+    """InterpPlan should match interp, and be reused by get_interp_plan"""
+    seeds = viscid.to_seeds(seeds)
+    for fld in fields:
+        plan = viscid.get_interp_plan(fld.crds, seeds, fld.center, kind)
+        single = viscid.interp(fld, seeds, kind=kind, wrap=False)
+        if not np.allclose(plan.apply(fld, wrap=False), single, atol=1e-6):
+            raise RuntimeError("InterpPlan does not match interp for {0} "
+                               "({1})".format(fld.name, kind))
+        same_crds = fld.slice_and_keep(":")
+        if viscid.get_interp_plan(same_crds.crds, seeds, fld.center,
+                                  kind) is not plan:
+            raise RuntimeError("InterpPlan was not reused")
+
+def run_test_nonuniform_lookup():
+    """lookup table and bisection should find the same cells"""
+    from viscid.cython import cyfield
+
+    x = 8.0 * np.sinh(np.linspace(-4.0, 4.0, 300))
+    y = 8.0 * np.sinh(np.linspace(-3.0, 3.2, 200))
+    z = np.linspace(-2.0, 2.0, 9)**3
+    fld = viscid.empty([x, y, z], nr_comps=3, name='stretched')
+    fld.data[...] = np.random.rand(*fld.shape)
+    pts = np.random.uniform(-300.0, 300.0, size=(3, 4096))
+    pts[:, :16] = np.array([x[5], y[7], z[3]]).reshape(3, 1)
+    seeds = viscid.Point(pts)
+
+    for kind in ("nearest", "linear"):
+        try:
+            cyfield.nonuniform_lut = True
+            with_lut = viscid.interp(fld, seeds, kind=kind, wrap=False)
+            cyfield.nonuniform_lut = False
+            without_lut = viscid.interp(fld, seeds, kind=kind, wrap=False)
+        finally:
+            cyfield.nonuniform_lut = True
+        if not np.all(with_lut == without_lut):
+            raise RuntimeError("nonuniform crd lookup table gives different "
+                               "cells than bisection ({0})".format(kind))
+
 def _main():
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--show", "--plot", action="store_true")
@@ -40,6 +88,18 @@ def _main():
     run_test(logo, seeds, "Nearest", show=args.show)
     run_test(logo, seeds, "Trilinear", show=args.show)
 
+    vec = viscid.empty([x, y, z], nr_comps=3, name='vec', center='node')
+    vec.data[...] = np.random.rand(*vec.shape)
+    cc_fld = viscid.empty([x, y, z], name='cc', center='cell')
+    cc_fld.data[...] = np.random.rand(*cc_fld.shape)
+    fields = [logo, vec, logo.astype('f4'), cc_fld]
+    seeds = viscid.Volume([-1.1, -0.9, -0.9], [1.1, 0.9, 0.9], n=[16, 16, 16])
+    run_test_many(fields, seeds, "nearest")
+    run_test_many(fields, seeds, "linear")
+    run_test_plan(fields, seeds, "nearest")
+    run_test_plan(fields, seeds, "linear")
+    run_test_nonuniform_lookup()
+
     return 0
 
 if __name__ == "__main__":
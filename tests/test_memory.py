@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+"""Test the memory budget for field caches"""
+
+from __future__ import print_function
+import argparse
+import gc
+import sys
+
+import numpy as np
+
+import viscid_test_common  # pylint: disable=unused-import
+
+import viscid
+from viscid import memory
+from viscid import vutil
+from viscid.grid import Grid
+
+
+N = 32
+
+
+class LazyArray(object):
+    """Stands in for a dataset in a file, every read makes a new array"""
+    nr_reads = 0
+
+    def __init__(self, arr):
+        self._arr = arr
+        self.shape = arr.shape
+        self.dtype = arr.dtype
+
+    def __array__(self, *args, **kwargs):
+        LazyArray.nr_reads += 1
+        return np.array(self._arr)
+
+
+def make_field(name, val):
+    x = np.linspace(-1.0, 1.0, N)
+    crds = viscid.arrays2crds([x, x, x])
+    arr = np.full((N, N, N), val, dtype='f8')
+    return viscid.field.ScalarField(name, crds, LazyArray(arr), center="node")
+
+def check_loaded(flds, expected, msg):
+    loaded = [f.is_loaded for f in flds]
+    if loaded != expected:
+        raise RuntimeError("{0}: loaded {1}, expected {2}".format(msg, loaded,
+                                                                   expected))
+
+def run_test_budget():
+    nbytes = 8 * N**3
+    base = memory.memory_usage()
+    flds = [make_field("f{0}".format(i), i) for i in range(4)]
+    grids = [Grid(name="g0"), Grid(name="g1")]
+    grids[0].add_field(*flds[:2])
+    grids[1].add_field(*flds[2:])
+
+    # no budget, everything stays in memory
+    for f in flds:
+        f.data
+    if memory.memory_usage() - base != 4 * nbytes:
+        raise RuntimeError("didn't count the caches")
+    by_grid = memory.memory_usage('grid')
+    if any(by_grid.get(g) != 2 * nbytes for g in grids):
+        raise RuntimeError("per grid usage is wrong: {0}".format(by_grid))
+    grids[1].clear_cache()
+    if memory.memory_usage() - base != 2 * nbytes:
+        raise RuntimeError("clear_cache didn't uncount the caches")
+    grids[0].clear_cache()
+
+    try:
+        memory.max_nbytes = "{0}K".format(2 * nbytes // 1024 + 1)
+        for f in flds:
+            f.data
+        check_loaded(flds, [False, False, True, True], "over budget")
+        if memory.memory_usage() - base > 2 * nbytes:
+            raise RuntimeError("usage is over budget")
+
+        # f2 was just used, so f3 is the least recently used
+        flds[2].data
+        nr_reads = LazyArray.nr_reads
+        if not np.all(flds[0].data == 0.0):
+            raise RuntimeError("reloaded the wrong data")
+        if LazyArray.nr_reads != nr_reads + 1:
+            raise RuntimeError("f0 wasn't reloaded")
+        check_loaded(flds, [True, False, True, False], "lru")
+
+        # fields that wrap arrays in memory don't count, and are never
+        # cleared since there's nowhere to reload them from
+        inmem = flds[1].wrap(np.ones((N, N, N)))
+        inmem.data
+        for f in flds:
+            f.data
+        if not inmem.is_loaded:
+            raise RuntimeError("cleared a field that can't be reloaded")
+
+        # garbage collected fields don't count
+        tmp = make_field("tmp", 5.0)
+        tmp.data
+        usage = memory.memory_usage()
+        del tmp
+        gc.collect()
+        if memory.memory_usage() != usage - nbytes:
+            raise RuntimeError("fields that were garbage collected still count")
+    finally:
+        memory.max_nbytes = None
+        for grid in grids:
+            grid.clear_cache()
+
+def run_test_rc():
+    if memory.parse_nbytes("512 MiB") != 512 * 1024**2:
+        raise RuntimeError("MiB is wrong")
+    if memory.parse_nbytes("2GB") != 2 * 1000**3:
+        raise RuntimeError("GB is wrong")
+    if memory.parse_nbytes("4g") != 4 * 1024**3:
+        raise RuntimeError("g is wrong")
+    if (memory.parse_nbytes(1e6) != 1000000 or
+            memory.parse_nbytes("1e3") != 1000):
+        raise RuntimeError("plain numbers are wrong")
+
+    viscid._rc.set_attribute("memory.max_nbytes", "1.5 KiB")
+    memory.post_rc_actions()
+    if memory.max_nbytes != 1536:
+        raise RuntimeError("rc file didn't set the budget")
+    memory.max_nbytes = "lots"
+    memory.post_rc_actions()
+    if memory.max_nbytes is not None:
+        raise RuntimeError("a bad budget wasn't ignored")
+
+def _main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    args = vutil.common_argparse(parser)  # pylint: disable=unused-variable
+
+    run_test_budget()
+    run_test_rc()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(_main())
+
+##
+## EOF
+##
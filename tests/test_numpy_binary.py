@@ -40,6 +40,13 @@ def main():
     viscid.save_fields(fname, [psi, b])
 
     f = viscid.load_file(fname)
+
+    # slicing an unloaded field should only read the hyperslab from disk
+    for fld, ref in [(f['psi'], psi), (f['b'], b)]:
+        slced = fld["x=-1.0f:1.0f, y=0.0f"]
+        assert fld._cache is None, "slice loaded the whole field"
+        assert np.all(slced.data == ref["x=-1.0f:1.0f, y=0.0f"].data)
+
     plt.subplot(131)
     vlt.plot(f['psi'], "y=0")
     plt.subplot(132)
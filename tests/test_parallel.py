@@ -7,6 +7,7 @@ equal. In principle, they should be exactly equal.
 
 from __future__ import print_function
 import argparse
+import os
 import sys
 
 import numpy as np
@@ -22,11 +23,127 @@ def do(timeit, func, *args, **kwargs):
     else:
         return func(*args, **kwargs)
 
+def _square(x, offset=0):
+    return x**2 + offset
+
+def _nested_sum(n):
+    return sum(viscid.parallel.map(2, _square, [(i, ) for i in range(n)],
+                                   threads=True, persistent=True))
+
+def run_test_shared_pools():
+    """map should reuse its pools, grow them, and survive nesting"""
+    from viscid import parallel
+
+    parallel.shutdown()
+    expected = [i**2 + 1 for i in range(16)]
+
+    # pools are only shared when asked for
+    parallel.map(2, _square, [(i, ) for i in range(4)], threads=True)
+    assert parallel._shared_pools[True] is None
+
+    for threads in (True, False):
+        r = parallel.map(2, _square, [(i, ) for i in range(16)],
+                         args_kw=dict(offset=1), threads=threads,
+                         persistent=True)
+        assert r == expected
+        pool0 = parallel._shared_pools[threads]
+        r = parallel.map(2, _square, [(i, ) for i in range(16)],
+                         args_kw=dict(offset=1), threads=threads,
+                         persistent=True)
+        assert r == expected
+        assert parallel._shared_pools[threads] is pool0, "pool not reused"
+        r = parallel.map(3, _square, [(i, ) for i in range(16)],
+                         args_kw=dict(offset=1), threads=threads,
+                         persistent=True)
+        assert r == expected
+        assert parallel._shared_pools[threads].nr_workers == 3
+
+    # map from inside a task on the shared thread pool
+    r = parallel.map(2, _nested_sum, [(n, ) for n in range(1, 6)],
+                     threads=True, persistent=True)
+    assert r == [sum(i**2 for i in range(n)) for n in range(1, 6)]
+
+    # errors in workers make it back to the caller
+    for threads in (True, False):
+        try:
+            parallel.map(2, _square, [(None, )], threads=threads,
+                         persistent=True)
+        except TypeError:
+            pass
+        else:
+            raise RuntimeError("exception from worker was lost")
+
+    # workers forked before a function existed can't unpickle it and
+    # die, map should notice instead of waiting forever
+    def _late_square(x):
+        return x**2
+    _late_square.__name__ = "_late_square"
+    if hasattr(_late_square, "__qualname__"):
+        _late_square.__qualname__ = "_late_square"
+    globals()["_late_square"] = _late_square
+    pool0 = parallel._shared_pools[False]
+    try:
+        parallel.map(2, _late_square, [(i, ) for i in range(4)],
+                     persistent=True, timeout=60)
+    except viscid.verror.WorkerLostError:
+        pass
+    else:
+        raise RuntimeError("map didn't notice a dead worker")
+    assert parallel._shared_pools[False] is not pool0, "dead pool kept"
+    # a new pool is forked after the function exists
+    r = parallel.map(2, _late_square, [(i, ) for i in range(4)],
+                     persistent=True)
+    assert r == [i**2 for i in range(4)]
+
+    parallel.shutdown()
+    assert all(p is None for p in parallel._shared_pools.values())
+
+def _field_sum(fld, scale=1.0):
+    base = fld.data
+    while not isinstance(base, np.memmap):
+        base = base.base
+        assert base is not None, "field data was pickled, not shared"
+    return scale * np.nansum(fld.data)
+
+def run_test_shared_field():
+    """Big fields should go to worker processes through shared memory"""
+    import glob
+    import pickle
+    from viscid import parallel
+
+    b = viscid.make_dipole(n=(32, 32, 32))
+    with parallel.SharedField(b) as shared_b:
+        b2 = pickle.loads(pickle.dumps(shared_b))
+        assert isinstance(b2, type(b))
+        assert b2.name == b.name and b2.center == b.center
+        np.testing.assert_array_equal(b2.data, b.data)
+        for ax in b.crds.axes:
+            np.testing.assert_array_equal(b2.get_crd(ax), b.get_crd(ax))
+        fnames = list(shared_b.fnames)
+    assert not any(os.path.exists(fname) for fname in fnames)
+
+    threshold = parallel.shared_field_threshold
+    try:
+        parallel.shared_field_threshold = 0
+        for persistent in (True, False):
+            r = parallel.map(2, _field_sum, [(b, ), (b, )],
+                             args_kw=dict(scale=2.0), persistent=persistent)
+            np.testing.assert_allclose(r, 2.0 * np.nansum(b.data))
+    finally:
+        parallel.shared_field_threshold = threshold
+    shm_dir = os.path.dirname(fnames[0])
+    assert not glob.glob(os.path.join(shm_dir, "viscid-*.dat"))
+
 def _main():
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--timeit", '-t', action="store_true")
     args = viscid.vutil.common_argparse(parser, default_verb=0)
 
+    viscid.logger.info("Testing shared worker pools...")
+    run_test_shared_pools()
+    viscid.logger.info("Testing shared memory fields...")
+    run_test_shared_field()
+
     for nu in (False, True):
         viscid.logger.info("Test set, nonuniform = {0}".format(nu))
         b = viscid.make_dipole(l=(-20, -6.4, -6.4), h=(20, 6.4, 6.4),
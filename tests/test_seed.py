@@ -23,8 +23,18 @@ viscid.readers.openggcm.GGCMFile.read_log_file = True
 viscid.readers.openggcm.GGCMGrid.mhd_to_gse_on_read = "auto"
 
 
+def check_sliced_points(seeds):
+    """get_points(slc=...) must match slicing all the points"""
+    pts = seeds.get_points()
+    for slc in [slice(None), slice(3, 11), slice(2, None, 3), slice(0, 0)]:
+        sliced_pts = seeds.get_points(slc=slc)
+        if not np.array_equal(sliced_pts, pts[:, slc]):
+            raise RuntimeError("{0}.get_points(slc={1}) is wrong"
+                               "".format(type(seeds).__name__, slc))
+
 def run_test(fld, seeds, plot2d=True, plot3d=True, add_title="",
              view_kwargs=None, show=False):
+    check_sliced_points(seeds)
     interpolated_fld = viscid.interp_trilin(fld, seeds)
     seed_name = seeds.__class__.__name__
     if add_title:
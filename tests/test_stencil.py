@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+"""Test the cython grad / div / curl against the numpy versions
+
+The cython stencils do the same floating point operations in the same
+order as numpy, so the results must be exactly equal. The same goes
+for doing any of these operations in slabs.
+"""
+
+from __future__ import print_function
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+
+import numpy as np
+
+from viscid_test_common import xfail
+
+import viscid
+from viscid import vutil
+
+
+def make_fields(dtype, crd_dtype, nonuniform, center, layout):
+    x = np.linspace(-5.0, 5.0, 24)
+    y = np.linspace(-4.0, 4.0, 20)
+    z = np.linspace(-3.0, 3.0, 16)
+    if nonuniform:
+        x = 5.0 * np.sinh(x / 2.5) / np.sinh(2.0)
+        z = z + 0.1 * z**2
+    crds = [np.array(c, dtype=crd_dtype) for c in (x, y, z)]
+
+    v = viscid.empty(crds, name="V", nr_comps=3, center=center, layout=layout,
+                     dtype=dtype)
+    X, Y, Z = v.get_crds(shaped=True)
+    v['x'] = np.sin(X) * Y + Z**2
+    v['y'] = np.cos(Y) * Z - X
+    v['z'] = X * Y * np.exp(-Z**2)
+    s = viscid.empty(crds, name="S", center=center, dtype=dtype)
+    s[...] = X**2 * np.sin(Y) + np.cos(Z)
+    return s, v
+
+def assert_same(a, b, msg):
+    if a.dtype != b.dtype or a.shape != b.shape:
+        raise RuntimeError("{0}: {1} {2} != {3} {4}".format(msg, a.dtype, a.shape,
+                                                         b.dtype, b.shape))
+    if not np.array_equal(a.data, b.data):
+        raise RuntimeError("{0}: max diff {1}".format(msg,
+                                                      np.max(np.abs(a - b))))
+    for ca, cb in zip(a.get_crds(), b.get_crds()):
+        if not np.array_equal(ca, cb):
+            raise RuntimeError("{0}: different crds".format(msg))
+
+def run_test(dtype, crd_dtype, nonuniform, center, layout):
+    s, v = make_fields(dtype, crd_dtype, nonuniform, center, layout)
+    msg = "{0} {1} nonuniform={2} {3} {4}".format(dtype, crd_dtype, nonuniform,
+                                                  center, layout)
+    for bnd in (True, False):
+        for op in (viscid.div, viscid.curl):
+            a = op(v, bnd=bnd, preferred="numpy", only=True)
+            b = op(v, bnd=bnd, preferred="cython", only=True)
+            assert_same(a, b, "{0} {1} bnd={2}".format(op.opname, msg, bnd))
+
+        b = viscid.grad(s, bnd=bnd, preferred="cython", only=True)
+        if b.center != s.center:
+            raise RuntimeError("grad {0} has the wrong center".format(msg))
+        # numpy's grad only works for cell centered fields
+        if center == "cell":
+            a = viscid.grad(s, bnd=bnd, preferred="numpy", only=True)
+            assert_same(a, b, "grad {0} bnd={1}".format(msg, bnd))
+
+def run_test_slabs():
+    """Doing an operation in slabs must not change the result"""
+    tmpdir = tempfile.mkdtemp()
+    try:
+        for center in ("cell", "node"):
+            s, v = make_fields('f4', 'f4', False, center, "interlaced")
+            for bnd in (True, False):
+                for backend in ("numpy", "cython"):
+                    ops = [(viscid.div, v), (viscid.curl, v)]
+                    if center == "cell" or backend == "cython":
+                        ops.append((viscid.grad, s))
+                    for op, fld in ops:
+                        kwargs = dict(bnd=bnd, preferred=backend, only=True)
+                        ref = op(fld, **kwargs)
+                        for slab_size in (1, 5, 100):
+                            ret = op(fld, slab_size=slab_size, **kwargs)
+                            assert_same(ref, ret, "{0} slab_size={1}"
+                                        "".format(op.opname, slab_size))
+                        fname = os.path.join(tmpdir, "out.npy")
+                        ret = op(fld, slab_size=3, out=fname, **kwargs)
+                        assert_same(ref, ret, "{0} memmap".format(op.opname))
+                        del ret
+                        if not np.array_equal(np.load(fname), ref.data):
+                            raise RuntimeError("{0} memmap wasn't written"
+                                               "".format(op.opname))
+                        out = np.empty_like(ref.data)
+                        ret = op(fld, out=out, **kwargs)
+                        if (not np.shares_memory(ret.data, out) or
+                                ret.name != ref.name):
+                            raise RuntimeError("{0} didn't use out"
+                                               "".format(op.opname))
+
+        # too thin to have any output points, out can't be filled
+        x = np.linspace(-1.0, 1.0, 8)
+        v = viscid.empty([[0.0, 1.0], x, x], name="V", nr_comps=3,
+                         center="node")
+        try:
+            viscid.div(v, bnd=False, out=np.empty((0, 8, 8)))
+        except ValueError:
+            pass
+        else:
+            raise RuntimeError("div of a thin field didn't fail")
+    finally:
+        shutil.rmtree(tmpdir)
+
+def run_test_flat_axis():
+    """A flat axis has no derivative"""
+    x = np.linspace(-1.0, 1.0, 16)
+    s = viscid.empty([x, x, [0.0]], name="S", center="node")
+    X, Y, _ = s.get_crds(shaped=True)
+    s[...] = X + 2.0 * Y
+    g = viscid.grad(s, preferred="cython", only=True)
+    if not (np.allclose(g['x'], 1.0) and np.allclose(g['y'], 2.0) and
+            np.all(g['z'].data == 0.0)):
+        raise RuntimeError("grad of a flat field is wrong")
+
+def _main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    args = vutil.common_argparse(parser)  # pylint: disable=unused-variable
+
+    try:
+        viscid.div._get_imp("cython", only=True)
+    except viscid.verror.BackendNotFound:
+        xfail("Cython stencils are not built")
+
+    for dtype, crd_dtype in [('f8', 'f8'), ('f4', 'f4'), ('f4', 'f8')]:
+        for nonuniform in (False, True):
+            for center in ("cell", "node"):
+                for layout in ("flat", "interlaced"):
+                    run_test(dtype, crd_dtype, nonuniform, center, layout)
+    run_test_slabs()
+    run_test_flat_axis()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(_main())
+
+##
+## EOF
+##
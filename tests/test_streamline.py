@@ -112,6 +112,196 @@ def set_violin_colors(v):
     return colors
 
 
+def run_seed_order_benchmark(nr_procs=2, chunk_factor=4):
+    """Compare ways of splitting seeds among workers
+
+    All orderings must give the same topology; the timings show how
+    much locality of the seeds in each chunk matters.
+    """
+    x = 8.0 * np.sinh(np.linspace(-2.5, 2.5, 128))
+    B = viscid.empty([x, x, x], nr_comps=3, name='B', center='node')
+    viscid.fill_dipole(B, m=[0.2, 0.3, -0.9])
+
+    all_seeds = [('Sphere', viscid.Sphere((0.0, 0.0, 0.0), 4.0, ntheta=100,
+                                          nphi=100)),
+                 ('Plane', viscid.Plane((0.0, 0.0, 0.0), (0, 1, 0), (1, 0, 0),
+                                        20.0, 20.0, nl=100, nm=100))]
+    orders = ['strided', 'contiguous', 'morton', 'hilbert']
+
+    for seeds_name, seeds in all_seeds:
+        ref_topo = None
+        for order in orders:
+            tstats = dict()
+            _, topo = viscid.timeit(viscid.calc_streamlines, B, seeds,
+                                    nr_procs=nr_procs, chunk_factor=chunk_factor,
+                                    seed_order=order, ibound=1.0,
+                                    output=viscid.OUTPUT_TOPOLOGY,
+                                    timeit_repeat=2, timeit_quiet=True,
+                                    timeit_stats=tstats)
+            viscid.logger.info("{0:>6s} seeds, {1:>10s} order: {2:.3g} s"
+                               "".format(seeds_name, order, tstats['min']))
+            if ref_topo is None:
+                ref_topo = np.array(topo)
+            elif not np.all(np.array(topo) == ref_topo):
+                raise RuntimeError("seed_order={0} changed the topology"
+                                   "".format(order))
+
+def run_test_packed(nr_procs=2, chunk_factor=3):
+    """Packed lines must be the same as the list of lines"""
+    B = viscid.make_dipole(n=(32, 32, 32), m=[0.2, 0.3, -0.9])
+    seeds = viscid.Sphere((0.0, 0.0, 0.0), 4.0, ntheta=20, nphi=24)
+
+    for order in ['strided', 'hilbert']:
+        kwargs = dict(nr_procs=nr_procs, chunk_factor=chunk_factor,
+                      seed_order=order, ibound=1.0, maxit=2000)
+        lines, topo = viscid.calc_streamlines(B, seeds, **kwargs)
+        plines, ptopo = viscid.calc_streamlines(B, seeds, packed=True,
+                                                **kwargs)
+        if not isinstance(plines, viscid.PackedLines):
+            raise RuntimeError("packed=True didn't give PackedLines")
+        if len(plines) != len(lines) or np.any(ptopo != topo):
+            raise RuntimeError("packed lines have different seeds")
+        for line, pline in zip(lines, plines):
+            if not np.array_equal(line, pline):
+                raise RuntimeError("packed line differs from unpacked line")
+
+        verts, _, conn, _ = viscid.vutil.prepare_lines(list(lines), topo,
+                                                       do_connections=True)
+        pverts, _, pconn, _ = viscid.vutil.prepare_lines(plines, ptopo,
+                                                         do_connections=True)
+        if not (np.array_equal(verts, pverts) and np.array_equal(conn, pconn)):
+            raise RuntimeError("prepare_lines differs for packed lines")
+
+        integral = viscid.integrate_along_lines(lines, B)
+        pintegral = viscid.integrate_along_lines(plines, B)
+        if not np.allclose(integral, pintegral):
+            raise RuntimeError("integrate_along_lines differs for packed lines")
+
+def run_test_adaptive_topology(coarse_step=16):
+    """Adaptive topology map must match tracing every seed"""
+    B = viscid.make_dipole(n=(64, 64, 64), l=(-20, -20, -20), h=(20, 20, 20))
+    B['z'] -= 0.002
+    seeds = viscid.Plane((0.0, 0.0, 0.0), (0, 1, 0), (1, 0, 0), 30.0, 30.0,
+                         nl=128, nm=128)
+    trace_opts = dict(ibound=2.0)
+
+    topo = viscid.calc_streamlines(B, seeds, output=viscid.OUTPUT_TOPOLOGY,
+                                   **trace_opts)[1]
+    atopo, nr_traces = viscid.calc_topology_adaptive(B, seeds,
+                                                     coarse_step=coarse_step,
+                                                     trace_opts=trace_opts,
+                                                     return_nr_traces=True)
+    viscid.logger.info("adaptive topology traced {0} of {1} seeds"
+                       "".format(nr_traces, topo.size))
+    if len(np.unique(topo)) < 3:
+        raise RuntimeError("test field doesn't have interesting topology")
+    if np.any(atopo.data != topo.data):
+        raise RuntimeError("adaptive topology differs at {0} seeds"
+                           "".format(np.sum(atopo.data != topo.data)))
+    if nr_traces > topo.size // 4:
+        raise RuntimeError("adaptive topology traced too many seeds")
+
+def run_test_dynamic_schedule(nr_procs=2):
+    """Dynamic scheduling must give the same lines as static chunks"""
+    B = viscid.make_dipole(n=(32, 32, 32), m=[0.2, 0.3, -0.9])
+    seeds = viscid.Sphere((0.0, 0.0, 0.0), 4.0, ntheta=20, nphi=24)
+    kwargs = dict(nr_procs=nr_procs, ibound=1.0, maxit=2000)
+
+    lines, topo = viscid.calc_streamlines(B, seeds, **kwargs)
+    for threads in (True, False):
+        for order in ['strided', 'hilbert']:
+            dlines, dtopo = viscid.calc_streamlines(B, seeds, threads=threads,
+                                                    seed_order=order,
+                                                    schedule='dynamic',
+                                                    **kwargs)
+            if np.any(dtopo != topo):
+                raise RuntimeError("schedule='dynamic' changed the topology")
+            for line, dline in zip(lines, dlines):
+                if not np.array_equal(line, dline):
+                    raise RuntimeError("schedule='dynamic' changed a line")
+
+def run_test_batched(nr_procs=2):
+    """The batched engine must give the same lines as the scalar one"""
+    x = 8.0 * np.sinh(np.linspace(-2.5, 2.5, 48))
+    B_nonuniform = viscid.empty([x, x, x], nr_comps=3, name='B', center='node')
+    viscid.fill_dipole(B_nonuniform, m=[0.2, 0.3, -0.9])
+    B_uniform = viscid.make_dipole(n=(32, 32, 32), m=[0.2, 0.3, -0.9])
+    seeds = viscid.Sphere((0.0, 0.0, 0.0), 4.0, ntheta=20, nphi=24)
+
+    for B in (B_uniform, B_nonuniform):
+        for method in ['euler1', 'rk2', 'rk4', 'euler1a', 'rk12', 'rk45']:
+            kwargs = dict(nr_procs=nr_procs, ibound=1.0, maxit=2000,
+                          method=method)
+            lines, topo = viscid.calc_streamlines(B, seeds, **kwargs)
+            blines, btopo = viscid.calc_streamlines(B, seeds, engine='batched',
+                                                    **kwargs)
+            if np.any(btopo != topo):
+                raise RuntimeError("batched {0} changed the topology"
+                                   "".format(method))
+            for line, bline in zip(lines, blines):
+                if not np.array_equal(line, bline):
+                    raise RuntimeError("batched {0} changed a line"
+                                       "".format(method))
+
+def run_test_pathlines():
+    """Pathlines in a uniform but accelerating flow are parabolas"""
+    class _Grid(object):
+        def __init__(self, time, v):
+            self.time = time
+            self.v = v
+
+        def __getitem__(self, name):
+            return self.v
+
+    x = np.linspace(-10.0, 10.0, 24)
+    grids = []
+    for it in range(6):
+        v = viscid.zeros([x, x, x], nr_comps=3, name='v', center='node')
+        v['x'] = 1.0 + 0.5 * it
+        v['z'] = -0.5
+        grids.append(_Grid(float(it), v))
+
+    seeds = viscid.Line((-5.0, -2.0, 4.0), (-5.0, 2.0, 4.0), 5)
+    for prefetch in (True, False):
+        lines, times = viscid.calc_pathlines(grids, seeds, obound1=[5, 10, 10],
+                                             prefetch=prefetch)
+        if len(lines) != 5 or not np.allclose(times, np.arange(6)):
+            raise RuntimeError("wrong number of pathlines / times")
+        # x = -5 + t + t**2 / 4 leaves the domain after t = 4
+        for line, y0 in zip(lines, np.linspace(-2.0, 2.0, 5)):
+            t = times[:line.shape[1]]
+            ideal = [-5.0 + t + 0.25 * t**2, y0 + 0.0 * t, 4.0 - 0.5 * t]
+            if line.shape[1] != 5 or not np.allclose(line, ideal):
+                raise RuntimeError("pathline doesn't match the ideal one")
+
+def run_test_concurrent(nr_threads=4):
+    """Overlapping calls to calc_streamlines must not interfere"""
+    from viscid.compat import futures
+
+    fields = [viscid.make_dipole(n=(32, 32, 32), m=[0.1 * i, 0.2, -0.9])
+              for i in range(nr_threads)]
+    seeds = viscid.Sphere((0.0, 0.0, 0.0), 3.0, ntheta=16, nphi=16)
+    kwargs = dict(ibound=1.0, maxit=2000)
+
+    ref = [viscid.calc_streamlines(fld, seeds, **kwargs) for fld in fields]
+
+    def _trace(i):
+        # each call also splits its work among threads or processes
+        threads = i % 2 == 0
+        return viscid.calc_streamlines(fields[i], seeds, nr_procs=2,
+                                       threads=threads, chunk_factor=2,
+                                       **kwargs)
+
+    with futures.ThreadPoolExecutor(max_workers=nr_threads) as executor:
+        results = list(executor.map(_trace, range(nr_threads)))
+
+    for (ref_lines, ref_topo), (lines, topo) in zip(ref, results):
+        if np.any(ref_topo != topo):
+            raise RuntimeError("concurrent streamlines changed topology")
+        for ref_line, line in zip(ref_lines, lines):
+            if not np.array_equal(ref_line, line):
+                raise RuntimeError("concurrent streamlines changed a line")
+
 def _main():
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--notwo", dest='notwo', action="store_true")
@@ -131,6 +321,34 @@ def _main():
     run_test(B, line, plot2d=plot2d, plot3d=plot3d, title='2D', show=args.show,
              ibound=0.07, obound0=obound0, obound1=obound1)
 
+    #################################################
+    viscid.logger.info("Comparing seed orderings...")
+    run_seed_order_benchmark()
+
+    #################################################
+    viscid.logger.info("Testing packed streamline output...")
+    run_test_packed()
+
+    #################################################
+    viscid.logger.info("Testing dynamic seed scheduling...")
+    run_test_dynamic_schedule()
+
+    #################################################
+    viscid.logger.info("Testing batched streamline engine...")
+    run_test_batched()
+
+    #################################################
+    viscid.logger.info("Testing pathlines...")
+    run_test_pathlines()
+
+    #################################################
+    viscid.logger.info("Testing adaptive topology...")
+    run_test_adaptive_topology()
+
+    #################################################
+    viscid.logger.info("Testing overlapping streamline calls...")
+    run_test_concurrent()
+
     #################################################
     viscid.logger.info("Testing field lines on 3d field...")
     B = viscid.make_dipole(m=[0.2, 0.3, -0.9])
@@ -41,10 +41,13 @@ __all__ = ['amr_field',
            'field',
            'fluidtrace',
            'grid',
+           'interp_plan',
            'mapfield',
+           'memory',
            'multiplot',
            'npdatetime',
            'parallel',
+           'probe',
            'pyeval',
            'seed',
            'sliceutil',
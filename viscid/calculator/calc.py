@@ -6,6 +6,7 @@ flexable would be useful down the line? """
 
 from __future__ import print_function
 from itertools import count
+import os
 
 import numpy as np
 
@@ -14,7 +15,7 @@ from viscid import field
 from viscid import logger
 from viscid import verror
 from viscid import seed
-from viscid.compat import izip, OrderedDict
+from viscid.compat import izip, OrderedDict, string_types
 
 try:
     from viscid.calculator import cycalc
@@ -22,6 +23,12 @@ try:
 except ImportError:
     has_cython = False
 
+try:
+    from viscid.cython import stencil
+    has_stencil = True
+except ImportError:
+    has_stencil = False
+
 try:
     from viscid.calculator import necalc
     has_numexpr = True
@@ -38,6 +45,10 @@ __all__ = ['neg', 'scale', 'add', 'diff', 'mul', 'axpby', 'relative_diff',
            'extend_boundaries_ndarr']
 
 
+# default size of one input slab when stencil operations are done in slabs
+slab_nbytes = 64 * 1024**2
+
+
 class Operation(object):
     default_backends = ["numexpr", "cython", "numpy"]
 
@@ -66,7 +77,7 @@ class Operation(object):
     def _get_imp(self, preferred, only=False):
         if not isinstance(preferred, (list, tuple)):
             if preferred is None:
-                preferred = list(self._imps.keys())
+                preferred = list(self.default_backends) + list(self._imps.keys())
             else:
                 preferred = [preferred]
 
@@ -115,6 +126,122 @@ class BinaryOperation(Operation):
                     ret.name = self.short_name
         return ret
 
+class StencilOperation(UnaryOperation):
+    """Unary operation on a finite difference stencil
+
+    Giving `slab_size` (number of points along the first axis) or `out`
+    walks the domain in slabs along the first axis. Each slab is read
+    with `halo` extra points on either side, lazily if the field isn't
+    loaded yet, so the backend's temporaries are only ever as big as
+    one slab. `out` can be an array of the right shape (say, a
+    numpy.memmap), or a filename for a new .npy memmap. The result is
+    identical to doing the whole domain at once.
+    """
+    halo = 1
+
+    def __call__(self, a, slab_size=None, out=None, **kwargs):
+        if slab_size is None and out is None:
+            return super(StencilOperation, self).__call__(a, **kwargs)
+        ret = self._call_in_slabs(a, slab_size, out, **kwargs)
+        ret.name = "{0} {1}".format(self.short_name, a.name)
+        return ret
+
+    def _call_in_slabs(self, a, slab_size, out, **kwargs):
+        if not (a.iscentered("Cell") or a.iscentered("Node")):
+            raise NotImplementedError("{0} can only be done in slabs for cell "
+                                      "and node centered fields"
+                                      "".format(self.opname))
+        off = 0 if kwargs.get("bnd", True) else 1
+        n = a.sshape[0]
+        nout = n - 2 * off
+        if nout < 1:
+            raise ValueError("{0} of {1} has no points along {2} (it has {3} "
+                             "points and bnd={4})".format(self.opname, a.name,
+                                                          a.crds.axes[0], n,
+                                                          not off))
+        if slab_size is None:
+            plane_nbytes = a.dtype.itemsize * int(np.prod(a.shape)) // n
+            slab_size = max(1, slab_nbytes // plane_nbytes)
+
+        ret = None
+        for o0 in range(0, nout, slab_size):
+            o1 = min(o0 + slab_size, nout)
+            # output o is centered on input o + off, so the points of the
+            # slab's result that are not in the halo start at o0 - s0
+            s0 = max(o0 + off - self.halo, 0)
+            s1 = min(o1 + off + self.halo, n)
+            r, dat = self._apply_to_slab(_read_slab(a, s0, s1), o0 - s0,
+                                         o1 - s0, **kwargs)
+            dax = _first_axis(r)
+            dest_slc = [slice(None)] * dat.ndim
+            dest_slc[dax] = slice(o0, o1)
+
+            if ret is None:
+                shape = list(dat.shape)
+                shape[dax] = nout
+                arr = _make_slab_output(out, shape, r.dtype)
+                if off:
+                    crds = a.crds.slice_keep(np.s_[1:-1, 1:-1, 1:-1])
+                else:
+                    crds = a.crds
+                ret = r.wrap(arr, context=dict(crds=crds))
+            arr[tuple(dest_slc)] = dat
+
+        if hasattr(arr, "flush"):
+            arr.flush()
+        return ret
+
+    def _apply_to_slab(self, slab, i0, i1, **kwargs):
+        """Do the operation on a slab, keeping results i0:i1 of the first axis
+
+        Returns:
+            (result, data) where data is a view of result.data
+        """
+        r = super(StencilOperation, self).__call__(slab, **kwargs)
+        slc = [slice(None)] * r.data.ndim
+        slc[_first_axis(r)] = slice(i0, i1)
+        return r, r.data[tuple(slc)]
+
+def _first_axis(fld):
+    """index of the first spatial axis in fld.data"""
+    return 1 if fld.nr_comps and fld.nr_comp == 0 else 0
+
+def _read_slab(fld, s0, s1):
+    """points s0:s1 along the first axis of fld, with exact crds"""
+    slab = fld.slice_keep("{0}={1}:{2}".format(fld.crds.axes[0], s0, s1))
+    return slab.wrap(slab.data, context=dict(crds=_slab_crds(fld, s0, s1)))
+
+def _slab_crds(fld, s0, s1):
+    """crds of points s0:s1 along the first axis of fld
+
+    Unlike slicing, the crd values are exactly the same as fld's.
+    Slicing uniform crds recomputes the values from the new extent,
+    which changes the last bit of the differences.
+    """
+    n0, n1 = (s0, s1 + 1) if fld.iscentered("Cell") else (s0, s1)
+    clist = []
+    for i, (ax, nc, cc) in enumerate(zip(fld.crds.axes, fld.crds.get_crds_nc(),
+                                         fld.crds.get_crds_cc())):
+        if i == 0:
+            nc, cc = nc[n0:n1], cc[n0:n1 - 1]
+        clist.append((ax, nc, cc))
+    crdtype = fld.crds.crdtype
+    if 'nonuniform' not in crdtype:
+        crdtype = crdtype.replace('uniform', 'nonuniform')
+    return viscid.wrap_crds(crdtype, clist)
+
+def _make_slab_output(out, shape, dtype):
+    if out is None:
+        return np.empty(shape, dtype=dtype)
+    elif isinstance(out, string_types):
+        fname = os.path.expanduser(os.path.expandvars(out))
+        return np.lib.format.open_memmap(fname, mode='w+', dtype=dtype,
+                                         shape=tuple(shape))
+    elif list(out.shape) != list(shape):
+        raise ValueError("out has shape {0}, but the result has shape {1}"
+                         "".format(list(out.shape), shape))
+    return out
+
 neg = UnaryOperation("neg", "-", doc="Callable, calculates -a")
 scale = BinaryOperation("scale", "*=", doc="Callable, scales a")
 add = BinaryOperation("add", "+", doc="Callable, calculates a + b")
@@ -135,9 +262,9 @@ project = BinaryOperation("project", "dot mag",
                           doc="Callable, scalar projection of a onto b; a dot b / norm(b)")
 normalize = UnaryOperation("normalize", "normalize",
                            doc="Callable, divide a vector field by its magnitude")
-grad = UnaryOperation("grad", "grad", doc="Callable, gradient of a scalar field")
-div = UnaryOperation("div", "div", doc="Callable, divergence of a vector field")
-curl = UnaryOperation("curl", "curl", doc="Callable, curl of a vector field")
+grad = StencilOperation("grad", "grad", doc="Callable, gradient of a scalar field")
+div = StencilOperation("div", "div", doc="Callable, divergence of a vector field")
+curl = StencilOperation("curl", "curl", doc="Callable, curl of a vector field")
 
 if has_numexpr:
     neg.add_implementation("numexpr", necalc.neg)
@@ -323,6 +450,79 @@ def _curl_np(fld, bnd=True):
                             parents=[fld])
 curl.add_implementation("numpy", _curl_np)
 
+def _stencil_setup(fld, bnd):
+    """crds, per-axis stencils and index offset for the cython backends
+
+    Returns None if the cython stencils can't reproduce the numpy
+    result, say for non-3d fields or integer dtypes.
+    """
+    if fld.nr_sdims != 3 or fld.dtype not in (np.float32, np.float64):
+        return None
+    if fld.iscentered("Cell"):
+        crd_arrs = fld.get_crds_cc()
+    elif fld.iscentered("Node"):
+        crd_arrs = fld.get_crds_nc()
+    else:
+        return None
+    if len(set(crd.dtype for crd in crd_arrs)) != 1:
+        return None
+    if crd_arrs[0].dtype not in (np.float32, np.float64):
+        return None
+
+    stencils = []
+    for crd in crd_arrs:
+        stencils += stencil.axis_stencil(crd, bnd)
+
+    if bnd:
+        crds = fld.crds
+    else:
+        crds = fld.crds.slice_keep(np.s_[1:-1, 1:-1, 1:-1])
+    dtype = np.result_type(fld.dtype, crd_arrs[0].dtype)
+    return crds, stencils, int(not bnd), dtype
+
+def _grad_cy(fld, bnd=True):
+    """2nd order centeral diff, 1st order @ boundaries if bnd"""
+    setup = _stencil_setup(fld, bnd)
+    if setup is None:
+        return _grad_np(fld, bnd=bnd)
+    crds, stencils, off, _ = setup
+    g = viscid.empty(crds, nr_comps=3, center=fld.center)
+    gx, gy, gz = g.component_views()
+    stencil.grad(fld.data, *(stencils + [off, gx, gy, gz]))
+    return g
+
+def _div_cy(fld, bnd=True):
+    """2nd order centeral diff, 1st order @ boundaries if bnd"""
+    if fld.iscentered("Face"):
+        return viscid.div_fc(fld, bnd=bnd)
+    setup = _stencil_setup(fld, bnd)
+    if setup is None:
+        return _div_np(fld, bnd=bnd)
+    crds, stencils, off, dtype = setup
+    d = viscid.empty(crds, dtype=dtype, name="div " + fld.name,
+                     center=fld.center, time=fld.time, parents=[fld])
+    vx, vy, vz = fld.component_views()
+    stencil.div(vx, vy, vz, *(stencils + [off, d.data]))
+    return d
+
+def _curl_cy(fld, bnd=True):
+    """2nd order centeral diff, 1st order @ boundaries if bnd"""
+    setup = _stencil_setup(fld, bnd)
+    if setup is None:
+        return _curl_np(fld, bnd=bnd)
+    crds, stencils, off, dtype = setup
+    c = viscid.empty(crds, dtype=dtype, nr_comps=3, name="curl " + fld.name,
+                     center=fld.center, time=fld.time, parents=[fld])
+    cx, cy, cz = c.component_views()
+    vx, vy, vz = fld.component_views()
+    stencil.curl(vx, vy, vz, *(stencils + [off, cx, cy, cz]))
+    return c
+
+if has_stencil:
+    grad.add_implementation("cython", _grad_cy)
+    div.add_implementation("cython", _div_cy)
+    curl.add_implementation("cython", _curl_cy)
+
 def convective_deriv(a, b=None, bnd=True):
     r"""Compute (a \dot \nabla) b for vector fields a and b"""
     # [(B \dot \nabla) B]_j = B_i \partial_i B_j
@@ -457,7 +657,7 @@ def integrate_along_lines(lines, fld, reduction="dot", mask_func=None,
 
     Args:
         lines (list): list of 3xN ndarrays, N needs not be the same for
-            all lines
+            all lines, or a :py:class:`viscid.PackedLines`
         fld (Field): Field to interpolate / integrate
         reduction (str): If fld is a vector field, what quantity to
             integrate. Can be "dot" to dot the vectors with ds along
@@ -469,8 +669,12 @@ def integrate_along_lines(lines, fld, reduction="dot", mask_func=None,
     """
     arr = np.zeros((len(lines),), dtype=fld.dtype)
 
-    cum_n = np.cumsum([0] + [line.shape[1] for line in lines])
-    all_verts = np.concatenate(lines, axis=1)
+    if isinstance(lines, viscid.PackedLines):
+        cum_n = lines.offsets
+        all_verts = lines.vertices
+    else:
+        cum_n = np.cumsum([0] + [line.shape[1] for line in lines])
+        all_verts = np.concatenate(lines, axis=1)
     fld_on_verts = viscid.interp(fld, all_verts, kind=interp_kind).data
 
     for i, start, stop in izip(count(), cum_n[:-1], cum_n[1:]):
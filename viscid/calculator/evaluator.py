@@ -10,6 +10,8 @@ in their viscidrc.
 """
 
 from __future__ import print_function, division
+import ast
+import numbers
 import re
 
 import numpy as np
@@ -23,11 +25,34 @@ except ImportError:
 from viscid import logger
 from viscid import field
 from viscid.calculator import calc
+from viscid.compat import OrderedDict
 
 enabled = False
+# bytes of input read per block by the numexpr evaluator
+block_nbytes = 8 * 1024**2
 
 __all__ = ["evaluate"]
 
+# functions that numexpr knows, these work component-wise on vectors
+_NE_FUNCS = ["where", "sin", "cos", "tan", "arcsin", "arccos", "arctan",
+             "arctan2", "sinh", "cosh", "tanh", "arcsinh", "arccosh",
+             "arctanh", "log", "log10", "log1p", "exp", "expm1", "sqrt",
+             "abs", "conj", "real", "imag", "complex"]
+# functions that need neighboring points, and are done per block with
+# the calculator's stencil operations before numexpr runs
+_STENCIL_FUNCS = {"curl": calc.curl, "div": calc.div, "grad": calc.grad}
+_BINOPS = {ast.Add: "+", ast.Sub: "-", ast.Mult: "*", ast.Div: "/",
+           ast.Pow: "**", ast.Mod: "%", ast.BitAnd: "&", ast.BitOr: "|"}
+_UNARYOPS = {ast.USub: "-", ast.UAdd: "+", ast.Invert: "~", ast.Not: "~"}
+_CMPOPS = {ast.Lt: "<", ast.LtE: "<=", ast.Gt: ">", ast.GtE: ">=",
+           ast.Eq: "==", ast.NotEq: "!="}
+_BOOLOPS = {ast.And: "&", ast.Or: "|"}
+_CONSTANTS = tuple(getattr(ast, name) for name in ("Num", "NameConstant", "Constant")
+                   if hasattr(ast, name))
+
+_compiled = OrderedDict()
+_max_compiled = 256
+
 
 def evaluate(grid, result_name, eqn, try_numexpr=True, slc=None):
     """Evaluate an equation on a grid
@@ -49,6 +74,16 @@ def evaluate(grid, result_name, eqn, try_numexpr=True, slc=None):
             >> speed = f["speed=sqrt(vx**2+vy**2+vz**2)"]
             <viscid.field.ScalarField object at ...>
 
+    Note:
+        With numexpr, equations are parsed once and cached, and are
+        evaluated a block of the first axis at a time (about
+        `block_nbytes` of input per block), so fields that aren't
+        loaded yet are only read one block at a time. Vector fields
+        work component-wise, and dot, cross, magnitude, curl, div and
+        grad are done as part of the same pass, as in
+        "jpar=dot(curl(b), b) / magnitude(b)". Anything else falls
+        back to numpy.
+
     Parameters:
         grid: a grid instance where the fields live
         result_name (str): Used for the name and pretty_name of the
@@ -76,8 +111,168 @@ def evaluate(grid, result_name, eqn, try_numexpr=True, slc=None):
                         "".format(eqn))
     return _evaluate_numpy(grid, result_name, eqn, slc=slc)
 
-def _evaluate_numexpr(grid, result_name, eqn, slc=None):
+class _Expression(object):
+    """An equation parsed once, and lowered to numexpr
+
+    Vector symbols are expanded into one numexpr expression per
+    component, so things like dot / cross / magnitude are fused into
+    the expression. curl / div / grad of a symbol become extra
+    variables that are filled in per block. Lowering depends on which
+    symbols are vectors, so it's cached for each set of symbol kinds.
     """
+    def __init__(self, eqn):
+        self.eqn = eqn
+        try:
+            self.tree = ast.parse(eqn.strip(), mode="eval").body
+        except SyntaxError as e:
+            raise TypeError("Can't parse '{0}': {1}".format(eqn, e))
+        funcs = set(node.func for node in ast.walk(self.tree)
+                    if isinstance(node, ast.Call))
+        self.symbols = sorted(set(node.id for node in ast.walk(self.tree)
+                                  if isinstance(node, ast.Name) and
+                                  node not in funcs))
+        self._lowered = dict()
+
+    def lower(self, nr_comps):
+        """Lower to numexpr
+
+        Args:
+            nr_comps (dict): number of components of each symbol, 0 for
+                scalars
+
+        Returns:
+            (parts, stencils) where parts is a list of numexpr strings,
+            one for a scalar result or one per component for a vector,
+            and stencils is a list of (function name, symbol) whose
+            results are the variables STENCILi, or STENCILi_j for
+            component j of a vector
+        """
+        key = tuple(sorted(nr_comps.items()))
+        if key not in self._lowered:
+            stencils = []
+            ret = self._lower(self.tree, nr_comps, stencils)
+            parts = ret if isinstance(ret, list) else [ret]
+            self._lowered[key] = (parts, stencils)
+        return self._lowered[key]
+
+    def _lower(self, node, nr_comps, stencils):
+        """Returns a numexpr string for a scalar, or a list for a vector"""
+        if isinstance(node, ast.Name):
+            n = nr_comps[node.id]
+            if n:
+                return ["SALT{0}_{1}".format(node.id, i) for i in range(n)]
+            return "SALT" + node.id
+        elif isinstance(node, _CONSTANTS):
+            value = node.n if hasattr(node, "n") else node.value
+            if isinstance(value, numbers.Number):
+                return repr(value)
+        elif isinstance(node, ast.BinOp) and type(node.op) in _BINOPS:
+            return self._elementwise("({0} " + _BINOPS[type(node.op)] + " {1})",
+                                     [node.left, node.right], nr_comps, stencils)
+        elif isinstance(node, ast.UnaryOp) and type(node.op) in _UNARYOPS:
+            return self._elementwise("(" + _UNARYOPS[type(node.op)] + "{0})",
+                                     [node.operand], nr_comps, stencils)
+        elif (isinstance(node, ast.Compare) and len(node.ops) == 1 and
+              type(node.ops[0]) in _CMPOPS):
+            return self._elementwise("({0} " + _CMPOPS[type(node.ops[0])] + " {1})",
+                                     [node.left, node.comparators[0]], nr_comps,
+                                     stencils)
+        elif isinstance(node, ast.BoolOp) and type(node.op) in _BOOLOPS:
+            fmt = (" " + _BOOLOPS[type(node.op)] + " ").join(
+                "{{{0}}}".format(i) for i in range(len(node.values)))
+            return self._elementwise("(" + fmt + ")", node.values, nr_comps,
+                                     stencils)
+        elif (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and
+              not getattr(node, "keywords", None)):
+            return self._lower_call(node.func.id, node.args, nr_comps, stencils)
+        raise TypeError("numexpr evaluator can't handle '{0}' in '{1}'"
+                        "".format(type(node).__name__, self.eqn))
+
+    def _lower_call(self, func, args, nr_comps, stencils):
+        if func in _STENCIL_FUNCS:
+            if len(args) != 1 or not isinstance(args[0], ast.Name):
+                raise TypeError("{0} only works on a field, not an expression"
+                                "".format(func))
+            stencil = (func, args[0].id)
+            if stencil not in stencils:
+                stencils.append(stencil)
+            name = "STENCIL{0}".format(stencils.index(stencil))
+            n = nr_comps[args[0].id]
+            if (func == "grad") == bool(n):
+                raise TypeError("{0} of a {1} field"
+                                "".format(func, "vector" if n else "scalar"))
+            if func == "div":
+                return name
+            return ["{0}_{1}".format(name, i) for i in range(n or 3)]
+
+        if func in ("dot", "cross", "magnitude"):
+            vecs = [self._lower(arg, nr_comps, stencils) for arg in args]
+            if (len(vecs) != (1 if func == "magnitude" else 2) or
+                    not all(isinstance(v, list) for v in vecs) or
+                    len(set(len(v) for v in vecs)) != 1):
+                raise TypeError("{0} needs vector arguments of the same size"
+                                "".format(func))
+            if func == "magnitude":
+                return "sqrt({0})".format(" + ".join("{0} * {0}".format(c)
+                                                     for c in vecs[0]))
+            a, b = vecs
+            if func == "dot":
+                return "({0})".format(" + ".join("{0} * {1}".format(ai, bi)
+                                                 for ai, bi in zip(a, b)))
+            if len(a) != 3:
+                raise TypeError("cross only works on 3 component vectors")
+            return ["({0} * {1} - {2} * {3})".format(a[1], b[2], a[2], b[1]),
+                    "({0} * {1} - {2} * {3})".format(a[2], b[0], a[0], b[2]),
+                    "({0} * {1} - {2} * {3})".format(a[0], b[1], a[1], b[0])]
+
+        if func in _NE_FUNCS:
+            fmt = func + "(" + ", ".join("{{{0}}}".format(i)
+                                         for i in range(len(args))) + ")"
+            return self._elementwise(fmt, args, nr_comps, stencils)
+        raise TypeError("numexpr evaluator doesn't know the function '{0}'"
+                        "".format(func))
+
+    def _elementwise(self, fmt, args, nr_comps, stencils):
+        parts = [self._lower(arg, nr_comps, stencils) for arg in args]
+        sizes = set(len(p) for p in parts if isinstance(p, list))
+        if not sizes:
+            return fmt.format(*parts)
+        if len(sizes) > 1:
+            raise TypeError("vectors with different numbers of components "
+                            "in '{0}'".format(self.eqn))
+        n = sizes.pop()
+        return [fmt.format(*[p[i] if isinstance(p, list) else p for p in parts])
+                for i in range(n)]
+
+def _compile(eqn):
+    """Parse eqn, or get it from the cache of compiled equations"""
+    try:
+        expr = _compiled.pop(eqn)
+    except KeyError:
+        expr = _Expression(eqn)
+    _compiled[eqn] = expr
+    while len(_compiled) > _max_compiled:
+        _compiled.popitem(last=False)
+    return expr
+
+def _components(fld, dat):
+    """list of arrays of each component of dat, or [dat] for scalars"""
+    if not fld.nr_comps:
+        return [dat]
+    slc = [slice(None)] * dat.ndim
+    comps = []
+    for i in range(fld.nr_comps):
+        slc[fld.nr_comp] = i
+        comps.append(dat[tuple(slc)])
+    return comps
+
+def _evaluate_numexpr(grid, result_name, eqn, slc=None):
+    """Evaluate with numexpr, one block of the first axis at a time
+
+    Each block of each field is read once (with one extra point on
+    either side for fields used in curl / div / grad), so the fields
+    are never loaded all at once unless they already were.
+
     Returns:
         Field
 
@@ -88,44 +283,70 @@ def _evaluate_numexpr(grid, result_name, eqn, slc=None):
     if not _has_numexpr:
         raise RuntimeError("Evaluate not enabled, or numexpr not installed.")
 
-    # salt symbols that don't look like math functions and look them up
-    # in the grid
-    salt = "SALT"
-    _symbol_re = r"\b([_A-Za-z][_a-zA-Z0-9]*)\b"
-    var_re = _symbol_re + r"(?!\s*\()"
-    flds = []
     # for security
     eqn = eqn.replace("__", "")
-    local_dict = dict()
+    expr = _compile(eqn)
 
-    def var_salter(symbols):
-        symbol = symbols.groups()[0]
-        salted_symbol = salt + symbol
-        # yes, i'm not using dict.update on purpose since grid's
-        # getitem might copy the array
-        if salted_symbol not in local_dict:
-            this_fld = grid.get_field(symbol, slc=slc)
-            local_dict[salted_symbol] = this_fld
-            if len(flds) == 0:
-                if isinstance(this_fld, field.Field):
-                    flds.append(this_fld)
+    flds = OrderedDict()
+    for symbol in expr.symbols:
+        flds[symbol] = grid.get_field(symbol, slc=slc)
+        if not isinstance(flds[symbol], field.Field):
+            raise RuntimeError("reduced to scalar, no need for numexpr")
+    if not flds:
+        raise RuntimeError("no fields in '{0}', no need for numexpr"
+                           "".format(eqn))
+    parts, stencils = expr.lower(dict((sym, fld.nr_comps)
+                                      for sym, fld in flds.items()))
+    stencil_syms = set(sym for _, sym in stencils)
+
+    ref = flds[expr.symbols[0]]
+    n = ref.sshape[0]
+    plane_nbytes = sum(fld.dtype.itemsize * int(np.prod(fld.shape)) // n
+                       for fld in flds.values())
+    nb = max(1, block_nbytes // plane_nbytes)
+
+    arr = None
+    for o0 in range(0, n, nb):
+        o1 = min(o0 + nb, n)
+        local_dict = dict()
+        for sym, fld in flds.items():
+            halo = calc.StencilOperation.halo if sym in stencil_syms else 0
+            s0, s1 = max(o0 - halo, 0), min(o1 + halo, n)
+            slab = calc._read_slab(fld, s0, s1)  # pylint: disable=protected-access
+            dslc = [slice(None)] * slab.data.ndim
+            dslc[calc._first_axis(slab)] = slice(o0 - s0, o1 - s0)  # pylint: disable=protected-access
+            comps = _components(slab, slab.data[tuple(dslc)])
+            if fld.nr_comps:
+                for i, comp in enumerate(comps):
+                    local_dict["SALT{0}_{1}".format(sym, i)] = comp
+            else:
+                local_dict["SALT" + sym] = comps[0]
+
+            for i, (func, stencil_sym) in enumerate(stencils):
+                if stencil_sym != sym:
+                    continue
+                op = _STENCIL_FUNCS[func]
+                r, dat = op._apply_to_slab(slab, o0 - s0, o1 - s0)  # pylint: disable=protected-access
+                comps = _components(r, dat)
+                if r.nr_comps:
+                    for j, comp in enumerate(comps):
+                        local_dict["STENCIL{0}_{1}".format(i, j)] = comp
                 else:
-                    raise RuntimeError("reduced to scalar, no need for numexpr")
-        return salted_symbol
+                    local_dict["STENCIL{0}".format(i)] = comps[0]
 
-    salted_eqn = re.sub(var_re, var_salter, eqn)
+        block = [ne.evaluate(part, local_dict=local_dict,
+                             global_dict={"__builtins__": {}})
+                 for part in parts]
+        if arr is None:
+            dtype = np.result_type(*block)
+            arr = np.empty([len(parts)] + list(ref.sshape), dtype=dtype)
+        for i, b in enumerate(block):
+            arr[i, o0:o1] = b
 
-    arr = ne.evaluate(salted_eqn, local_dict=local_dict,
-                      global_dict={"__builtins__": {}})
-
-    # FIXME: actually detect the type of field instead of asserting it's
-    # a scalar... also maybe auto-detect reduction operations?
-    if len(flds) > 0:
-        ctx = dict(name=result_name, pretty_name=result_name)
-        return flds[0].wrap(arr, context=ctx)
-    else:
-        logger.warn("Strange input to numexpr evaluator: %s", eqn)
-        return field.wrap_field(arr, grid.crds, name=result_name)
+    ctx = dict(name=result_name, pretty_name=result_name)
+    if len(parts) == 1:
+        return ref.wrap(arr[0], context=ctx, fldtype="scalar")
+    return ref.wrap(arr, context=ctx, fldtype="vector")
 
 def _evaluate_numpy(grid, result_name, eqn, slc=None):
     """
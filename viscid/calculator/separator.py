@@ -14,7 +14,7 @@ UNEVEN_HALF = 0.65
 
 
 __all__ = ["trace_separator", "topology_bitor_clusters", "get_sep_pts_bitor",
-           "get_sep_pts_bisect"]
+           "get_sep_pts_bisect", "calc_topology_adaptive"]
 
 
 def trace_separator(grid, b_slcstr="x=-25f:15f, y=-30f:30f, z=-15f:15f",
@@ -260,6 +260,126 @@ def get_sep_pts_bitor(fld, seed, trace_opts=None, make_3d=True, **kwargs):
         pts = seed.uv_to_3d(pts)
     return pts
 
+def calc_topology_adaptive(fld, seed, coarse_step=16, trace_opts=None,
+                           wrap=True, return_nr_traces=False):
+    """Topology map of a 2d seed that only traces near boundaries
+
+    Traces a coarse lattice of every `coarse_step`-th seed point, then
+    recursively splits cells whose 4 corners have different topologies
+    into quadrents, tracing only the new corners. Cells whose corners
+    all agree are filled with that topology without tracing the points
+    inside them.
+
+    Note:
+        A region of different topology that fits entirely inside a
+        coarse cell without touching its corners will be missed, so
+        `coarse_step` should be smaller than the smallest feature of
+        interest.
+
+    Args:
+        fld (VectorField): Magnetic Field
+        seed (viscid.seed.SeedGen): Any Seed generator with a 2d uv
+            representation, like a Plane or Sphere
+        coarse_step (int): spacing of the initial lattice in seed
+            points, must be >= 1
+        trace_opts (dict): kwargs for calc_streamlines
+        wrap (bool): if true, then call seed.wrap_field on the result
+        return_nr_traces (bool): if true, also return how many
+            streamlines were actually traced
+
+    Returns:
+        Topology with one value for every point in seed, the same as
+        ``calc_streamlines(fld, seed, **trace_opts)[1]`` in regions
+        that are resolved. If `return_nr_traces`, a tuple of
+        (topology, nr_traces).
+
+    Raises:
+        ValueError: if seed does not have a 2d uv representation
+    """
+    if trace_opts is None:
+        trace_opts = dict()
+    else:
+        trace_opts = dict(trace_opts)
+    trace_opts['output'] = viscid.OUTPUT_TOPOLOGY
+    trace_opts['wrap'] = False
+
+    uv_shape = tuple(seed.uv_shape)
+    if len(uv_shape) != 2 or np.prod(uv_shape) != seed.get_nr_points():
+        raise ValueError("Adaptive topology needs a seed with a 2d uv shape, "
+                         "not {0}".format(uv_shape))
+    nu, nv = uv_shape
+    coarse_step = max(int(coarse_step), 1)
+
+    if min(nu, nv) < 2 or coarse_step == 1:
+        topo = viscid.calc_streamlines(fld, seed, **trace_opts)[1]
+        nr_traces = len(topo)
+    else:
+        topo, nr_traces = _adaptive_topology(fld, seed, coarse_step,
+                                             trace_opts)
+
+    if wrap:
+        topo = seed.wrap_field(topo, name="Topology")
+    if return_nr_traces:
+        return topo, nr_traces
+    return topo
+
+def _adaptive_topology(fld, seed, coarse_step, trace_opts):
+    nu, nv = seed.uv_shape
+    pts = seed.get_points().reshape(3, nu, nv)
+
+    traced = np.zeros((nu, nv), dtype='i')
+    is_traced = np.zeros((nu, nv), dtype=np.bool_)
+    nr_traces = [0]
+
+    def _trace_corners(i0, i1, j0, j1):
+        iu = np.concatenate([i0, i0, i1, i1])
+        iv = np.concatenate([j0, j1, j0, j1])
+        flat = np.unique(iu * nv + iv)
+        flat = flat[~is_traced.reshape(-1)[flat]]
+        if len(flat):
+            iu, iv = np.unravel_index(flat, (nu, nv))
+            seeds = viscid.Point(pts[:, iu, iv])
+            traced[iu, iv] = viscid.calc_streamlines(fld, seeds,
+                                                     **trace_opts)[1]
+            is_traced[iu, iv] = True
+            nr_traces[0] += len(flat)
+
+    # coarse lattice, always including the last row / column
+    lat_u = np.union1d(np.arange(0, nu, coarse_step), [nu - 1])
+    lat_v = np.union1d(np.arange(0, nv, coarse_step), [nv - 1])
+    j0, i0 = np.meshgrid(lat_v[:-1], lat_u[:-1])
+    j1, i1 = np.meshgrid(lat_v[1:], lat_u[1:])
+    i0, i1, j0, j1 = [a.reshape(-1) for a in (i0, i1, j0, j1)]
+
+    # topology inherited from the corners of uniform cells
+    topo = np.zeros((nu, nv), dtype='i')
+
+    while len(i0):
+        _trace_corners(i0, i1, j0, j1)
+        c00 = traced[i0, j0]
+        uniform = ((c00 == traced[i0, j1]) & (c00 == traced[i1, j0]) &
+                   (c00 == traced[i1, j1]))
+        for a, b, c, d, val in zip(i0[uniform], i1[uniform], j0[uniform],
+                                   j1[uniform], c00[uniform]):
+            topo[a:b + 1, c:d + 1] = val
+
+        # split cells with mixed corners into quadrents; cells that are
+        # one point wide in a direction only split in the other one
+        split = ~uniform & ((i1 - i0 > 1) | (j1 - j0 > 1))
+        i0, i1, j0, j1 = i0[split], i1[split], j0[split], j1[split]
+        im, jm = (i0 + i1) // 2, (j0 + j1) // 2
+        i0, i1 = (np.concatenate([i0, i0, im, im]),
+                  np.concatenate([im, im, i1, i1]))
+        j0, j1 = (np.concatenate([j0, jm, j0, jm]),
+                  np.concatenate([jm, j1, jm, j1]))
+        keep = (i1 > i0) & (j1 > j0)
+        i0, i1, j0, j1 = i0[keep], i1[keep], j0[keep], j1[keep]
+
+    # corners of cells that were split may have inherited a topology
+    # from a neighbor, so what was actually traced wins
+    topo[is_traced] = traced[is_traced]
+    return topo.reshape(-1), nr_traces[0]
+
 def perimeter_check_bitwise_or(arr):
     """Does perimeter of arr topologies contain a separator?
 
@@ -49,10 +49,41 @@ def _xdmf_default_loader(href, parse, encoding=None, parser=None):
         data = None
     return data
 
-def include(elem, loader=None, base_url="./", _parent_hrefs=None):
-    """ base_url is just a file path """
+def _prefetching_loader(elem, loader, base_url, nr_procs):
+    """Load all xml files directly included by elem on a thread pool
+
+    Returns:
+        a loader that hands out the prefetched trees, and falls back to
+        `loader` for anything else
+    """
+    from viscid.compat import futures
+
+    hrefs = []
+    for e in elem:
+        if e.tag == XINCLUDE_INCLUDE and e.get("parse", "xml") == "xml":
+            hrefs.append((urljoin(base_url, e.get("href")), e))
+    if len(hrefs) < 2:
+        return loader
+
+    with futures.ThreadPoolExecutor(max_workers=nr_procs) as executor:
+        nodes = list(executor.map(lambda args: loader(args[0], "xml", args[1]),
+                                  hrefs))
+    prefetched = dict((href, node) for (href, _), node in zip(hrefs, nodes))
+
+    def _loader(href, parse, *args, **kwargs):
+        if parse == "xml" and href in prefetched:
+            return prefetched.pop(href)
+        return loader(href, parse, *args, **kwargs)
+    return _loader
+
+def include(elem, loader=None, base_url="./", _parent_hrefs=None,
+            nr_procs=1):
+    """ base_url is just a file path, if nr_procs > 1, the files directly
+    included by elem are read on that many threads """
     if loader is None:
         loader = _xdmf_default_loader
+    if nr_procs > 1:
+        loader = _prefetching_loader(elem, loader, base_url, nr_procs)
 
     # TODO: for some nested includes, urljoin is adding an extra / which
     # means this way of detecting infinite recursion doesn't work
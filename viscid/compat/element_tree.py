@@ -25,6 +25,7 @@ try:
         # TODO: ignore if an xincluded xdmf file doesn't exist?
         if base_url:
             logger.warn("lxml will ignore base_url: %s", base_url)
+        kwargs.pop("nr_procs", None)
         return tree.xinclude(**kwargs)
 
 except ImportError:
@@ -43,7 +44,8 @@ except ImportError:
         Args:
             tree (Tree): The object returned by parse
             base_url (str): Interpret xinclude paths relative to this
-            **kwargs: passed to _xdmf_include.include
+            **kwargs: passed to _xdmf_include.include, such as
+                nr_procs to read included files concurrently
         """
         root = tree.getroot()
         _xdmf_include.include(root, base_url=base_url, **kwargs)
@@ -1183,12 +1183,19 @@ class StructuredCrds(Coordinates):
     def points(self, center=None, **kwargs):
         return self.get_points(center=center, **kwargs)
 
-    def get_points(self, center="none", **kwargs):
+    def get_points(self, center="none", slc=None, **kwargs):
         """returns all points in a grid defined by crds as a
-        nr_dims x nr_points ndarray
+        nr_dims x nr_points ndarray, or just the points [:, slc]
         """
         crds = self.get_crds(shaped=False, center=center)
         shape = [len(c) for c in crds]
+        if slc is not None:
+            inds = np.arange(*slc.indices(int(np.prod(shape))))
+            inds = np.unravel_index(inds, shape)
+            arr = np.empty([len(shape)] + [len(inds[0])])
+            for i, (c, ind) in enumerate(izip(crds, inds)):
+                arr[i, :] = c[ind]
+            return arr
         arr = np.empty([len(shape)] + [np.prod(shape)])
         for i, c in enumerate(crds):
             arr[i, :] = np.repeat(np.tile(c, np.prod(shape[:i])),
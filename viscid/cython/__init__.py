@@ -15,6 +15,7 @@ mess.
 __all__ = ["cyamr", "cycalc", "cyfield", "streamline", "integrate",
            "null_tools",
            "interp", "interp_nearest", "interp_linear", "interp_trilin",
+           "interp_many",
            "calc_streamlines", "streamlines", "find_classified_nulls",
            "find_nulls"]
 
@@ -69,6 +70,7 @@ try:
     from viscid.cython.cycalc import interp_nearest
     from viscid.cython.cycalc import interp_linear
     from viscid.cython.cycalc import interp_trilin
+    from viscid.cython.cycalc import interp_many
     from viscid.cython.streamline import calc_streamlines
     streamlines = calc_streamlines
     from viscid.cython.null_tools import find_classified_nulls
@@ -106,6 +108,9 @@ except ImportError as e:
     def interp_trilin(*args, **kwargs):  # pylint: disable=unused-argument
         """CythonNotBuilt Proxy"""
         raise CythonNotBuilt(cython_msg.format("interp_trilin"))
+    def interp_many(*args, **kwargs):  # pylint: disable=unused-argument
+        """CythonNotBuilt Proxy"""
+        raise CythonNotBuilt(cython_msg.format("interp_many"))
     def calc_streamlines(*args, **kwargs):  # pylint: disable=unused-argument
         """CythonNotBuilt Proxy"""
         raise CythonNotBuilt(cython_msg.format("calc_streamlines"))
@@ -49,6 +49,8 @@ ctypedef fused FusedAMRField:
 
 
 cdef make_cyamrfield(vfield)
+cdef int find_patch_index(FusedAMRField amrfld, int active_idx,
+                          real_t x[3]) nogil
 cdef CyField activate_patch(FusedAMRField amrfld, real_t x[3])
 
 ##
@@ -167,7 +167,9 @@ cdef _init_cyamrfield(FusedAMRField amrfld, vfield, crd_dtype):
 
     return amrfld
 
-cdef inline int _contains_patch(FusedAMRField amrfld, int ipatch, real_t x[3]):
+@cython.boundscheck(False)
+cdef inline int _contains_patch(FusedAMRField amrfld, int ipatch,
+                                real_t x[3]) nogil:
     cdef int i
     for i in range(3):
         if (less_not_close(x[i], amrfld.xl[ipatch, i]) or
@@ -175,45 +177,59 @@ cdef inline int _contains_patch(FusedAMRField amrfld, int ipatch, real_t x[3]):
             return 0
     return 1
 
-cdef CyField activate_patch(FusedAMRField amrfld, real_t x[3]):
-    cdef int active_idx, j, k, ineighbor, closest
+@cython.boundscheck(False)
+cdef int find_patch_index(FusedAMRField amrfld, int active_idx,
+                          real_t x[3]) nogil:
+    """Index of the patch that contains x, starting the search at active_idx
+
+    This only touches C-level arrays (patch extents and the neighbor
+    table from the skeleton), so it doesn't need the GIL. It doesn't
+    change amrfld either, so threads sharing amrfld can each keep track
+    of their own active patch.
+    """
+    cdef int j, k, ineighbor, closest
     cdef real_t rsq, closest_rsq
 
     if amrfld.nr_patches == 1:
-        return amrfld.active_patch
-    else:
-        active_idx = amrfld.active_patch_index
-        if _contains_patch[FusedAMRField, real_t](amrfld, active_idx, x):
-            return amrfld.active_patch
-
-        # search neighbors of the current active patch
-        for ineighbor in range(amrfld.nr_neighbors[active_idx]):
-            j = amrfld.neighbors[active_idx, ineighbor]
-            if _contains_patch[FusedAMRField, real_t](amrfld, j, x):
-                amrfld.active_patch = amrfld.patches[j]
-                amrfld.active_patch_index = j
-                return amrfld.active_patch
-
-        # search all patches
-        for j in range(amrfld.nr_patches):
-            if _contains_patch[FusedAMRField, real_t](amrfld, j, x):
-                amrfld.active_patch = amrfld.patches[j]
-                amrfld.active_patch_index = j
-                return amrfld.active_patch
-
-        # TODO: find closest patch?
-        closest = 0
-        closest_rsq = MAX_FLOAT
-        for j in range(amrfld.nr_patches):
-            rsq = 0.0
-            for k in range(3):
-                rsq += (x[k] - amrfld.xm[j, k])**2
-            if rsq < closest_rsq:
-                closest_rsq = rsq
-                closest = j
-        amrfld.active_patch = amrfld.patches[closest]
-        amrfld.active_patch_index = closest
-        return amrfld.active_patch
+        return 0
+
+    if _contains_patch[FusedAMRField, real_t](amrfld, active_idx, x):
+        return active_idx
+
+    # search neighbors of the current active patch
+    for ineighbor in range(amrfld.nr_neighbors[active_idx]):
+        j = amrfld.neighbors[active_idx, ineighbor]
+        if _contains_patch[FusedAMRField, real_t](amrfld, j, x):
+            return j
+
+    # search all patches
+    for j in range(amrfld.nr_patches):
+        if _contains_patch[FusedAMRField, real_t](amrfld, j, x):
+            return j
+
+    # TODO: find closest patch?
+    closest = 0
+    closest_rsq = MAX_FLOAT
+    for j in range(amrfld.nr_patches):
+        rsq = 0.0
+        for k in range(3):
+            rsq += (x[k] - amrfld.xm[j, k])**2
+        if rsq < closest_rsq:
+            closest_rsq = rsq
+            closest = j
+    return closest
+
+cdef CyField activate_patch(FusedAMRField amrfld, real_t x[3]):
+    cdef int idx
+
+    if amrfld.nr_patches > 1:
+        idx = find_patch_index[FusedAMRField, real_t](amrfld,
+                                                      amrfld.active_patch_index,
+                                                      x)
+        if idx != amrfld.active_patch_index:
+            amrfld.active_patch = amrfld.patches[idx]
+            amrfld.active_patch_index = idx
+    return amrfld.active_patch
 
 ##
 ## EOF
@@ -76,6 +76,9 @@ def interp(vfield, seeds, kind="linear", wrap=True, method=None):
         raise ValueError("kind '{0}' not understood. Use linear or nearest"
                          "".format(kind))
 
+    return _finalize_result(vfield, seeds, result, scalar, wrap)
+
+def _finalize_result(vfield, seeds, result, scalar, wrap):
     if scalar:
         result = result[:, 0]
 
@@ -125,6 +128,168 @@ def interp_nearest(vfield, seeds, wrap=True):
     """
     return interp(vfield, seeds, wrap=wrap, kind="nearest")
 
+def interp_many(fields, seeds, kind="linear", wrap=True, method=None):
+    """Interpolate many fields to the same seeds in one pass
+
+    Each seed point is located (patch, cell index, and weights) just
+    once for each group of fields that share coordinates and
+    centering, and the result is applied to every field in the group.
+    This is much cheaper than calling :py:func:`interp` once per field
+    when extracting several quantities at the same points.
+
+    Note:
+        Face and edge centered fields have different coordinates for
+        each component, so they are handed to :py:func:`interp` one
+        at a time.
+
+    Parameters:
+        fields (list, dict): Vector or Scalar fields, or a dict whose
+            values are fields
+        seeds (viscid.claculator.seed): locations for the interpolation
+        kind (str): either 'linear' or 'nearest'
+        wrap (bool): if true, then call seeds.wrap on the results
+        method (str): alias for kind
+
+    Returns:
+        list with one result per field, in the same form that
+        :py:func:`interp` gives. If `fields` is a dict, then a dict
+        with the same keys is returned.
+    """
+    cdef int nr_points, nr_comps
+
+    kind = kind.strip().lower()
+    if method:
+        kind = method.strip().lower()
+
+    if kind == "nearest":
+        linear = 0
+    elif kind == "linear" or kind == "trilinear" or kind == "trilin":
+        linear = 1
+    else:
+        raise ValueError("kind '{0}' not understood. Use linear or nearest"
+                         "".format(kind))
+
+    if isinstance(fields, dict):
+        keys = list(fields.keys())
+        vfields = list(fields.values())
+    else:
+        keys = None
+        vfields = list(fields)
+
+    vfields = [f if f.nr_sdims == 3 else f.atleast_3d() for f in vfields]
+    seeds = to_seeds(seeds)
+
+    results = [None] * len(vfields)
+    # groups of fields that can share located points, each group is
+    # [representative vfield, crd_dtype, [(index, amrfld), ...]]
+    groups = []
+    for i, vfield in enumerate(vfields):
+        if vfield.center.lower() in ('face', 'edge'):
+            results[i] = interp(vfield, seeds, kind=kind, wrap=wrap)
+            continue
+
+        amrfld = make_cyamrfield(vfield)
+        crd_dtype = (<CyAMRField>amrfld).crd_dtype
+        for grp in groups:
+            if grp[1] == crd_dtype and _same_crds(grp[0], vfield):
+                grp[2].append((i, amrfld))
+                break
+        else:
+            groups.append([vfield, crd_dtype, [(i, amrfld)]])
+
+    for rep, crd_dtype, members in groups:
+        seed_center = seeds.center if hasattr(seeds, 'center') else rep.center
+        if seed_center.lower() in ('face', 'edge'):
+            seed_center = 'cell'
+        nr_points = seeds.get_nr_points(center=seed_center)
+
+        # loc is [patch, ix, iy, iz, px, py, pz] for each point
+        loc = np.empty((nr_points, 7), dtype='i')
+        xd = np.empty((nr_points, 3), dtype=crd_dtype)
+        _py_locate(members[0][1], seeds.iter_points(center=seed_center),
+                   linear, loc, xd)
+
+        for i, amrfld in members:
+            nr_comps = vfields[i].nr_comps
+            scalar = nr_comps == 0
+            result = np.empty((nr_points, max(nr_comps, 1)), dtype=crd_dtype)
+            _py_interp_located(amrfld, loc, xd, result)
+            results[i] = _finalize_result(vfields[i], seeds, result, scalar,
+                                          wrap)
+
+    if keys is not None:
+        results = dict(zip(keys, results))
+    return results
+
+def _same_crds(a, b):
+    """True if points located on a are also valid for b"""
+    if a.center.lower() != b.center.lower() or a.nr_patches != b.nr_patches:
+        return False
+    for pa, pb in zip(a.patches, b.patches):
+        if pa.crds is pb.crds:
+            continue
+        if list(pa.sshape) != list(pb.sshape):
+            return False
+        for ca, cb in zip(pa.get_crds_nc(), pb.get_crds_nc()):
+            if not np.array_equal(ca, cb):
+                return False
+    return True
+
+def _py_locate(FusedAMRField amrfld, points, int linear, int[:, ::1] loc,
+               real_t[:, ::1] xd):
+    cdef int i, d
+    cdef real_t x[3]
+    cdef real_t _xd[3]
+    cdef int ix[3]
+    cdef int p[3]
+    cdef int cached_idx3[3]
+
+    cached_idx3[:] = [0, 0, 0]
+
+    i = 0
+    for pt in points:
+        assert len(pt) == 3, "Seeds must have 3 spatial dimensions"
+        x[0] = pt[0]
+        x[1] = pt[1]
+        x[2] = pt[2]
+        if amrfld.nr_patches > 1:
+            activate_patch[FusedAMRField, real_t](amrfld, x)
+        if linear:
+            _c_trilin_locate(amrfld.active_patch, 0, x, cached_idx3, ix, p,
+                             _xd)
+        else:
+            for d in range(3):
+                ix[d] = closest_ind(amrfld.active_patch, 0, d, x[d],
+                                    cached_idx3)
+                p[d] = 0
+                _xd[d] = 0.0
+
+        loc[i, 0] = amrfld.active_patch_index
+        for d in range(3):
+            loc[i, 1 + d] = ix[d]
+            loc[i, 4 + d] = p[d]
+            xd[i, d] = _xd[d]
+        i += 1
+
+def _py_interp_located(FusedAMRField amrfld, int[:, ::1] loc,
+                       real_t[:, ::1] xd, real_t[:, ::1] result):
+    cdef int i, d, m
+    cdef int nr_comps = result.shape[1]
+    cdef real_t _xd[3]
+    cdef int ix[3]
+    cdef int p[3]
+
+    for i in range(result.shape[0]):
+        if loc[i, 0] != amrfld.active_patch_index:
+            amrfld.active_patch_index = loc[i, 0]
+            amrfld.active_patch = amrfld.patches[loc[i, 0]]
+        for d in range(3):
+            ix[d] = loc[i, 1 + d]
+            p[d] = loc[i, 4 + d]
+            _xd[d] = xd[i, d]
+        for m in range(nr_comps):
+            result[i, m] = _c_trilin_apply(amrfld.active_patch, m, ix, p, _xd)
+
 def _py_interp_trilin(FusedAMRField amrfld, points, real_t[:, ::1] result):
     cdef int i, m
     cdef int nr_comps = result.shape[1]
@@ -148,12 +313,18 @@ def _py_interp_trilin(FusedAMRField amrfld, points, real_t[:, ::1] result):
 
 cdef real_t _c_interp_trilin(FusedField fld, int m, real_t x[3],
                              int cached_idx3[3]) nogil:
-    cdef int d, ind
     cdef int ix[3]
     cdef int p[3]  # increment, used for 2d fields
     cdef real_t xd[3]
 
-    cdef real_t c00, c10, c01, c11, c0, c1, c
+    _c_trilin_locate(fld, m, x, cached_idx3, ix, p, xd)
+    return _c_trilin_apply(fld, m, ix, p, xd)
+
+cdef inline void _c_trilin_locate(FusedField fld, int m, real_t x[3],
+                                  int cached_idx3[3], int ix[3], int p[3],
+                                  real_t xd[3]) nogil:
+    """Find the cell index, increment, and weights for a point"""
+    cdef int d, ind
 
     # find closest inds
     for d in range(3):
@@ -174,6 +345,11 @@ cdef real_t _c_interp_trilin(FusedField fld, int m, real_t x[3],
                      (fld.crds[m, d, ind + 1] - fld.crds[m, d, ind]))
         ix[d] = ind
 
+cdef inline real_t _c_trilin_apply(FusedField fld, int m, int ix[3], int p[3],
+                                   real_t xd[3]) nogil:
+    """Apply weights from _c_trilin_locate to component m of fld"""
+    cdef real_t c00, c10, c01, c11, c0, c1, c
+
     # INTERLACED ... x first
     c00 = (fld.data[ix[0], ix[1]       , ix[2]       , m] +
            xd[0] * (fld.data[ix[0] + p[0], ix[1]       , ix[2]       , m] -
@@ -255,7 +431,7 @@ cdef inline int closest_preceeding_ind(FusedField fld, int m, int d, real_t valu
         int: closest index preceeding value in the coordinate array d
     """
     cdef real_t frac
-    cdef int i, ind, found_ind
+    cdef int i, ind
     cdef int n = fld.n[d]
     cdef int startidx = cached_idx3[d]  # using fld.cached_ind is not threadsafe
 
@@ -265,29 +441,68 @@ cdef inline int closest_preceeding_ind(FusedField fld, int m, int d, real_t valu
         frac = (value - fld.xl[m, d]) / (fld.L[m, d])
         i = <int> floor((fld.nm1[d]) * frac)
         ind = int_min(int_max(i, 0), fld.nm2[d])
+    elif not value >= fld.crds[m, d, 0]:
+        ind = 0
+    elif value >= fld.crds[m, d, n - 1]:
+        ind = n - 1
     else:
-        found_ind = 0
-        if fld.crds[m, d, startidx] <= value:
-            i = startidx
-            for i in range(startidx, n - 1):
-                if fld.crds[m, d, i + 1] > value:
-                    found_ind = 1
-                    break
-            if not found_ind:
-                i = n - 1
+        # points are usually close to the last one (streamlines), so
+        # check the neighborhood of the cached index first, then fall
+        # back to the lookup table or bisection for scattered points
+        i = int_min(int_max(startidx, 0), n - 2)
+        if fld.crds[m, d, i] <= value:
+            if value < fld.crds[m, d, i + 1]:
+                ind = i
+            elif i + 2 < n and value < fld.crds[m, d, i + 2]:
+                ind = i + 1
+            elif fld.use_lut:
+                ind = _lut_preceeding_ind(fld, m, d, value)
+            else:
+                ind = _bisect_preceeding_ind(fld, m, d, value, i + 1, n - 1)
+        elif i >= 1 and fld.crds[m, d, i - 1] <= value:
+            ind = i - 1
+        elif fld.use_lut:
+            ind = _lut_preceeding_ind(fld, m, d, value)
         else:
-            i = startidx - 1
-            for i in range(startidx - 1, -1, -1):
-                if fld.crds[m, d, i] <= value:
-                    found_ind = 1
-                    break
-            if not found_ind:
-                i = 0
-        ind = i
+            ind = _bisect_preceeding_ind(fld, m, d, value, 0, i)
 
     cached_idx3[d] = ind  # using fld.cached_ind is not threadsafe
     return ind
 
+cdef inline int _bisect_preceeding_ind(FusedField fld, int m, int d,
+                                       real_t value, int lo, int hi) nogil:
+    """Bisect crds such that crds[lo] <= value < crds[hi]"""
+    cdef int mid
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if fld.crds[m, d, mid] <= value:
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+cdef inline int _lut_preceeding_ind(FusedField fld, int m, int d,
+                                    real_t value) nogil:
+    """Use the lookup table to bracket value, then bisect the bracket
+
+    Note:
+        value must satisfy crds[0] <= value < crds[n - 1]
+    """
+    cdef int n = fld.n[d]
+    cdef int b, lo, hi
+
+    b = <int> floor((value - fld.lut_xl[m, d]) * fld.lut_scale[m, d])
+    b = int_min(int_max(b, 0), fld.nr_lut_bins[d] - 1)
+    lo = fld.lut[m, d, b]
+    hi = int_min(fld.lut[m, d, b + 1] + 1, n - 1)
+    # in case value is right on a bin edge and roundoff put it in the
+    # wrong bin
+    while lo > 0 and fld.crds[m, d, lo] > value:
+        lo -= 1
+    while hi < n - 1 and fld.crds[m, d, hi] <= value:
+        hi += 1
+    return _bisect_preceeding_ind(fld, m, d, value, lo, hi)
+
 cdef inline int closest_ind(FusedField fld, int m, int d, real_t value,
                             int cached_idx3[3]) nogil except -1:
     cdef double d1, d2
@@ -22,6 +22,12 @@ cdef class CyField:
     cdef int nr_cells[3]
     # cdef int cached_ind[3]  # dangerous for threads :(
     cdef cnp.float64_t min_dx
+    # lookup table for nonuniform crds, lut[comp, axis, bin] is the
+    # index of the crd preceeding the start of a uniform bin
+    cdef int use_lut
+    cdef int nr_lut_bins[3]
+    cdef int[:, :, ::1] lut
+    cdef cnp.float64_t[:, ::1] lut_xl, lut_scale
 
 cdef class Field_I4_Crd_F8(CyField):
     cdef cnp.int32_t[:,:,:,::1] data
@@ -11,6 +11,13 @@ cdef float MAX_FLOAT = 1e37
 # should be 1.7976931348623157e+308 ?
 cdef double MAX_DOUBLE = 1e307
 
+# build a lookup table (uniform bin -> crd index) for nonuniform crds so
+# the Cython code can find the cell around a point in ~O(1). If False, a
+# bisection is used when a point isn't near the last one
+nonuniform_lut = True
+# number of lookup table bins per cell along each axis
+lut_oversample = 2
+
 
 cdef inline int _c_int_max(int a, int b):
     if a >= b:
@@ -101,6 +108,11 @@ cdef _init_cyfield(FusedField fld, vfield, fld_dtype, crd_dtype):
             if fld.xh[ic, i] < fld.xl[ic, i]:
                 raise RuntimeError("Forward crds only in cython code")
 
+    if not fld.uniform_crds and nonuniform_lut:
+        _init_lut(fld, np.asarray(fld.crds), sshape)
+    else:
+        fld.use_lut = 0
+
     # print("??", sshape_max)
     # for i in range(3):
     #     print("!", i)
@@ -113,6 +125,33 @@ cdef _init_cyfield(FusedField fld, vfield, fld_dtype, crd_dtype):
 
     return fld
 
+cdef _init_lut(CyField fld, crds, sshape):
+    n_max = max(sshape)
+    max_bins = max(lut_oversample * (n_max - 1), 1)
+    lut = np.zeros((3, 3, max_bins + 1), dtype='i')
+    lut_xl = np.zeros((3, 3), dtype='f8')
+    lut_scale = np.zeros((3, 3), dtype='f8')
+
+    for i in range(3):
+        n = sshape[i]
+        if n < 2:
+            fld.nr_lut_bins[i] = 0
+            continue
+        nbins = lut_oversample * (n - 1)
+        fld.nr_lut_bins[i] = nbins
+        for ic in range(3):
+            crd = crds[ic, i, :n]
+            lut_xl[ic, i] = crd[0]
+            lut_scale[ic, i] = nbins / (crd[n - 1] - crd[0])
+            edges = crd[0] + np.arange(nbins + 1) / lut_scale[ic, i]
+            inds = np.searchsorted(crd, edges, side='right') - 1
+            lut[ic, i, :nbins + 1] = np.clip(inds, 0, n - 2)
+
+    fld.lut = lut
+    fld.lut_xl = lut_xl
+    fld.lut_scale = lut_scale
+    fld.use_lut = 1
+
 cdef make_cyfield(vfield):
     vfield = vfield.as_interlaced(force_c_contiguous=True).atleast_3d()
     fld_dtype = np.dtype(vfield.dtype)
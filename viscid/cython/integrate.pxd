@@ -25,3 +25,15 @@ cdef int _c_rk12(FusedField fld, real_t x[3], real_t *ds,
 cdef int _c_rk45(FusedField fld, real_t x[3], real_t *ds,
                  real_t max_error, real_t smallest_ds, real_t largest_ds,
                  real_t vscale[3], int cached_idx3[3]) nogil except -1
+
+cdef int _c_euler1_batch(FusedField fld, int n, int *lanes, int stride,
+                         real_t *x, real_t *ds, real_t *work, real_t vscale[3],
+                         int *cached_idx3, int *ret) nogil except -1
+
+cdef int _c_rk2_batch(FusedField fld, int n, int *lanes, int stride,
+                      real_t *x, real_t *ds, real_t *work, real_t vscale[3],
+                      int *cached_idx3, int *ret) nogil except -1
+
+cdef int _c_rk4_batch(FusedField fld, int n, int *lanes, int stride,
+                      real_t *x, real_t *ds, real_t *work, real_t vscale[3],
+                      int *cached_idx3, int *ret) nogil except -1
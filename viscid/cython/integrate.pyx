@@ -218,6 +218,161 @@ cdef int _c_rk4(FusedField fld, real_t x[3], real_t *ds,
 
     return 0
 
+#################################################
+####   non-adaptive methods, batch of lines   ####
+#################################################
+# These advance a batch of lines one step each. Lines are given by
+# lanes[:n]; xyz of lane l are x[l], x[stride + l], x[2 * stride + l],
+# its step is ds[l] and its cell guess is cached_idx3[3 * l:3 * l + 3].
+# work is scratch space of 15 * stride reals. ret[l] is set to 1 if the
+# field vanishes somewhere for lane l, else 0. The arithmetic is the
+# same as the single line versions, so the results are identical.
+
+cdef inline void _c_k_batch(FusedField fld, int n, int *lanes, int stride,
+                            real_t *xs, real_t *k, real_t *ds,
+                            real_t vscale[3], int *cached_idx3,
+                            int *ret) nogil:
+    """k = ds * fld[xs] / |fld[xs]| for all lanes that aren't done"""
+    cdef int j, l
+    cdef real_t xl[3]
+    cdef real_t kl[3]
+    cdef real_t kmag, h
+    for j in range(n):
+        l = lanes[j]
+        if ret[l]:
+            continue
+        xl[0] = xs[l]
+        xl[1] = xs[stride + l]
+        xl[2] = xs[2 * stride + l]
+        kl[0] = vscale[0] * _c_interp_trilin[FusedField, real_t](fld, 0, xl, &cached_idx3[3 * l])
+        kl[1] = vscale[1] * _c_interp_trilin[FusedField, real_t](fld, 1, xl, &cached_idx3[3 * l])
+        kl[2] = vscale[2] * _c_interp_trilin[FusedField, real_t](fld, 2, xl, &cached_idx3[3 * l])
+        kmag = sqrt(kl[0]**2 + kl[1]**2 + kl[2]**2)
+        if kmag == 0.0 or isnan(kmag):
+            ret[l] = 1
+            continue
+        h = ds[l]
+        kl[0] *= h / kmag
+        kl[1] *= h / kmag
+        kl[2] *= h / kmag
+        k[l] = kl[0]
+        k[stride + l] = kl[1]
+        k[2 * stride + l] = kl[2]
+
+cdef int _c_euler1_batch(FusedField fld, int n, int *lanes, int stride,
+                         real_t *x, real_t *ds, real_t *work, real_t vscale[3],
+                         int *cached_idx3, int *ret) nogil except -1:
+    """Batched version of :py:func:`_c_euler1`"""
+    cdef int j, l, c
+    cdef real_t xl[3]
+    cdef real_t v[3]
+    cdef real_t vmag
+    for j in range(n):
+        l = lanes[j]
+        ret[l] = 0
+        xl[0] = x[l]
+        xl[1] = x[stride + l]
+        xl[2] = x[2 * stride + l]
+        v[0] = vscale[0] * _c_interp_trilin[FusedField, real_t](fld, 0, xl, &cached_idx3[3 * l])
+        v[1] = vscale[1] * _c_interp_trilin[FusedField, real_t](fld, 1, xl, &cached_idx3[3 * l])
+        v[2] = vscale[2] * _c_interp_trilin[FusedField, real_t](fld, 2, xl, &cached_idx3[3 * l])
+        vmag = sqrt(v[0]**2 + v[1]**2 + v[2]**2)
+        if vmag == 0.0 or isnan(vmag):
+            ret[l] = 1
+            continue
+        for c in range(3):
+            x[c * stride + l] += ds[l] * v[c] / vmag
+    return 0
+
+cdef int _c_rk2_batch(FusedField fld, int n, int *lanes, int stride,
+                      real_t *x, real_t *ds, real_t *work, real_t vscale[3],
+                      int *cached_idx3, int *ret) nogil except -1:
+    """Batched version of :py:func:`_c_rk2`"""
+    cdef int j, l, c, i
+    cdef real_t *k1 = work
+    cdef real_t *k2 = work + 3 * stride
+    cdef real_t *x2 = work + 6 * stride
+    cdef real_t c21 = 0.5
+    cdef real_t w1 = 0.0
+    cdef real_t w2 = 1.0
+
+    for j in range(n):
+        ret[lanes[j]] = 0
+
+    _c_k_batch(fld, n, lanes, stride, x, k1, ds, vscale, cached_idx3, ret)
+    for j in range(n):
+        l = lanes[j]
+        if not ret[l]:
+            for c in range(3):
+                i = c * stride + l
+                x2[i] = x[i] + (c21 * k1[i])
+
+    _c_k_batch(fld, n, lanes, stride, x2, k2, ds, vscale, cached_idx3, ret)
+    for j in range(n):
+        l = lanes[j]
+        if not ret[l]:
+            for c in range(3):
+                i = c * stride + l
+                x[i] += (w1 * k1[i] + w2 * k2[i])
+    return 0
+
+cdef int _c_rk4_batch(FusedField fld, int n, int *lanes, int stride,
+                      real_t *x, real_t *ds, real_t *work, real_t vscale[3],
+                      int *cached_idx3, int *ret) nogil except -1:
+    """Batched version of :py:func:`_c_rk4`"""
+    cdef int j, l, c, i
+    cdef real_t *k1 = work
+    cdef real_t *k2 = work + 3 * stride
+    cdef real_t *k3 = work + 6 * stride
+    cdef real_t *k4 = work + 9 * stride
+    cdef real_t *xs = work + 12 * stride
+    cdef real_t c21 = 0.5
+    cdef real_t c31 = 0.0
+    cdef real_t c32 = 0.5
+    cdef real_t c41 = 0.0
+    cdef real_t c42 = 0.0
+    cdef real_t c43 = 1.0
+    cdef real_t u1 = 1.0 / 6.0
+    cdef real_t u2 = 1.0 / 3.0
+    cdef real_t u3 = 1.0 / 3.0
+    cdef real_t u4 = 1.0 / 6.0
+
+    for j in range(n):
+        ret[lanes[j]] = 0
+
+    _c_k_batch(fld, n, lanes, stride, x, k1, ds, vscale, cached_idx3, ret)
+    for j in range(n):
+        l = lanes[j]
+        if not ret[l]:
+            for c in range(3):
+                i = c * stride + l
+                xs[i] = x[i] + (c21 * k1[i])
+
+    _c_k_batch(fld, n, lanes, stride, xs, k2, ds, vscale, cached_idx3, ret)
+    for j in range(n):
+        l = lanes[j]
+        if not ret[l]:
+            for c in range(3):
+                i = c * stride + l
+                xs[i] = x[i] + (c31 * k1[i] + c32 * k2[i])
+
+    _c_k_batch(fld, n, lanes, stride, xs, k3, ds, vscale, cached_idx3, ret)
+    for j in range(n):
+        l = lanes[j]
+        if not ret[l]:
+            for c in range(3):
+                i = c * stride + l
+                xs[i] = x[i] + (c41 * k1[i] + c42 * k2[i] + c43 * k3[i])
+
+    _c_k_batch(fld, n, lanes, stride, xs, k4, ds, vscale, cached_idx3, ret)
+    for j in range(n):
+        l = lanes[j]
+        if not ret[l]:
+            for c in range(3):
+                i = c * stride + l
+                x[i] += (u1 * k1[i] + u2 * k2[i] + u3 * k3[i] + u4 * k4[i])
+    return 0
+
 ##############################
 ####   adaptive methods   ####
 ##############################
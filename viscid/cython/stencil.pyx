@@ -0,0 +1,142 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, profile=False
+# cython: emit_code_comments=False
+"""Finite difference stencils for grad / div / curl
+
+These are the "cython" backends of viscid.grad, viscid.div and
+viscid.curl. The boundary differences are done inline, so there's
+no extended copy of the field, and no shaped crd temporaries. The
+slowest varying axis is split between OpenMP threads if Viscid was
+built with OpenMP.
+
+Differences are taken in the dtype of the field, spacings in the
+dtype of the crds, and the quotients are summed in the same order as
+the numpy versions in viscid.calculator.calc, so the results are the
+same to the bit.
+"""
+
+from __future__ import print_function
+
+import numpy as np
+
+from cython.parallel cimport prange
+
+
+ctypedef fused data_t:
+    float
+    double
+
+ctypedef fused crd_t:
+    float
+    double
+
+ctypedef fused out_t:
+    float
+    double
+
+
+def axis_stencil(crd, bnd):
+    """Neighbor indices and spacing of a 2nd order central difference
+
+    Args:
+        crd (ndarray): 1d crds of the axis
+        bnd (bool): if True, the result has a value for every crd, and
+            the first / last ones are 1st order one sided differences
+            (the same as a 0th order extend_boundaries). If False, the
+            first / last crds are dropped.
+
+    Returns:
+        (nbr, dx) where nbr is a (2, n) array of the indices of the
+        upper / lower neighbors, and dx is crd[nbr[0]] - crd[nbr[1]].
+        An axis with just one crd has an infinite dx so that its
+        derivative is 0.
+    """
+    n = len(crd)
+    if bnd:
+        center = np.arange(n, dtype=np.intp)
+    else:
+        center = np.arange(1, n - 1, dtype=np.intp)
+    nbr = np.empty((2, len(center)), dtype=np.intp)
+    nbr[0, :] = np.minimum(center + 1, n - 1)
+    nbr[1, :] = np.maximum(center - 1, 0)
+    if n == 1:
+        dx = np.full((len(center),), np.inf, dtype=crd.dtype)
+    else:
+        dx = crd[nbr[0]] - crd[nbr[1]]
+    return nbr, dx
+
+def grad(const data_t[:, :, :] v,
+         Py_ssize_t[:, ::1] nbr0, const crd_t[::1] dx0,
+         Py_ssize_t[:, ::1] nbr1, const crd_t[::1] dx1,
+         Py_ssize_t[:, ::1] nbr2, const crd_t[::1] dx2,
+         Py_ssize_t off,
+         out_t[:, :, :] gx, out_t[:, :, :] gy, out_t[:, :, :] gz):
+    """Gradient of v into gx, gy, gz
+
+    `off` is 0 if the stencils were made with bnd, else 1.
+    """
+    cdef Py_ssize_t n0 = gx.shape[0]
+    cdef Py_ssize_t n1 = gx.shape[1]
+    cdef Py_ssize_t n2 = gx.shape[2]
+    cdef Py_ssize_t i, j, k, ci, cj, ck
+
+    for i in prange(n0, nogil=True, schedule='static'):
+        ci = i + off
+        for j in range(n1):
+            cj = j + off
+            for k in range(n2):
+                ck = k + off
+                gx[i, j, k] = (v[nbr0[0, i], cj, ck] - v[nbr0[1, i], cj, ck]) / dx0[i]
+                gy[i, j, k] = (v[ci, nbr1[0, j], ck] - v[ci, nbr1[1, j], ck]) / dx1[j]
+                gz[i, j, k] = (v[ci, cj, nbr2[0, k]] - v[ci, cj, nbr2[1, k]]) / dx2[k]
+
+def div(const data_t[:, :, :] vx, const data_t[:, :, :] vy,
+        const data_t[:, :, :] vz,
+        Py_ssize_t[:, ::1] nbr0, const crd_t[::1] dx0,
+        Py_ssize_t[:, ::1] nbr1, const crd_t[::1] dx1,
+        Py_ssize_t[:, ::1] nbr2, const crd_t[::1] dx2,
+        Py_ssize_t off, out_t[:, :, :] result):
+    """Divergence of (vx, vy, vz) into result"""
+    cdef Py_ssize_t n0 = result.shape[0]
+    cdef Py_ssize_t n1 = result.shape[1]
+    cdef Py_ssize_t n2 = result.shape[2]
+    cdef Py_ssize_t i, j, k, ci, cj, ck
+
+    for i in prange(n0, nogil=True, schedule='static'):
+        ci = i + off
+        for j in range(n1):
+            cj = j + off
+            for k in range(n2):
+                ck = k + off
+                result[i, j, k] = ((vx[nbr0[0, i], cj, ck] - vx[nbr0[1, i], cj, ck]) / dx0[i] +
+                                   (vy[ci, nbr1[0, j], ck] - vy[ci, nbr1[1, j], ck]) / dx1[j] +
+                                   (vz[ci, cj, nbr2[0, k]] - vz[ci, cj, nbr2[1, k]]) / dx2[k])
+
+def curl(const data_t[:, :, :] vx, const data_t[:, :, :] vy,
+         const data_t[:, :, :] vz,
+         Py_ssize_t[:, ::1] nbr0, const crd_t[::1] dx0,
+         Py_ssize_t[:, ::1] nbr1, const crd_t[::1] dx1,
+         Py_ssize_t[:, ::1] nbr2, const crd_t[::1] dx2,
+         Py_ssize_t off,
+         out_t[:, :, :] cx, out_t[:, :, :] cy, out_t[:, :, :] cz):
+    """Curl of (vx, vy, vz) into cx, cy, cz"""
+    cdef Py_ssize_t n0 = cx.shape[0]
+    cdef Py_ssize_t n1 = cx.shape[1]
+    cdef Py_ssize_t n2 = cx.shape[2]
+    cdef Py_ssize_t i, j, k, ci, cj, ck
+
+    for i in prange(n0, nogil=True, schedule='static'):
+        ci = i + off
+        for j in range(n1):
+            cj = j + off
+            for k in range(n2):
+                ck = k + off
+                cx[i, j, k] = ((vz[ci, nbr1[0, j], ck] - vz[ci, nbr1[1, j], ck]) / dx1[j] -
+                               (vy[ci, cj, nbr2[0, k]] - vy[ci, cj, nbr2[1, k]]) / dx2[k])
+                cy[i, j, k] = (-(vz[nbr0[0, i], cj, ck] - vz[nbr0[1, i], cj, ck]) / dx0[i] +
+                               (vx[ci, cj, nbr2[0, k]] - vx[ci, cj, nbr2[1, k]]) / dx2[k])
+                cz[i, j, k] = ((vy[nbr0[0, i], cj, ck] - vy[nbr0[1, i], cj, ck]) / dx0[i] -
+                               (vx[ci, nbr1[0, j], ck] - vx[ci, nbr1[1, j], ck]) / dx1[j])
+
+##
+## EOF
+##
@@ -22,28 +22,33 @@ Note:
 from __future__ import print_function
 # from timeit import default_timer as time
 from contextlib import closing
-from itertools import islice, repeat
+from itertools import repeat
 import os
 
 import numpy as np
 
 import viscid
 from viscid import parallel
-from viscid.seed import to_seeds
+from viscid.seed import to_seeds, space_filling_order, Point
+from viscid.vutil import PackedLines
 from viscid.compat import izip
 
 ###########
 # cimports
 cimport cython
-from libc.math cimport fabs, NAN
+from libc.math cimport fabs, isnan, NAN
+from libc.stdlib cimport malloc, free
 from libc.time cimport time_t, time, clock_t, clock, CLOCKS_PER_SEC
 cimport numpy as cnp
 
 from viscid.cython.cyfield cimport MAX_FLOAT, real_t
-from viscid.cython.cyamr cimport FusedAMRField, make_cyamrfield, activate_patch
+from viscid.cython.cyamr cimport FusedAMRField, make_cyamrfield, find_patch_index
 from viscid.cython.cyfield cimport CyField, FusedField, make_cyfield
+from viscid.cython.cycalc cimport _c_interp_trilin
 from viscid.cython.integrate cimport (_c_euler1, _c_rk2, _c_rk4,
-                                      _c_euler1a, _c_rk12, _c_rk45)
+                                      _c_euler1a, _c_rk12, _c_rk45,
+                                      _c_euler1_batch, _c_rk2_batch,
+                                      _c_rk4_batch)
 
 
 EULER1 = 1  # euler1 non-adaptive
@@ -138,22 +143,25 @@ cdef:
     int _C_TOPOLOGY_MS_OPEN_SOUTH = TOPOLOGY_MS_OPEN_SOUTH
     int _C_TOPOLOGY_MS_SW = TOPOLOGY_MS_SW
 
-# these are set if there is a pool of workers doing streamlines, they are
-# always set back to None when the streamlines are done
-# they need to be global so that the memory is shared with subprocesses
-_global_fld = None
+# smallest batch of seeds given to a worker when schedule='dynamic'
+dynamic_min_batch = 8
+# how many seeds are traced in lockstep when engine='batched'
+batch_size = 64
 
 #####################
 # now the good stuff
 def calc_streamlines(vfield, seed, nr_procs=1, force_subprocess=False,
-                     threads=True, chunk_factor=1, wrap=True, **kwargs):
+                     threads=True, chunk_factor=1, wrap=True,
+                     seed_order="strided", schedule="static", packed=False,
+                     **kwargs):
     r"""Trace streamlines
 
     Args:
         vfield: A VectorField with 3 components,  If this field is not
             3D, then vfield.atleast_3d() is called
         seed: can be a Seeds instance or a Coordinates instance, or
-            anything that exposes an iter_points method
+            anything that exposes a get_points method that takes a
+            `slc` keyword
         nr_procs: how many processes for streamlines (>1 only works on
             \*nix systems)
         force_subprocess (bool): always calc streamlines in a separate
@@ -166,6 +174,24 @@ def calc_streamlines(vfield, seed, nr_procs=1, force_subprocess=False,
             undesirable. Start with 1 and bump this up if load
             balancing is still an issue.
         wrap (bool): if true, then call seed.wrap_field on topology
+        seed_order (str): how seeds are split into chunks. 'strided'
+            gives every nr_chunks-th seed to each chunk, 'contiguous'
+            gives each chunk a contiguous run of seeds, and 'hilbert'
+            or 'morton' sort the seeds along a space filling curve
+            before making contiguous chunks so each chunk is compact
+            in space. Results are always returned in the original
+            seed order.
+        schedule (str): 'static' makes `chunk_factor * nr_procs`
+            chunks up front. 'dynamic' makes batches of contiguous
+            seeds (in `seed_order`, with 'strided' meaning
+            'contiguous') that shrink toward the end, and workers
+            take the next batch whenever they finish one, so workers
+            that get slow closed field lines don't hold everyone up.
+            `chunk_factor` is ignored, and the smallest batch is set
+            by `viscid.cython.streamline.dynamic_min_batch`.
+        packed (bool): if true, return lines as a single
+            :py:class:`viscid.PackedLines` (one (3, nr_points) array
+            plus offsets) instead of an array of ndarrays
         **kwargs: more arguments for streamlines
 
     Keyword Arguments:
@@ -204,13 +230,20 @@ def calc_streamlines(vfield, seed, nr_procs=1, force_subprocess=False,
         topo_style (str): how to map end point bitmask to a topology.
             'msphere' means map to ``TOPOLOGY_MS_*`` and 'generic'
             means leave topology as a bitmask of ``END_*``
+        engine (str): 'scalar' traces one line at a time. 'batched'
+            advances `viscid.cython.streamline.batch_size` lines in
+            lockstep, one integrator stage at a time for EULER1, RK2
+            and RK4. Finished lines are dropped from the batch and
+            replaced by new seeds. Results are the same as 'scalar'.
+            Fields with more than one AMR patch always use 'scalar'.
 
     Returns:
         (lines, topo), either can be ``None`` depending on ``output``
 
         * `lines`: list of nr_streams ndarrays, each ndarray has shape
           (3, nr_points_in_stream). The nr_points_in_stream can be
-          different for each line
+          different for each line. If `packed`, this is a
+          :py:class:`viscid.PackedLines` instead
         * `topo`: ndarray with shape (nr_streams,) of topology
           bitmask with values depending on the topo_style
     """
@@ -221,16 +254,13 @@ def calc_streamlines(vfield, seed, nr_procs=1, force_subprocess=False,
     if vfield.nr_sdims != 3 or vfield.nr_comps != 3:
         raise ValueError("Streamlines are only written in 3D.")
 
-    # fld = make_cyfield(vfield)
-    # fld = make_cyfield(vfield.as_cell_centered())
-    fld = make_cyamrfield(vfield)
-
     seed = to_seeds(seed)
 
     seed_center = seed.center if hasattr(seed, 'center') else vfield.center
     if seed_center.lower() in ('face', 'edge'):
         seed_center = 'cell'
     kwargs['seed_center'] = seed_center
+    kwargs['packed'] = packed
 
     # allow method kwarg to come in as a string
     if 'method' in kwargs:
@@ -243,26 +273,70 @@ def calc_streamlines(vfield, seed, nr_procs=1, force_subprocess=False,
     nr_procs = parallel.sanitize_nr_procs(nr_procs)
 
     nr_chunks = max(1, min(chunk_factor * nr_procs, nr_streams))
-    seed_slices = parallel.chunk_interslices(nr_chunks)  # every nr_chunks seed points
-    # seed_slices = parallel.chunk_slices(nr_streams, nr_chunks)  # contiguous chunks
-    chunk_sizes = parallel.chunk_sizes(nr_streams, nr_chunks)
-
-    global _global_fld
-    if _global_fld is not None:
-        raise RuntimeError("Another process is doing streamlines in this "
-                           "global memory space")
-    _global_fld = fld
-    grid_iter = izip(chunk_sizes, repeat(seed), seed_slices)
-    r = parallel.map(nr_procs, _do_streamline_star, grid_iter, args_kw=kwargs,
-                     threads=threads, force_subprocess=force_subprocess)
-    _global_fld = None
+    seed_order = seed_order.strip().lower()
+    schedule = schedule.strip().lower()
+    order = None
+    if seed_order in ("hilbert", "morton"):
+        seed_pts = seed.get_points(center=seed_center)
+        order = space_filling_order(seed_pts, curve=seed_order)
+    elif seed_order not in ("strided", "contiguous"):
+        raise ValueError("Unknown seed_order: {0}".format(seed_order))
+
+    if schedule == "dynamic":
+        # the pool hands out batches in order as workers free up
+        seed_slices = parallel.chunk_guided_slices(nr_streams, nr_procs,
+                                                   min_size=dynamic_min_batch)
+        if not seed_slices:
+            seed_slices = [(0, 0)]
+        nr_chunks = len(seed_slices)
+        chunk_sizes = [stop - start for start, stop in seed_slices]
+    elif schedule == "static":
+        if seed_order == "strided":
+            seed_slices = parallel.chunk_interslices(nr_chunks)  # every nr_chunks seed points
+        else:
+            seed_slices = parallel.chunk_slices(nr_streams, nr_chunks)
+        chunk_sizes = parallel.chunk_sizes(nr_streams, nr_chunks)
+    else:
+        raise ValueError("Unknown schedule: {0}".format(schedule))
+
+    trace_seed = seed
+    if order is not None:
+        trace_seed = Point(seed_pts[:, order])
+
+    if threads or (nr_procs == 1 and not force_subprocess):
+        # workers share our memory, so just hand them the field
+        # fld = make_cyfield(vfield)
+        # fld = make_cyfield(vfield.as_cell_centered())
+        fld = make_cyamrfield(vfield)
+        grid_iter = izip(repeat(fld), chunk_sizes, repeat(trace_seed),
+                         seed_slices)
+        r = parallel.map(nr_procs, _streamline_fused_wrapper, grid_iter,
+                         args_kw=kwargs, threads=threads)
+    else:
+        # send the field to the worker processes through shared memory,
+        # already in the layout make_cyamrfield wants so that workers
+        # don't each make their own copy
+        src_fld = vfield.as_interlaced(force_c_contiguous=True)
+        with parallel.SharedField(src_fld) as shared_fld:
+            grid_iter = izip(repeat(shared_fld), chunk_sizes,
+                             repeat(trace_seed), seed_slices)
+            r = parallel.map(nr_procs, _do_streamline_star, grid_iter,
+                             args_kw=kwargs, threads=threads,
+                             force_subprocess=force_subprocess)
 
     # rearrange the output to be the exact same as if we just called
     # _py_streamline straight up (like for nr_procs == 1)
-    if r[0][0] is not None:
+    if r[0][0] is not None and packed:
+        lines = _assemble_packed([ri[0] for ri in r], seed_slices, order,
+                                 nr_streams)
+    elif r[0][0] is not None:
         lines = np.empty((nr_streams,), dtype=np.ndarray)  # [None] * nr_streams
         for i in range(nr_chunks):
             lines[slice(*seed_slices[i])] = r[i][0]
+        if order is not None:
+            sorted_lines = lines
+            lines = np.empty((nr_streams,), dtype=np.ndarray)
+            lines[order] = sorted_lines
     else:
         lines = None
 
@@ -270,6 +344,10 @@ def calc_streamlines(vfield, seed, nr_procs=1, force_subprocess=False,
         topo = np.empty((nr_streams,), dtype=r[0][1].dtype)
         for i in range(nr_chunks):
             topo[slice(*seed_slices[i])] = r[i][1]
+        if order is not None:
+            sorted_topo = topo
+            topo = np.empty_like(sorted_topo)
+            topo[order] = sorted_topo
 
         if wrap:
             topo = seed.wrap_field(topo, name="Topology")
@@ -281,14 +359,196 @@ def calc_streamlines(vfield, seed, nr_procs=1, force_subprocess=False,
 # for legacy code
 streamlines = calc_streamlines
 
+def make_pathline_field(vfield):
+    """Get a velocity field ready for :py:func:`advance_pathlines`
+
+    This does the copy into the layout that the Cython code wants, so
+    it can be done ahead of time (like on a prefetch thread).
+    """
+    if vfield.nr_patches > 1:
+        raise ValueError("Pathlines only work on fields with one patch")
+    if vfield.nr_sdims != 3:
+        vfield = vfield.atleast_3d()
+    return make_cyfield(vfield)
+
+def advance_pathlines(CyField v0, CyField v1, pts, alive, double t0,
+                      double t1, int nr_substeps=8, double speed_scale=1.0,
+                      double ibound=0.0, obound0=None, obound1=None):
+    """Advance fluid elements from t0 to t1 in one go
+
+    The velocity at any time between t0 and t1 is linearly
+    interpolated in time between v0 and v1, and each element takes
+    nr_substeps RK4 steps. The GIL is released while integrating.
+
+    Args:
+        v0 (CyField): velocity at t0 from :py:func:`make_pathline_field`
+        v1 (CyField): velocity at t1, must be on the same kind of grid
+            (same dtype) as v0
+        pts (ndarray): 3xN positions at t0, replaced by the positions
+            at t1
+        alive (ndarray): N int32 flags, elements that leave the domain
+            or go inside ibound are set to 0 and stop moving
+        t0 (float): time of v0
+        t1 (float): time of v1
+        nr_substeps (int): number of RK4 steps from t0 to t1
+        speed_scale (float): speed_scale * v should be in units of
+            pts / time
+        ibound (float): elements closer than this to (0, 0, 0) stop
+        obound0 (array-like): lower corner of the domain, defaults to
+            the lower corner of v0
+        obound1 (array-like): upper corner of the domain, defaults to
+            the upper corner of v0
+
+    Returns:
+        int: number of elements still alive
+    """
+    if type(v0) is not type(v1):
+        raise TypeError("v0 and v1 must have the same dtypes")
+    pts_arr = np.ascontiguousarray(pts, dtype=v0.crd_dtype)
+    if pts_arr.ndim != 2 or pts_arr.shape[0] != 3:
+        raise ValueError("pts must be 3xN")
+    if obound0 is None:
+        obound0 = np.full((3,), np.nan)
+    if obound1 is None:
+        obound1 = np.full((3,), np.nan)
+    obound0 = np.asarray(obound0, dtype=v0.crd_dtype).reshape(3)
+    obound1 = np.asarray(obound1, dtype=v0.crd_dtype).reshape(3)
+
+    nr_alive = _py_advance_pathlines(v0, v1, pts_arr, alive, t0, t1,
+                                     nr_substeps, speed_scale, ibound,
+                                     obound0, obound1)
+    if pts_arr is not pts:
+        pts[...] = pts_arr
+    return nr_alive
+
+def _py_advance_pathlines(FusedField v0, FusedField v1, real_t[:, ::1] pts,
+                          int[::1] alive, double t0, double t1,
+                          int nr_substeps, double speed_scale, double ibound,
+                          real_t[::1] obound0, real_t[::1] obound1):
+    cdef:
+        int i, j, c, nr_alive = 0
+        real_t h = (t1 - t0) / max(nr_substeps, 1)
+        real_t da = 1.0 / max(nr_substeps, 1)
+        real_t x[3]
+        real_t c_obound0[3]
+        real_t c_obound1[3]
+        real_t vscale[3]
+        int cached_idx3[3]
+
+    for c in range(3):
+        if v0.n[c] == 1:
+            # these hoops are required for processing 2d fields
+            vscale[c] = 0.0
+            c_obound0[c] = -MAX_FLOAT
+            c_obound1[c] = MAX_FLOAT
+        else:
+            vscale[c] = speed_scale * h
+            c_obound0[c] = v0.xlnc[c] if isnan(obound0[c]) else obound0[c]
+            c_obound1[c] = v0.xhnc[c] if isnan(obound1[c]) else obound1[c]
+    cached_idx3[:] = [0, 0, 0]
+
+    with nogil:
+        for i in range(pts.shape[1]):
+            if not alive[i]:
+                continue
+            x[0] = pts[0, i]
+            x[1] = pts[1, i]
+            x[2] = pts[2, i]
+            for j in range(nr_substeps):
+                if t1 == t0:
+                    break
+                if _c_pathline_rk4(v0, v1, x, j * da, da, vscale,
+                                   cached_idx3):
+                    alive[i] = 0
+                    break
+                if (x[0]**2 + x[1]**2 + x[2]**2 < ibound**2 or
+                    x[0] < c_obound0[0] or x[0] > c_obound1[0] or
+                    x[1] < c_obound0[1] or x[1] > c_obound1[1] or
+                    x[2] < c_obound0[2] or x[2] > c_obound1[2]):
+                    alive[i] = 0
+                    break
+                pts[0, i] = x[0]
+                pts[1, i] = x[1]
+                pts[2, i] = x[2]
+            if alive[i]:
+                nr_alive += 1
+    return nr_alive
+
+cdef inline void _c_pathline_v(FusedField v0, FusedField v1, real_t x[3],
+                               real_t a, real_t vscale[3], real_t k[3],
+                               int cached_idx3[3]) nogil:
+    """k = vscale * ((1 - a) * v0[x] + a * v1[x])"""
+    cdef int c
+    for c in range(3):
+        k[c] = vscale[c] * ((1.0 - a) * _c_interp_trilin[FusedField, real_t](v0, c, x, cached_idx3) +
+                            a * _c_interp_trilin[FusedField, real_t](v1, c, x, cached_idx3))
+
+cdef int _c_pathline_rk4(FusedField v0, FusedField v1, real_t x[3], real_t a,
+                         real_t da, real_t vscale[3],
+                         int cached_idx3[3]) nogil:
+    """One RK4 step in time from fraction a to a + da of the interval,
+    returns 1 if the velocity is nan"""
+    cdef int c
+    cdef real_t xs[3]
+    cdef real_t k1[3]
+    cdef real_t k2[3]
+    cdef real_t k3[3]
+    cdef real_t k4[3]
+
+    _c_pathline_v(v0, v1, x, a, vscale, k1, cached_idx3)
+    for c in range(3):
+        xs[c] = x[c] + 0.5 * k1[c]
+    _c_pathline_v(v0, v1, xs, a + 0.5 * da, vscale, k2, cached_idx3)
+    for c in range(3):
+        xs[c] = x[c] + 0.5 * k2[c]
+    _c_pathline_v(v0, v1, xs, a + 0.5 * da, vscale, k3, cached_idx3)
+    for c in range(3):
+        xs[c] = x[c] + k3[c]
+    _c_pathline_v(v0, v1, xs, a + da, vscale, k4, cached_idx3)
+    for c in range(3):
+        xs[c] = x[c] + (k1[c] + 2.0 * k2[c] + 2.0 * k3[c] + k4[c]) / 6.0
+        if isnan(xs[c]):
+            return 1
+    x[0] = xs[0]
+    x[1] = xs[1]
+    x[2] = xs[2]
+    return 0
+
+@cython.wraparound(True)
+def _assemble_packed(chunks, seed_slices, order, nr_streams):
+    """Merge PackedLines from each chunk into one in seed order"""
+    if len(chunks) == 1 and order is None:
+        return chunks[0]
+
+    # global seed index of each line in each chunk
+    if order is None:
+        order = np.arange(nr_streams)
+    idx = [order[slice(*slc)] for slc in seed_slices]
+
+    counts = np.zeros((nr_streams,), dtype=np.intp)
+    for chunk, chunk_idx in izip(chunks, idx):
+        counts[chunk_idx] = chunk.counts
+    offsets = np.zeros((nr_streams + 1,), dtype=np.intp)
+    np.cumsum(counts, out=offsets[1:])
+
+    vertices = np.empty((chunks[0].vertices.shape[0], offsets[-1]),
+                        dtype=chunks[0].vertices.dtype)
+    for chunk, chunk_idx in izip(chunks, idx):
+        # destination of each vertex = start of its line in the result
+        # + its position within the line
+        shift = offsets[chunk_idx] - chunk.offsets[:-1]
+        dest = np.repeat(shift, chunk.counts) + np.arange(chunk.nr_points)
+        vertices[:, dest] = chunk.vertices
+    return PackedLines(vertices, offsets)
+
 @cython.wraparound(True)
-def _do_streamline_star(*args, **kwargs):
+def _do_streamline_star(vfield, *args, **kwargs):
     """Wrapper for running in parallel using :py:module`Viscid.parallel`'s
     subprocessing helpers
+
+    vfield arrives as a memmap backed field from a SharedField
     """
-    # print("_global_fld type::", type(_global_fld))
-    gfld = _global_fld
-    return _streamline_fused_wrapper(gfld, *args, **kwargs)
+    return _streamline_fused_wrapper(make_cyamrfield(vfield), *args, **kwargs)
 
 def _streamline_fused_wrapper(FusedAMRField fld, int nr_streams, seed,
                               seed_slice=(None,), seed_center="cell", **kwargs):
@@ -314,7 +574,8 @@ def _py_streamline(FusedAMRField amrfld, FusedField active_patch,
                    real_t smallest_ds=0.0, real_t largest_ds=0.0,
                    real_t smallest_ds_frac=1e-2, real_t largest_ds_frac=1e2,
                    real_t max_error=0.0, str topo_style="msphere",
-                   str seed_center="cell"):
+                   str seed_center="cell", bint packed=False,
+                   str engine="scalar"):
     r""" Start calculating a streamline at x0
 
     Args:
@@ -323,7 +584,8 @@ def _py_streamline(FusedAMRField amrfld, FusedField active_patch,
             ctype b/c integrate_funcs are cdef'd for performance
         nr_streams (int):
         seed: can be a Seeds instance or a Coordinates instance, or
-            anything that exposes an iter_points method
+            anything that exposes a get_points method that takes a
+            `slc` keyword
         seed_slice (tuple): arguments for slice, (start, stop, [step])
 
 
@@ -336,7 +598,9 @@ def _py_streamline(FusedAMRField amrfld, FusedField active_patch,
 
         * `lines`: list of nr_streams ndarrays, each ndarray has shape
           (3, nr_points_in_stream). The nr_points_in_stream can be
-          different for each line
+          different for each line. If `packed`, the lines are appended
+          to one growing buffer and this is a
+          :py:class:`viscid.PackedLines`
         * `topo`: ndarray with shape (nr_streams,) of topology
           bitmask with values depending on the topo_style
     """
@@ -347,6 +611,7 @@ def _py_streamline(FusedAMRField amrfld, FusedField active_patch,
         real_t min_dx[3]
 
         int nr_patch = amrfld.active_patch_index
+        int ipatch
         FusedField patch = amrfld.active_patch
 
         # just for c
@@ -380,6 +645,10 @@ def _py_streamline(FusedAMRField amrfld, FusedField active_patch,
 
         int[:] topology_mv = None
         real_t[:, ::1] line_mv = None
+        real_t[:, ::1] pack_mv = None
+        Py_ssize_t[::1] offsets_mv = None
+        Py_ssize_t pack_n = 0
+        Py_ssize_t nr_pts
         real_t[:] dx
         real_t[:, ::1] seed_pts
 
@@ -391,6 +660,7 @@ def _py_streamline(FusedAMRField amrfld, FusedField active_patch,
 
     lines = None
     line_ndarr = None
+    pack_ndarr = None
     topology_ndarr = None
 
     # set up ds0 and c_obound from the limits of fld if they're not already
@@ -473,16 +743,39 @@ def _py_streamline(FusedAMRField amrfld, FusedField active_patch,
     # for profiling
     # t0_all = time()
 
-    seed_iter = islice(seed.iter_points(center=seed_center), *seed_slice)
-    seed_pts = np.array(list(seed_iter), dtype=amrfld.crd_dtype)
-
-    assert seed_pts.shape[1] == 3, "Seeds must have 3 spatial dimensions"
+    # only make the seeds for this slice, not all of them
+    seed_pts = np.ascontiguousarray(seed.get_points(center=seed_center,
+                                                    slc=slice(*seed_slice)),
+                                    dtype=amrfld.crd_dtype)
+
+    assert seed_pts.shape[0] == 3, "Seeds must have 3 spatial dimensions"
+
+    engine = engine.strip().lower()
+    if engine not in ("scalar", "batched"):
+        raise ValueError("Unknown streamline engine: {0}".format(engine))
+    if engine == "batched" and amrfld.nr_patches == 1:
+        nr_segs = _c_trace_batched[FusedField, real_t](
+            patch, seed_pts, method, integrate_func, end_flags_to_topology,
+            ds0, max_error, smallest_ds, largest_ds, vscale, ibound,
+            c_obound0, c_obound1, obound_r, max_length, stream_dir, maxit,
+            lines, topology_mv)
+        if lines is not None and packed:
+            lines = PackedLines.from_lines(lines)
+        return lines, topology_ndarr
+
+    if line_mv is not None and packed:
+        # the buffer is grown by doubling if lines are longer on average
+        pack_ndarr = np.empty((3, max(64 * seed_pts.shape[1], 1024)),
+                              dtype=amrfld.crd_dtype)
+        pack_mv = pack_ndarr
+        offsets_ndarr = np.zeros((seed_pts.shape[1] + 1,), dtype=np.intp)
+        offsets_mv = offsets_ndarr
 
     with nogil:
-        for i_stream in range(seed_pts.shape[0]):
-            x0[0] = seed_pts[i_stream, 0]
-            x0[1] = seed_pts[i_stream, 1]
-            x0[2] = seed_pts[i_stream, 2]
+        for i_stream in range(seed_pts.shape[1]):
+            x0[0] = seed_pts[0, i_stream]
+            x0[1] = seed_pts[1, i_stream]
+            x0[2] = seed_pts[2, i_stream]
 
             if line_mv is not None:
                 # line_mv[:, :] = NAN  # Debug only
@@ -516,14 +809,17 @@ def _py_streamline(FusedAMRField amrfld, FusedField active_patch,
                     pre_ds = fabs(ds)
 
                     if amrfld.nr_patches > 1:
-                        # IMPORTANT: for AMR fields, this with gil block will
-                        # absolutely destroy multithreaded performance because
-                        # it happens each integration step, but there seems
-                        # to be no gil-less way to change the active patch
-                        # in cython the way things are currently structured
-                        with gil:
-                            activate_patch[FusedAMRField, real_t](amrfld, s)
-                            patch = amrfld.active_patch
+                        # the patch search is done without the gil, and the
+                        # gil is only needed to swap the patch reference when
+                        # the line crosses into a new patch. The active patch
+                        # is tracked locally so threads don't step on each
+                        # other through amrfld
+                        ipatch = find_patch_index[FusedAMRField, real_t](amrfld,
+                                                                         nr_patch, s)
+                        if ipatch != nr_patch:
+                            nr_patch = ipatch
+                            with gil:
+                                patch = amrfld.patches[nr_patch]
 
                     ret = integrate_func(patch, s, &ds,
                                          max_error, smallest_ds, largest_ds,
@@ -565,7 +861,20 @@ def _py_streamline(FusedAMRField amrfld, FusedField active_patch,
                 end_flags |= done
 
             # now we have forward and background traces, process this streamline
-            if line_mv is not None:
+            if pack_mv is not None:
+                nr_pts = line_ends[1] - line_ends[0] - 1
+                if pack_n + nr_pts > pack_mv.shape[1]:
+                    with gil:
+                        pack_ndarr = _grow_buffer(pack_ndarr, pack_n,
+                                                  pack_n + nr_pts)
+                        pack_mv = pack_ndarr
+                for j in range(nr_pts):
+                    pack_mv[0, pack_n + j] = line_mv[0, line_ends[0] + 1 + j]
+                    pack_mv[1, pack_n + j] = line_mv[1, line_ends[0] + 1 + j]
+                    pack_mv[2, pack_n + j] = line_mv[2, line_ends[0] + 1 + j]
+                pack_n += nr_pts
+                offsets_mv[i_stream + 1] = pack_n
+            elif line_mv is not None:
                 with gil:
                     lines[i_stream] = line_ndarr[:, line_ends[0] + 1:line_ends[1]].copy()
 
@@ -578,8 +887,274 @@ def _py_streamline(FusedAMRField amrfld, FusedField active_patch,
     # print("=> in cython nr_segments: {0:.05e}".format(nr_segs))
     # print("=> in cython time: {0:.03f}s {1:.03e}s/seg".format(t, t / nr_segs))
 
+    if pack_ndarr is not None:
+        lines = PackedLines(pack_ndarr[:, :pack_n].copy(), offsets_ndarr)
+
     return lines, topology_ndarr
 
+def _grow_buffer(arr, n_used, n_needed):
+    """Copy the first n_used columns of arr into a buffer with at least
+    n_needed columns"""
+    new_arr = np.empty((arr.shape[0], max(2 * arr.shape[1], n_needed)),
+                       dtype=arr.dtype)
+    new_arr[:, :n_used] = arr[:, :n_used]
+    return new_arr
+
+cdef Py_ssize_t _c_trace_batched(FusedField fld, real_t[:, ::1] seed_pts,
+                                 int method,
+                                 int (*integrate_func)(FusedField fld, real_t x[3], real_t *ds,
+                                                       real_t max_error, real_t smallest_ds,
+                                                       real_t largest_ds, real_t vscale[3],
+                                                       int cached_idx3[3]) nogil except -1,
+                                 int (*end_flags_to_topology)(int _end_flags) nogil,
+                                 real_t ds0, real_t max_error,
+                                 real_t smallest_ds, real_t largest_ds,
+                                 real_t vscale[3], real_t ibound,
+                                 real_t obound0[3], real_t obound1[3],
+                                 real_t obound_r, real_t max_length,
+                                 int stream_dir, int maxit, list lines,
+                                 int[:] topology_mv) except -1:
+    """Trace streamlines a batch at a time on a single patch
+
+    Each seed has two lanes, 2 * slot for the backward half of the line
+    and 2 * slot + 1 for the forward half. Lane state is kept as
+    structure-of-arrays, and lanes[:nr_active] lists the lanes that are
+    still going. When both lanes of a seed are done, its line and
+    topology are written out and the slot takes the next seed.
+
+    Returns:
+        the number of integration steps
+    """
+    cdef:
+        int nr_seeds = seed_pts.shape[1]
+        int nr_slots = max(1, min(batch_size, nr_seeds))
+        int nl = 2 * nr_slots
+        int nr_active = 0
+        int next_seed = 0
+        int nr_finished
+        int i, j, l, q, side, done
+        Py_ssize_t nr_segs = 0
+        Py_ssize_t nb, nf
+        bint store_lines = lines is not None
+        real_t pt[3]
+        real_t x0[3]
+        real_t *s = NULL
+        real_t *ds = NULL
+        real_t *pre_ds = NULL
+        real_t *length = NULL
+        real_t *work = NULL
+        real_t **pts = NULL
+        real_t[:, ::1] buf_mv
+        int *lanes = NULL
+        int *ret = NULL
+        int *cached_idx3 = NULL
+        int *nr_pts = NULL
+        int *cap = NULL
+        int *slot_seed = NULL
+        int *slot_flags = NULL
+        int *slot_left = NULL
+        int *finished = NULL
+        list bufs = [None] * nl
+        # 1, 2, 4 for the stepwise euler1, rk2, rk4, else 0
+        int batch_order = 0
+
+    if method == EULER1:
+        batch_order = 1
+    elif method == RK2:
+        batch_order = 2
+    elif method == RK4:
+        batch_order = 4
+
+    try:
+        s = <real_t*> malloc(3 * nl * sizeof(real_t))
+        ds = <real_t*> malloc(nl * sizeof(real_t))
+        pre_ds = <real_t*> malloc(nl * sizeof(real_t))
+        length = <real_t*> malloc(nl * sizeof(real_t))
+        work = <real_t*> malloc(15 * nl * sizeof(real_t))
+        pts = <real_t**> malloc(nl * sizeof(real_t*))
+        lanes = <int*> malloc(nl * sizeof(int))
+        ret = <int*> malloc(nl * sizeof(int))
+        cached_idx3 = <int*> malloc(3 * nl * sizeof(int))
+        nr_pts = <int*> malloc(nl * sizeof(int))
+        cap = <int*> malloc(nl * sizeof(int))
+        slot_seed = <int*> malloc(nr_slots * sizeof(int))
+        slot_flags = <int*> malloc(nr_slots * sizeof(int))
+        slot_left = <int*> malloc(nr_slots * sizeof(int))
+        finished = <int*> malloc(nr_slots * sizeof(int))
+        if (s == NULL or ds == NULL or pre_ds == NULL or length == NULL or
+            work == NULL or pts == NULL or lanes == NULL or ret == NULL or
+            cached_idx3 == NULL or nr_pts == NULL or cap == NULL or
+            slot_seed == NULL or slot_flags == NULL or slot_left == NULL or
+            finished == NULL):
+            raise MemoryError()
+
+        for l in range(nl):
+            cached_idx3[3 * l + 0] = 0
+            cached_idx3[3 * l + 1] = 0
+            cached_idx3[3 * l + 2] = 0
+            nr_pts[l] = 0
+            cap[l] = 0
+            if store_lines:
+                bufs[l] = np.empty((64, 3), dtype=np.asarray(seed_pts).dtype)
+                buf_mv = bufs[l]
+                pts[l] = &buf_mv[0, 0]
+                cap[l] = buf_mv.shape[0]
+
+        # every slot starts out finished, with no seed
+        nr_finished = nr_slots
+        for q in range(nr_slots):
+            finished[q] = q
+            slot_seed[q] = -1
+
+        while True:
+            # write out finished seeds, and give their slots new seeds
+            while nr_finished > 0:
+                nr_finished -= 1
+                q = finished[nr_finished]
+                i = slot_seed[q]
+                if i >= 0:
+                    if topology_mv is not None:
+                        topology_mv[i] = end_flags_to_topology(slot_flags[q])
+                    if store_lines:
+                        nb = nr_pts[2 * q]
+                        nf = nr_pts[2 * q + 1]
+                        line = np.empty((3, nb + 1 + nf),
+                                        dtype=bufs[2 * q].dtype)
+                        line[:, :nb] = bufs[2 * q][:nb][::-1].T
+                        line[:, nb] = np.asarray(seed_pts[:, i])
+                        line[:, nb + 1:] = bufs[2 * q + 1][:nf].T
+                        lines[i] = line
+
+                if next_seed >= nr_seeds:
+                    slot_seed[q] = -1
+                    continue
+                i = next_seed
+                next_seed += 1
+                slot_seed[q] = i
+                slot_flags[q] = _C_END_NONE
+                slot_left[q] = 0
+                for side in range(2):
+                    l = 2 * q + side
+                    nr_pts[l] = 0
+                    if side == 0 and not (stream_dir & _C_DIR_BACKWARD):
+                        continue
+                    elif side == 1 and not (stream_dir & _C_DIR_FORWARD):
+                        continue
+                    s[l] = seed_pts[0, i]
+                    s[nl + l] = seed_pts[1, i]
+                    s[2 * nl + l] = seed_pts[2, i]
+                    ds[l] = (2 * side - 1) * ds0
+                    length[l] = 0.0
+                    lanes[nr_active] = l
+                    nr_active += 1
+                    slot_left[q] += 1
+                if slot_left[q] == 0:
+                    finished[nr_finished] = q
+                    nr_finished += 1
+
+            if nr_active == 0:
+                break
+
+            with nogil:
+                # step every active lane once
+                for j in range(nr_active):
+                    pre_ds[lanes[j]] = fabs(ds[lanes[j]])
+
+                if batch_order == 1:
+                    _c_euler1_batch(fld, nr_active, lanes, nl, s, ds, work,
+                                    vscale, cached_idx3, ret)
+                elif batch_order == 2:
+                    _c_rk2_batch(fld, nr_active, lanes, nl, s, ds, work,
+                                 vscale, cached_idx3, ret)
+                elif batch_order == 4:
+                    _c_rk4_batch(fld, nr_active, lanes, nl, s, ds, work,
+                                 vscale, cached_idx3, ret)
+                else:
+                    for j in range(nr_active):
+                        l = lanes[j]
+                        pt[0] = s[l]
+                        pt[1] = s[nl + l]
+                        pt[2] = s[2 * nl + l]
+                        ret[l] = integrate_func(fld, pt, &ds[l], max_error,
+                                                smallest_ds, largest_ds,
+                                                vscale, &cached_idx3[3 * l])
+                        s[l] = pt[0]
+                        s[nl + l] = pt[1]
+                        s[2 * nl + l] = pt[2]
+                nr_segs += nr_active
+
+                # record points, and drop lanes that are done
+                j = 0
+                while j < nr_active:
+                    l = lanes[j]
+                    q = l // 2
+                    if fabs(ds[l]) >= pre_ds[l]:
+                        length[l] += pre_ds[l]
+                    else:
+                        length[l] += fabs(ds[l])
+
+                    if ret[l] != 0:
+                        done = _C_END_ZERO_LENGTH
+                    else:
+                        pt[0] = s[l]
+                        pt[1] = s[nl + l]
+                        pt[2] = s[2 * nl + l]
+                        if store_lines:
+                            if nr_pts[l] == cap[l]:
+                                with gil:
+                                    bufs[l] = _grow_rows(bufs[l])
+                                    buf_mv = bufs[l]
+                                    pts[l] = &buf_mv[0, 0]
+                                    cap[l] = buf_mv.shape[0]
+                            pts[l][3 * nr_pts[l] + 0] = pt[0]
+                            pts[l][3 * nr_pts[l] + 1] = pt[1]
+                            pts[l][3 * nr_pts[l] + 2] = pt[2]
+                        nr_pts[l] += 1
+
+                        x0[0] = seed_pts[0, slot_seed[q]]
+                        x0[1] = seed_pts[1, slot_seed[q]]
+                        x0[2] = seed_pts[2, slot_seed[q]]
+                        done = classify_endpoint(pt, length[l], ibound,
+                                                 obound0, obound1, obound_r,
+                                                 max_length, ds[l], x0)
+                        if done == _C_END_NONE and nr_pts[l] >= maxit:
+                            done = _C_END_OTHER | _C_END_MAXIT
+
+                    if done:
+                        slot_flags[q] |= done
+                        slot_left[q] -= 1
+                        if slot_left[q] == 0:
+                            finished[nr_finished] = q
+                            nr_finished += 1
+                        nr_active -= 1
+                        lanes[j] = lanes[nr_active]
+                    else:
+                        j += 1
+    finally:
+        free(s)
+        free(ds)
+        free(pre_ds)
+        free(length)
+        free(work)
+        free(pts)
+        free(lanes)
+        free(ret)
+        free(cached_idx3)
+        free(nr_pts)
+        free(cap)
+        free(slot_seed)
+        free(slot_flags)
+        free(slot_left)
+        free(finished)
+
+    return nr_segs
+
+def _grow_rows(arr):
+    """Copy arr into a buffer with twice as many rows"""
+    new_arr = np.empty((2 * arr.shape[0], arr.shape[1]), dtype=arr.dtype)
+    new_arr[:arr.shape[0]] = arr
+    return new_arr
+
 cdef inline int classify_endpoint(real_t pt[3], real_t length, real_t ibound,
                            real_t obound0[3], real_t obound1[3], real_t obound_r,
                            real_t max_length, real_t ds, real_t pt0[3]) nogil:
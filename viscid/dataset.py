@@ -12,6 +12,7 @@ import viscid
 from viscid import logger
 from viscid.compat import string_types
 from viscid.bucket import Bucket
+from viscid.grid import DerivedFieldCache
 from viscid import tree
 from viscid import vutil
 from viscid.vutil import tree_prefix
@@ -31,6 +32,7 @@ class Dataset(tree.Node):
     """
     children = None  # Bucket or (time, grid)
     active_child = None
+    derived_cache = None
 
     topology_info = None
     geometry_info = None
@@ -210,6 +212,11 @@ class DatasetTemporal(Dataset):
         Datasets should probably be created using a vfile's
         `_make_dataset` to make sure the info dict is propogated
         appropriately
+
+    Attributes:
+        derived_cache (DerivedFieldCache): derived fields of all the
+            grids in this dataset share this cache, and its byte
+            budget
     """
     _last_ind = 0
     # _all_times = None
@@ -220,6 +227,7 @@ class DatasetTemporal(Dataset):
         # TODO: it's kind of a kludge to create a bucket then destroy it
         # so soon, but it's not a big deal
         self.children = []
+        self.derived_cache = DerivedFieldCache()
         # self._all_times = []
 
     def add(self, child, set_active=True):
@@ -242,11 +250,13 @@ class DatasetTemporal(Dataset):
             self.tear_down_child(child[1])
             child[1].remove_all_items()
         self.children = []
+        self.derived_cache.clear()
 
     def clear_cache(self):
         """Clear all childrens' caches"""
         for child in self.children:
             child[1].clear_cache()
+        self.derived_cache.clear()
 
     def activate(self, time):
         self.active_child = self.get_child(time)
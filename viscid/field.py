@@ -17,6 +17,7 @@ import viscid
 from viscid import logger
 from viscid.compat import string_types, izip_longest
 from viscid import coordinate
+from viscid import memory
 from viscid.cython import interp_trilin
 from viscid.sliceutil import to_slice
 from viscid import tree
@@ -725,9 +726,14 @@ class Field(tree.Leaf):
     def data(self):
         """ if you want to fill the cache, this will do it, note that
         to empty the cache later you can always use clear_cache """
-        if self._cache is None:
+        dat = self._cache
+        if dat is None:
             self._fill_cache()
-        return self._cache
+            dat = self._cache
+            memory.track(self)
+        elif memory.max_nbytes is not None:
+            memory.touch(self)
+        return dat
     @data.setter
     def data(self, dat):
         # clean up
@@ -779,9 +785,11 @@ class Field(tree.Leaf):
         """ does not guarentee that the memory will be freed """
         self._cache = None
         self._cached_xyz_src_view = None
+        memory.forget(self)
         if self._parent_field is not None:
             self._parent_field._cache = self._cache
             self._parent_field._cached_xyz_src_view = self._cached_xyz_src_view
+            memory.forget(self._parent_field)
 
     def _fill_cache(self):
         """ actually load data into the cache """
@@ -794,6 +802,7 @@ class Field(tree.Leaf):
         """Resolve all pending actions on a field like translations etc"""
         if self._cache is None:
             self._fill_cache()
+            memory.track(self)
         return self
 
     # um, what was this for? looks dangerous
@@ -840,7 +849,10 @@ class Field(tree.Leaf):
                     # transposed view
                     Tview = np.transpose(self._src_data.__array__(),
                                          spatial_transpose)
-                    self._cached_xyz_src_view = np.array(Tview)
+                    # memmaps are already private (copy-on-write) views
+                    # of the file, so don't spend memory duplicating them
+                    copy = not isinstance(Tview, np.memmap)
+                    self._cached_xyz_src_view = np.array(Tview, copy=copy)
 
             else:
                 self._cached_xyz_src_view = self._src_data
@@ -1240,8 +1252,9 @@ class Field(tree.Leaf):
                 native_first_slc = first_slc[::-1]
                 native_second_slc = second_slc[::-1]
             else:
-                native_first_slc = first_slc
-                native_second_slc = second_slc
+                # copies, since the component slice is inserted into both
+                native_first_slc = list(first_slc)
+                native_second_slc = list(second_slc)
 
             # now put component slice back in
             try:
@@ -1341,6 +1354,7 @@ class Field(tree.Leaf):
     def forget_source(self):
         self._src_data = self.data
         self._cached_xyz_src_view = self.data
+        memory.forget(self)
 
     def slice(self, selection):
         """ Slice the field using a string like "y=3:6:2,z=0" or a standard
@@ -1451,10 +1465,10 @@ class Field(tree.Leaf):
     def points(self, center=None, **kwargs):
         return self.get_points(center=center, **kwargs)
 
-    def get_points(self, center=None, **kwargs):  # pylint: disable=unused-argument
+    def get_points(self, center=None, slc=None, **kwargs):  # pylint: disable=unused-argument
         if center is None:
             center = self.center
-        return self._src_crds.get_points(center=center)
+        return self._src_crds.get_points(center=center, slc=slc)
 
     def as_mesh(self, center=None, **kwargs):  # pylint: disable=unused-argument
         if center is None:
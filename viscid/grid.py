@@ -2,13 +2,175 @@
 """Grids contain fields and coordinates"""
 
 from __future__ import print_function
+from contextlib import contextmanager
+import threading
+
+import numpy as np
 
 from viscid import field
 from viscid.bucket import Bucket
+from viscid.compat import OrderedDict
 from viscid import tree
 from viscid.vutil import tree_prefix
 from viscid.calculator.evaluator import evaluate
 
+
+# stack of (grid, set of field names) for the derived fields that are
+# being calculated in this thread
+_recording = threading.local()
+
+
+def _record_dependency(grid, *fldnames):
+    for g, deps in getattr(_recording, "stack", ()):
+        if g is grid:
+            deps.update(fldnames)
+
+@contextmanager
+def _recording_dependencies(grid):
+    """Collect the names of all fields grid gives out in this context"""
+    if not hasattr(_recording, "stack"):
+        _recording.stack = []
+    deps = set()
+    _recording.stack.append((grid, deps))
+    try:
+        yield deps
+    finally:
+        _recording.stack.pop()
+
+def _slc_key(slc):
+    """Make a hashable key out of a slice, raises TypeError if we can't"""
+    if isinstance(slc, (list, tuple)):
+        return tuple(_slc_key(s) for s in slc)
+    elif isinstance(slc, slice):
+        return (slice, _slc_key(slc.start), _slc_key(slc.stop),
+                _slc_key(slc.step))
+    hash(slc)
+    return slc
+
+def _field_nbytes(fld):
+    """Bytes of memory held by a field's source array and cache"""
+    src = getattr(fld, "_src_data", None)
+    cache = getattr(fld, "_cache", None)
+    nbytes = 0
+    if isinstance(src, np.ndarray) and not isinstance(src, np.memmap):
+        nbytes += src.nbytes
+    else:
+        src = None
+    if isinstance(cache, np.ndarray):
+        if src is None or not np.may_share_memory(src, cache):
+            nbytes += cache.nbytes
+    return nbytes
+
+
+class DerivedFieldCache(object):
+    """LRU cache of the derived fields of one or more grids
+
+    Derived fields are the ones a grid calculates with ``_get_*``
+    methods or equations. Entries are keyed on (grid, field name,
+    variant), where variant tells apart versions of a field (the
+    slice, and grid settings like force_vector_layout), and remember
+    the names of the fields that were used to calculate them, so a grid can drop the entries that depend on a
+    field when that field changes. All the grids in a DatasetTemporal
+    share one cache, so the byte budget applies to the whole time
+    series.
+
+    Note:
+        The sizes of entries are only checked when something is added
+        to the cache, so a lazy field (like a vector assembled from
+        components) only counts against the budget once it's loaded.
+
+    Attributes:
+        max_nbytes (int): evict least recently used entries once the
+            data held by the cache is bigger than this. None means
+            no limit. Default: 512 MiB
+        hits (int): number of lookups that found a field
+        misses (int): number of lookups that had to calculate a field
+        evictions (int): number of entries dropped to stay in budget
+    """
+    max_nbytes = 512 * 1024**2
+
+    def __init__(self, max_nbytes=None):
+        if max_nbytes is not None:
+            self.max_nbytes = max_nbytes
+        # keys are (grid, fldname, variant), values are (fld, deps)
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def nbytes(self):
+        """Bytes of data held by the cache"""
+        with self._lock:
+            return sum(_field_nbytes(fld) for fld, _ in self._entries.values())
+
+    def get(self, grid, fldname, variant):
+        """Get (fld, deps) and mark it as recently used, or None"""
+        key = (grid, fldname, variant)
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                self.misses += 1
+            else:
+                self._entries[key] = entry
+                self.hits += 1
+            return entry
+
+    def put(self, grid, fldname, variant, fld, deps):
+        """Add a field that was calculated from the fields named deps"""
+        with self._lock:
+            self._entries.pop((grid, fldname, variant), None)
+            self._entries[(grid, fldname, variant)] = (fld, frozenset(deps))
+            self.trim()
+
+    def trim(self):
+        """Evict least recently used entries until we're in budget"""
+        if self.max_nbytes is None:
+            return
+        with self._lock:
+            sizes = [_field_nbytes(fld) for fld, _ in self._entries.values()]
+            nbytes = sum(sizes)
+            for key, size in zip(list(self._entries.keys()), sizes):
+                if nbytes <= self.max_nbytes:
+                    break
+                del self._entries[key]
+                nbytes -= size
+                self.evictions += 1
+
+    def invalidate(self, grid=None, fldnames=None):
+        """Drop entries of grid that depend on any of fldnames
+
+        Args:
+            grid (Grid): only drop entries of this grid, or entries of
+                all grids if None
+            fldnames (sequence): drop entries for these fields, and
+                entries calculated from them. If None, drop all
+                entries.
+        """
+        if fldnames is not None:
+            fldnames = set(fldnames)
+        with self._lock:
+            for key, (_, deps) in list(self._entries.items()):
+                if grid is not None and key[0] is not grid:
+                    continue
+                if (fldnames is None or key[1] in fldnames or
+                        not fldnames.isdisjoint(deps)):
+                    del self._entries[key]
+
+    def clear(self):
+        """Drop all entries"""
+        self.invalidate()
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
 class Grid(tree.Node):
     """Computational grid container
 
@@ -33,6 +195,16 @@ class Grid(tree.Node):
             "shell copies" of fields are made so that memory is freed
             when the returned instance is garbage collected.
             Default: False
+        cache_derived_fields (bool): If True, fields calculated with
+            ``_get_*`` methods or equations are kept in a
+            :py:class:`DerivedFieldCache` so asking for them again
+            doesn't redo the calculation. Entries are dropped when a
+            field they were calculated from is added, replaced or
+            removed, or by clear_cache. Since cached fields are shared,
+            don't modify them in place. Default: False
+        derived_cache_attrs (tuple): names of grid attributes that
+            change what ``_get_*`` methods calculate; derived fields
+            are cached separately for each combination of their values
     """
     topology_info = None
     geometry_info = None
@@ -48,6 +220,10 @@ class Grid(tree.Node):
     # by grids that get created in the future
     force_vector_layout = field.LAYOUT_DEFAULT
     longterm_field_caches = False
+    cache_derived_fields = False
+    derived_cache_attrs = ("force_vector_layout", "longterm_field_caches")
+
+    _derived_cache = None
 
     def __init__(self, *args, **kwargs):
         super(Grid, self).__init__(*args, **kwargs)
@@ -71,6 +247,22 @@ class Grid(tree.Node):
     def crds(self, val):
         self._crds = None
         self._src_crds = val
+        self.invalidate_derived()
+
+    @property
+    def derived_cache(self):
+        """The DerivedFieldCache of the closest temporal dataset, or
+        one that belongs to just this grid if there is none"""
+        if self._derived_cache is None:
+            def _condition(obj, _):
+                return (not isinstance(obj, Grid) and
+                        getattr(obj, "derived_cache", None) is not None)
+            parent = self._parent_bfs(_condition)
+            if parent is None:
+                self._derived_cache = DerivedFieldCache()
+            else:
+                self._derived_cache = parent.derived_cache
+        return self._derived_cache
 
     @property
     def xl_nc(self):
@@ -103,16 +295,30 @@ class Grid(tree.Node):
                 f.layout = self.force_vector_layout
             self.prepare_child(f)
             self.fields[f.name] = f
+        self.invalidate_derived(*[f.name for f in fields])
 
     def remove_all_items(self):
         for fld in self.fields:
             self.tear_down_child(fld)
         self.fields = Bucket(ordered=True)
+        self.invalidate_derived()
 
     def clear_cache(self):
-        """clear the cache on all child fields"""
+        """clear the cache on all child fields, and forget derived
+        fields"""
         for fld in self.fields:
             fld.clear_cache()
+        self.invalidate_derived()
+
+    def invalidate_derived(self, *fldnames):
+        """Forget cached derived fields that depend on fldnames
+
+        Call this after modifying a field's data in place. Without
+        fldnames, all of this grid's derived fields are forgotten.
+        """
+        if self._derived_cache is None:
+            return
+        self.derived_cache.invalidate(self, fldnames if fldnames else None)
 
     def nr_times(self, *args, **kwargs):  # pylint: disable=W0613,R0201
         return 1
@@ -204,6 +410,30 @@ class Grid(tree.Node):
     ##
     def get_field(self, fldname, time=None, force_longterm_caches=False,
                   slc=None):  # pylint: disable=unused-argument
+        _record_dependency(self, fldname)
+        if not self.cache_derived_fields or fldname in self.fields:
+            return self._make_field(fldname, force_longterm_caches, slc)
+
+        try:
+            variant = (_slc_key(slc),
+                       tuple(getattr(self, attr)
+                             for attr in self.derived_cache_attrs))
+            hash(variant)
+        except TypeError:
+            return self._make_field(fldname, force_longterm_caches, slc)
+
+        cache = self.derived_cache
+        entry = cache.get(self, fldname, variant)
+        if entry is not None:
+            _record_dependency(self, *entry[1])
+            return entry[0]
+
+        with _recording_dependencies(self) as deps:
+            ret = self._make_field(fldname, force_longterm_caches, slc)
+        cache.put(self, fldname, variant, ret, deps)
+        return ret
+
+    def _make_field(self, fldname, force_longterm_caches, slc):
         ret = None
         try_final_slice = True
 
@@ -257,9 +487,11 @@ class Grid(tree.Node):
 
     def __setitem__(self, fldname, fld):
         self.fields[fldname] = fld
+        self.invalidate_derived(fldname)
 
     def __delitem__(self, fldname):
         self.fields.__delitem__(fldname)
+        self.invalidate_derived(fldname)
 
     def __str__(self):
         return "<Grid name={0}>".format(self.name)
@@ -0,0 +1,277 @@
+"""Precomputed interpolation weights for interpolating to fixed seeds
+
+Interpolating every time step onto the same seeds (spheres, ionosphere
+grids, volumes) means finding the same cell indices over and over. An
+:py:class:`InterpPlan` does that search once for a set of coordinates
+and seeds, and then interpolating any field on those coordinates is
+just a vectorized gather.
+"""
+
+from __future__ import print_function, division
+from collections import OrderedDict
+from itertools import product
+import threading
+
+import numpy as np
+
+from viscid.seed import to_seeds
+
+
+__all__ = ['InterpPlan', 'get_interp_plan']
+
+
+# max number of plans kept around by get_interp_plan, 0 disables the cache
+plan_cache_size = 8
+
+_plan_cache = OrderedDict()
+_plan_cache_lock = threading.Lock()
+
+
+class InterpPlan(object):
+    """Cell indices and weights for interpolating to some seeds
+
+    For each point and each spatial axis, the plan stores the index of
+    the crd at or before the point (int32), the index after it, and the
+    fractional distance between the two (float32 by default). Applying
+    the plan to a field gathers the corners of the cell containing
+    each point and blends them with these weights. Like
+    :py:func:`viscid.interp`, nearest neighbor is used beyond the last
+    coordinate so values are never extrapolated.
+
+    Note:
+        Plans only work for node or cell centered fields that are not
+        AMR; use :py:func:`viscid.interp` for everything else.
+    """
+    def __init__(self, crds, seeds, center="node", kind="linear",
+                 weight_dtype='f4'):
+        """Locate seeds on crds
+
+        Parameters:
+            crds (viscid.coordinate.StructuredCrds): coordinates of
+                the fields this plan will be applied to
+            seeds: anything :py:func:`viscid.seed.to_seeds` understands
+            center (str): centering of the fields, 'node' or 'cell'
+            kind (str): either 'linear' or 'nearest'
+            weight_dtype (dtype): storage type of the weights
+
+        Raises:
+            ValueError: if center or kind are not understood
+        """
+        center = center.lower()
+        if center not in ("node", "cell"):
+            raise ValueError("InterpPlan only understands node or cell "
+                             "centered fields, not '{0}'".format(center))
+        kind = _normalize_kind(kind)
+
+        seeds = to_seeds(seeds)
+        seed_center = seeds.center if hasattr(seeds, 'center') else center
+        if seed_center.lower() in ('face', 'edge'):
+            seed_center = 'cell'
+        pts = seeds.get_points(center=seed_center)
+
+        self.crds = crds
+        self.seeds = seeds
+        self.center = center
+        self.kind = kind
+        self.nr_points = pts.shape[1]
+        if center == "node":
+            self.sshape = list(crds.shape_nc)
+        else:
+            self.sshape = list(crds.shape_cc)
+
+        cartesian = all(ax in "xyz" for ax in crds.axes)
+        self.ilo = []
+        self.ihi = []
+        self.weights = []
+        for i, ax in enumerate(crds.axes):
+            if cartesian:
+                row = pts["xyz".index(ax)]
+            else:
+                row = pts[i]
+            lo, hi, w = _locate_axis(crds.get_crd(ax, center=center), row,
+                                     kind == "nearest")
+            self.ilo.append(lo)
+            self.ihi.append(hi)
+            self.weights.append(w.astype(weight_dtype))
+
+    @property
+    def nbytes(self):
+        """bytes used by the indices and weights"""
+        return sum(a.nbytes for a in self.ilo + self.ihi + self.weights)
+
+    def matches(self, crds, seeds, center, kind):
+        """True if this plan can be used for crds / seeds / center / kind"""
+        if seeds is not self.seeds or center.lower() != self.center:
+            return False
+        if _normalize_kind(kind) != self.kind:
+            return False
+        if crds is self.crds:
+            return True
+        if list(crds.axes) != list(self.crds.axes):
+            return False
+        for ax in crds.axes:
+            if not np.array_equal(crds.get_crd(ax, center=self.center),
+                                  self.crds.get_crd(ax, center=self.center)):
+                return False
+        return True
+
+    def apply(self, fld, wrap=True):
+        """Interpolate a field using this plan
+
+        Parameters:
+            fld (viscid.field.Field): scalar or vector field on the
+                same crds / centering that the plan was made for
+            wrap (bool): if true, then call seeds.wrap on the result
+
+        Returns:
+            Same as :py:func:`viscid.interp`
+
+        Raises:
+            ValueError: if fld is AMR or does not have the shape this
+                plan was made for
+        """
+        if fld.nr_patches > 1:
+            raise ValueError("InterpPlan can not be applied to AMR fields")
+        if not fld.iscentered(self.center) or fld.sshape != self.sshape:
+            raise ValueError("Field {0} is not on the grid this plan was "
+                             "made for".format(fld.name))
+
+        # gather from a flat view using element offsets, this is quite a
+        # bit faster than fancy indexing with a tuple of index arrays
+        dat = np.ascontiguousarray(fld.data)
+        flat = dat.reshape(-1)
+        strides = [st // dat.itemsize for st in dat.strides]
+        scalar = fld.nr_comps == 0
+        if scalar:
+            comp_offsets = [0]
+        else:
+            comp_stride = strides.pop(fld.nr_comp)
+            comp_offsets = [i * comp_stride for i in range(fld.nr_comps)]
+
+        if self.kind == "nearest":
+            corners = [(sum(st * lo.astype(np.intp)
+                            for st, lo in zip(strides, self.ilo)), None)]
+        else:
+            # offset and weight of each corner of the cells
+            corners = []
+            for corner in product((0, 1), repeat=len(self.ilo)):
+                idx = 0
+                w = 1
+                for d, upper in enumerate(corner):
+                    if upper:
+                        idx = idx + strides[d] * self.ihi[d].astype(np.intp)
+                        w = w * self.weights[d]
+                    else:
+                        idx = idx + strides[d] * self.ilo[d].astype(np.intp)
+                        w = w * (1 - self.weights[d])
+                corners.append((idx, w))
+
+        out_dtype = dat.dtype
+        if self.kind == "linear":
+            out_dtype = np.result_type(dat.dtype, self.weights[0].dtype)
+        result = np.empty((self.nr_points, len(comp_offsets)), dtype=out_dtype)
+        for m, comp_offset in enumerate(comp_offsets):
+            if self.kind == "nearest":
+                result[:, m] = np.take(flat, corners[0][0] + comp_offset)
+            else:
+                val = 0
+                for idx, w in corners:
+                    val = val + w * np.take(flat, idx + comp_offset)
+                result[:, m] = val
+        if scalar:
+            result = result[:, 0]
+
+        if wrap:
+            if scalar:
+                result = self.seeds.wrap_field(result, name=fld.name)
+            else:
+                result = self.seeds.wrap_field(result, name=fld.name,
+                                               fldtype="vector",
+                                               layout="interlaced")
+        return result
+
+
+def get_interp_plan(crds, seeds, center="node", kind="linear"):
+    """Get an InterpPlan, reusing one from a recent call if possible
+
+    Plans are looked up by the identity of crds first, then by value,
+    so a time series whose grids all have the same coordinates will
+    only locate the seeds once. The number of plans kept is set by
+    `viscid.interp_plan.plan_cache_size`.
+
+    Parameters:
+        crds (viscid.coordinate.StructuredCrds): coordinates
+        seeds: seeds to interpolate to; note that the cache looks
+            these up by identity, so reuse the same seed object
+        center (str): 'node' or 'cell'
+        kind (str): either 'linear' or 'nearest'
+
+    Returns:
+        :py:class:`InterpPlan`
+    """
+    if plan_cache_size <= 0:
+        return InterpPlan(crds, seeds, center=center, kind=kind)
+
+    with _plan_cache_lock:
+        # check by identity first since it's much cheaper
+        hit = None
+        for key, plan in _plan_cache.items():
+            if plan.crds is crds and plan.matches(crds, seeds, center, kind):
+                hit = key
+                break
+        else:
+            for key, plan in _plan_cache.items():
+                if plan.matches(crds, seeds, center, kind):
+                    hit = key
+                    break
+        if hit is not None:
+            # move to the end of the line for LRU eviction
+            plan = _plan_cache.pop(hit)
+            _plan_cache[hit] = plan
+            return plan
+
+    plan = InterpPlan(crds, seeds, center=center, kind=kind)
+    with _plan_cache_lock:
+        _plan_cache[id(plan)] = plan
+        while len(_plan_cache) > plan_cache_size:
+            _plan_cache.popitem(last=False)
+    return plan
+
+def _normalize_kind(kind):
+    kind = kind.strip().lower()
+    if kind in ("linear", "trilinear", "trilin"):
+        return "linear"
+    elif kind == "nearest":
+        return kind
+    else:
+        raise ValueError("kind '{0}' not understood. Use linear or nearest"
+                         "".format(kind))
+
+def _locate_axis(crd, x, nearest):
+    """Preceeding index, next index, and weight of x along crd"""
+    n = len(crd)
+    if n == 1:
+        zeros = np.zeros(len(x), dtype='i4')
+        return zeros, zeros, np.zeros(len(x), dtype=crd.dtype)
+
+    lo = np.searchsorted(crd, x, side='right') - 1
+    lo = np.clip(lo, 0, n - 2).astype('i4')
+    hi = lo + 1
+    if nearest:
+        closer_hi = np.abs(crd[hi] - x) < np.abs(crd[lo] - x)
+        lo = np.where(closer_hi, hi, lo).astype('i4')
+        return lo, lo, np.zeros(len(x), dtype=crd.dtype)
+
+    w = (x - crd[lo]) / (crd[hi] - crd[lo])
+    # nearest neighbor beyond the ends of crd, like viscid.interp
+    below = x <= crd[0]
+    above = x >= crd[-1]
+    lo[above] = n - 1
+    hi[below] = 0
+    hi[above] = n - 1
+    w[below | above] = 0.0
+    return lo, hi, w
+
+##
+## EOF
+##
@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+"""Keep a tally of the memory held by field caches
+
+Fields load their data into a cache the first time it's needed, and
+keep it until clear_cache is called. This module keeps track of those
+caches for the whole process. If a budget is set, then loading a field
+clears the least recently used caches that can be loaded again (from
+a file, or from other fields) until the total is back in budget.
+
+The budget can be set in ``~/.viscidrc`` with a line like::
+
+    "memory.max_nbytes": "4 GiB"
+
+Note:
+    Only bytes that clearing a cache would free are counted, so a
+    field that wraps an array in memory doesn't count unless its cache
+    is a copy (like a transposed or re-laid out array). Fields like that
+    are never cleared to stay in budget since there's nowhere to reload
+    them from.
+
+Warning:
+    Clearing a cache throws away changes made to a field's data in
+    place, so when a budget is set, don't expect in-place edits of
+    fields that come from files to stick around.
+
+Attributes:
+    max_nbytes (int, str, None): budget for all field caches in bytes,
+        or a string like "512 MiB", "4G" or "2 GB". None means there
+        is no budget. Default: None
+"""
+
+from __future__ import division, print_function
+import re
+import threading
+import weakref
+
+import numpy as np
+
+from viscid import logger
+from viscid.compat import OrderedDict, string_types
+
+
+__all__ = ["memory_usage", "print_memory_usage"]
+
+
+max_nbytes = None
+
+_lock = threading.RLock()
+# keys are id(fld), values are [weakref to fld, nbytes, reloadable]
+_tracked = OrderedDict()
+_total_nbytes = 0
+
+_UNITS = {"": 1, "k": 1024, "m": 1024**2, "g": 1024**3, "t": 1024**4}
+
+
+def parse_nbytes(val):
+    """Turn something like "512 MiB", "4G" or "2 GB" into an int
+
+    Binary suffixes ("K", "KiB", "M", "MiB", ...) are powers of 1024,
+    and decimal suffixes ("KB", "MB", ...) are powers of 1000.
+
+    Returns:
+        int or None if val is None
+    """
+    if val is None:
+        return None
+    if not isinstance(val, string_types):
+        return int(val)
+    m = re.match(r"^\s*([0-9.]+(?:e[0-9]+)?)\s*(?:([kmgt])(i?)(b?))?\s*$", val,
+                 re.I)
+    if m is None:
+        raise ValueError("Can't read '{0}' as a number of bytes".format(val))
+    number, unit, binary, byte = m.groups()
+    if unit is None:
+        return int(float(number))
+    unit = unit.lower()
+    if byte and not binary:
+        scale = 1000**"_kmgt".index(unit)
+    else:
+        scale = _UNITS[unit]
+    return int(float(number) * scale)
+
+def _budget():
+    return parse_nbytes(max_nbytes)
+
+def _cache_nbytes(fld):
+    """Bytes that clearing fld's cache would free"""
+    src = fld._src_data  # pylint: disable=protected-access
+    if not isinstance(src, np.ndarray) or isinstance(src, np.memmap):
+        src = None
+    seen = [src] if src is not None else []
+    nbytes = 0
+    cached = [fld._cache, fld._cached_xyz_src_view]  # pylint: disable=protected-access
+    if isinstance(cached[1], (list, tuple)):
+        cached = cached[:1] + list(cached[1])
+    for arr in cached:
+        if not isinstance(arr, np.ndarray):
+            continue
+        if any(np.may_share_memory(arr, s) for s in seen):
+            continue
+        seen.append(arr)
+        nbytes += arr.nbytes
+    return nbytes
+
+def _is_reloadable(fld):
+    src = fld._src_data  # pylint: disable=protected-access
+    if src is None:
+        return False
+    return not isinstance(src, np.ndarray) or isinstance(src, np.memmap)
+
+def _forget_ref(ref, key):
+    global _total_nbytes  # pylint: disable=global-statement
+    with _lock:
+        entry = _tracked.get(key, None)
+        if entry is not None and entry[0] is ref:
+            del _tracked[key]
+            _total_nbytes -= entry[1]
+
+def track(fld):
+    """Count fld's cache as recently used memory, and enforce the budget
+
+    Fields call this when they fill their cache.
+    """
+    global _total_nbytes  # pylint: disable=global-statement
+    nbytes = _cache_nbytes(fld)
+    key = id(fld)
+    with _lock:
+        entry = _tracked.pop(key, None)
+        if entry is not None:
+            _total_nbytes -= entry[1]
+        if nbytes:
+            if entry is None:
+                ref = weakref.ref(fld, lambda r, key=key: _forget_ref(r, key))
+            else:
+                ref = entry[0]
+            _tracked[key] = [ref, nbytes, _is_reloadable(fld)]
+            _total_nbytes += nbytes
+    budget = _budget()
+    if budget is not None and _total_nbytes > budget:
+        trim(budget, keep=fld)
+
+def touch(fld):
+    """Mark fld's cache as recently used"""
+    key = id(fld)
+    if key in _tracked:
+        with _lock:
+            entry = _tracked.pop(key, None)
+            if entry is not None:
+                _tracked[key] = entry
+
+def forget(fld):
+    """Stop counting fld's cache, fields call this from clear_cache"""
+    global _total_nbytes  # pylint: disable=global-statement
+    key = id(fld)
+    if key in _tracked:
+        with _lock:
+            entry = _tracked.get(key, None)
+            if entry is not None and entry[0]() is fld:
+                del _tracked[key]
+                _total_nbytes -= entry[1]
+
+def trim(nbytes=None, keep=None):
+    """Clear least recently used caches until usage is <= nbytes
+
+    Args:
+        nbytes (int, str): target for memory usage, defaults to the
+            budget, max_nbytes. 0 clears every cache that can be
+            reloaded.
+        keep (Field): don't clear this field's cache
+
+    Returns:
+        number of caches that were cleared
+    """
+    if nbytes is None:
+        nbytes = _budget()
+        if nbytes is None:
+            return 0
+    nbytes = parse_nbytes(nbytes)
+
+    nr_cleared = 0
+    with _lock:
+        for ref, _, reloadable in list(_tracked.values()):
+            if _total_nbytes <= nbytes:
+                break
+            fld = ref()
+            if fld is None or fld is keep or not reloadable:
+                continue
+            fld.clear_cache()
+            nr_cleared += 1
+    if nr_cleared:
+        logger.debug("Cleared {0} field caches to stay under {1} bytes"
+                     "".format(nr_cleared, nbytes))
+    return nr_cleared
+
+def _owner(fld, group):
+    if group == "grid":
+        from viscid.grid import Grid
+        cls = Grid
+    elif group == "file":
+        from viscid.readers.vfile import VFile
+        cls = VFile
+    else:
+        raise ValueError("group should be 'grid' or 'file', not '{0}'"
+                         "".format(group))
+    return fld._parent_bfs(lambda obj, _: isinstance(obj, cls))  # pylint: disable=protected-access
+
+def memory_usage(group=None):
+    """Bytes held by field caches
+
+    Args:
+        group (str): None for the total, or 'grid' / 'file' to break
+            the total down by the grid / file that fields belong to
+
+    Returns:
+        int if group is None, else an OrderedDict of {owner: nbytes}
+        where fields that don't belong to a grid / file are counted
+        under None
+    """
+    if group is None:
+        return _total_nbytes
+
+    with _lock:
+        entries = [(ref(), nbytes) for ref, nbytes, _ in _tracked.values()]
+    ret = OrderedDict()
+    for fld, nbytes in entries:
+        if fld is not None:
+            owner = _owner(fld, group)
+            ret[owner] = ret.get(owner, 0) + nbytes
+    return ret
+
+def print_memory_usage(group="file"):
+    """Print memory held by field caches for each file / grid"""
+    budget = _budget()
+    print("Field caches: {0:.1f} MiB (budget: {1})"
+          "".format(_total_nbytes / 1024**2,
+                    "none" if budget is None else
+                    "{0:.1f} MiB".format(budget / 1024**2)))
+    for owner, nbytes in memory_usage(group).items():
+        if owner is None:
+            name = "<no {0}>".format(group)
+        else:
+            name = getattr(owner, "fname", None) or str(owner)
+        print("  {0:>10.1f} MiB  {1}".format(nbytes / 1024**2, name))
+
+def post_rc_actions():
+    global max_nbytes  # pylint: disable=global-statement
+    try:
+        max_nbytes = parse_nbytes(max_nbytes)
+    except ValueError as e:
+        logger.warn("from rc file; {0}, not using a memory budget".format(e))
+        max_nbytes = None
+    trim()
+
+##
+## EOF
+##
@@ -1,22 +1,50 @@
 """common tools for parallel processing"""
 
 from __future__ import print_function, division
+import atexit
 from math import ceil
+import os
 import threading
 import multiprocessing as mp
 import multiprocessing.pool
 from contextlib import closing
 from itertools import repeat
 import sys
+import tempfile
+import time
 
 import numpy as np
 
 import viscid
 from viscid.compat import izip, futures, string_types
+from viscid.verror import WorkerLostError
 
 
 __all__ = ["chunk_list", "chunk_slices", "chunk_interslices", "chunk_sizes",
-           "map", "map_async"]
+           "chunk_guided_slices", "map", "map_async", "shutdown",
+           "SharedField"]
+
+
+# if True, map reuses a process-wide pool of worker threads / processes
+# between calls instead of making a new pool every time; workers of a
+# persistent process pool only know the functions that existed when the
+# pool was forked, so this is opt-in
+persistent_pools = False
+# seconds between checks that worker processes are still alive while
+# waiting on them
+worker_poll_interval = 0.1
+
+_shared_pools = {True: None, False: None}  # keyed by threads
+_shared_pools_pid = None
+_shared_pools_lock = threading.Lock()
+_worker_state = threading.local()
+
+# fields bigger than this many bytes that are given to map as arguments
+# are sent to worker processes as SharedFields; None disables this
+shared_field_threshold = 64 * 1024**2
+# where SharedField puts its files, None means /dev/shm if it exists,
+# otherwise the default temp directory
+shared_field_dir = None
 
 
 # Non daemonic processes are probably a really bad idea
@@ -148,6 +176,39 @@ def chunk_interslices(nchunks):
         ret[i] = (i, None, nchunks)
     return ret
 
+def chunk_guided_slices(nel, nr_workers, min_size=1):
+    """Make contiguous chunks that get smaller and smaller
+
+    This is like OpenMP's guided schedule: each chunk is half of the
+    remaining elements divided by the number of workers, but no
+    smaller than min_size. When workers pull chunks in order as they
+    finish their last one, the big chunks up front keep overhead low
+    and the small ones at the end even out the finish times even if
+    some elements are much more expensive than others.
+
+    Parameters:
+        nel: how many elements are in the list
+        nr_workers: how many workers will be pulling chunks
+        min_size: smallest chunk (except maybe the last one)
+
+    Returns:
+        a list of (start, stop) tuples
+
+    Example:
+        >>> chunk_guided_slices(20, 2, min_size=2)
+        [(0, 5), (5, 9), (9, 12), (12, 14), (14, 16), (16, 18), (18, 20)]
+    """
+    nr_workers = max(int(nr_workers), 1)
+    min_size = max(int(min_size), 1)
+    ret = []
+    start = 0
+    while start < nel:
+        size = max(int(ceil((nel - start) / (2 * nr_workers))), min_size)
+        stop = min(start + size, nel)
+        ret.append((start, stop))
+        start = stop
+    return ret
+
 def chunk_sizes(nel, nchunks, size=None):
     """For chunking up lists, how big is each chunk
 
@@ -184,6 +245,348 @@ def _star_passthrough(args):
     # args[0] is function, args[1] is positional args, and args[2] is kwargs
     return args[0](*(args[1]), **(args[2]))
 
+def _shared_thread_passthrough(args):
+    """Run a task on a shared worker thread, marking it as such so that
+    map called from inside the task doesn't wait on its own pool"""
+    _worker_state.active = True
+    try:
+        return _star_passthrough(args)
+    finally:
+        _worker_state.active = False
+
+def _check_workers(workers):
+    """Raise WorkerLostError if any worker process died
+
+    multiprocessing quietly replaces a dead worker (killed, crashed, or
+    it couldn't unpickle its task), but the task it had is never
+    finished, so waiting on it would block forever. Workers of a closed
+    pool exit normally (exitcode 0) when they run out of tasks.
+    """
+    for w in workers:
+        exitcode = getattr(w, "exitcode", None)
+        if exitcode not in (None, 0):
+            raise WorkerLostError("worker process {0} died with exit code {1} "
+                                  "before finishing its tasks; if it couldn't "
+                                  "unpickle a task, the function may be "
+                                  "defined after the pool was made"
+                                  "".format(w.pid, exitcode))
+
+def _wait_for_result(result, workers, timeout):
+    """Wait for an AsyncResult, raising if one of the workers dies"""
+    deadline = time.time() + timeout
+    while not result.ready():
+        _check_workers(workers)
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            raise mp.TimeoutError()
+        result.wait(min(worker_poll_interval, remaining))
+    return result.get(0)
+
+def _guarded_passthrough(args):
+    """Run a task in a shared worker process, returning exceptions
+    instead of raising them so that the completion callback always
+    fires"""
+    try:
+        return True, _star_passthrough(args)
+    except Exception as e:  # pylint: disable=broad-except
+        return False, e
+
+
+class _SharedPool(object):
+    """A pool of worker threads or processes shared by calls to map
+
+    Pools are only shut down once they are retired (replaced by a
+    bigger pool or by :py:func:`shutdown`) and no call is using them.
+    """
+    def __init__(self, nr_workers, threads):
+        self.nr_workers = nr_workers
+        self.threads = threads
+        self.nr_users = 0
+        self.retired = False
+        if threads:
+            self.pool = futures.ThreadPoolExecutor(max_workers=nr_workers)
+            self.workers = []
+        else:
+            self.pool = mp.Pool(nr_workers)
+            self.workers = list(self.pool._pool)  # pylint: disable=no-member
+
+    def submit(self, args, callback):
+        """Start a task, callback is called with no args when it's done"""
+        if self.threads:
+            fut = self.pool.submit(_shared_thread_passthrough, args)
+            fut.add_done_callback(lambda _: callback())
+            return fut
+        else:
+            return self.pool.apply_async(_guarded_passthrough, (args,),
+                                         callback=lambda _: callback())
+
+    def result(self, task, timeout):
+        """Wait for a task from :py:meth:`submit` and return its result"""
+        if self.threads:
+            return task.result(timeout)
+        else:
+            ok, val = _wait_for_result(task, self.workers, timeout)
+            if not ok:
+                raise val
+            return val
+
+    def check_workers(self):
+        """Raise WorkerLostError if a worker process died"""
+        _check_workers(self.workers)
+
+    def shutdown(self, wait=True):
+        if self.threads:
+            self.pool.shutdown(wait=wait)
+        else:
+            self.pool.close()
+            if wait:
+                self.pool.join()
+
+def _acquire_shared_pool(nr_workers, threads):
+    global _shared_pools_pid
+    with _shared_pools_lock:
+        if _shared_pools_pid != os.getpid():
+            # any pools we know about were inherited from our parent
+            # through a fork, their workers don't belong to us, so
+            # just forget about them
+            for key in _shared_pools:
+                _shared_pools[key] = None
+            _shared_pools_pid = os.getpid()
+
+        shared = _shared_pools[threads]
+        if shared is None or shared.nr_workers < nr_workers:
+            if shared is not None:
+                _retire_shared_pool(shared)
+            shared = _SharedPool(nr_workers, threads)
+            _shared_pools[threads] = shared
+        shared.nr_users += 1
+        return shared
+
+def _release_shared_pool(shared):
+    with _shared_pools_lock:
+        shared.nr_users -= 1
+        if shared.retired and shared.nr_users == 0:
+            shared.shutdown(wait=False)
+
+def _retire_shared_pool(shared, wait=False):
+    # only call this while holding _shared_pools_lock
+    shared.retired = True
+    if shared.nr_users == 0:
+        shared.shutdown(wait=wait)
+
+def _drop_shared_pool(shared):
+    """Stop handing out a pool whose workers died"""
+    with _shared_pools_lock:
+        if _shared_pools.get(shared.threads, None) is shared:
+            _shared_pools[shared.threads] = None
+        if not shared.retired:
+            _retire_shared_pool(shared)
+
+def shutdown(wait=True):
+    """Shut down the worker pools that :py:func:`map` keeps around
+
+    Pools that are in use by a running call to map are shut down when
+    that call finishes. The next call to map will make new pools.
+
+    Parameters:
+        wait (bool): wait for the workers of idle pools to exit
+    """
+    with _shared_pools_lock:
+        if _shared_pools_pid != os.getpid():
+            return
+        for key, shared in _shared_pools.items():
+            if shared is not None:
+                _retire_shared_pool(shared, wait=wait)
+            _shared_pools[key] = None
+
+atexit.register(shutdown, wait=False)
+
+def _shared_map(nr_procs, func, args_iter, args_kw, threads, timeout):
+    """map on a shared pool, keeping at most nr_procs tasks in flight"""
+    shared = _acquire_shared_pool(nr_procs, threads)
+    try:
+        deadline = time.time() + timeout
+        nr_free = [nr_procs]
+        cond = threading.Condition()
+
+        def _task_done():
+            with cond:
+                nr_free[0] += 1
+                cond.notify()
+
+        tasks = []
+        for ai in args_iter:
+            with cond:
+                while nr_free[0] == 0:
+                    shared.check_workers()
+                    if time.time() >= deadline:
+                        raise mp.TimeoutError()
+                    cond.wait(worker_poll_interval)
+                nr_free[0] -= 1
+            tasks.append(shared.submit((func, ai, args_kw), _task_done))
+        return [shared.result(task, timeout) for task in tasks]
+    except WorkerLostError:
+        _drop_shared_pool(shared)
+        raise
+    finally:
+        _release_shared_pool(shared)
+
+class SharedField(object):
+    """Send a Field or AMRField to worker processes through a memmap
+
+    The data is written once to a file in `shared_field_dir`, and only
+    the crds / meta data are pickled. When unpickled in a worker, this
+    turns back into a field whose data is a copy-on-write np.memmap of
+    that file, so all workers share the same pages of memory. Info
+    and parents of the field are not sent.
+
+    :py:func:`map` does this automatically for fields bigger than
+    `shared_field_threshold` when using processes. The file is removed
+    by :py:meth:`close`, or at the end of a with block.
+
+    Example:
+        >>> with viscid.parallel.SharedField(fld) as shared_fld:
+        >>>     viscid.parallel.map(4, func, [(shared_fld, i) for i in
+        >>>                                   range(4)])
+    """
+    def __init__(self, fld, directory=None):
+        from viscid.amr_field import AMRField
+
+        self.fnames = []
+        self.patch_states = []
+
+        if directory is None:
+            directory = shared_field_dir
+        if directory is None:
+            if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+                directory = "/dev/shm"
+            else:
+                directory = tempfile.gettempdir()
+
+        if isinstance(fld, AMRField):
+            patches, self.skeleton = fld.patches, fld.skeleton
+        else:
+            patches, self.skeleton = [fld], None
+
+        try:
+            for patch in patches:
+                self.patch_states.append(self._share_patch(patch, directory))
+        except Exception:
+            self.close()
+            raise
+
+    def _share_patch(self, fld, directory):
+        dat = fld.data
+        meta = dict(fld.meta)
+        # the data are already transposed / transformed
+        if meta.get('zyx_native', False):
+            meta['zyx_native'] = False
+        deep_meta = dict(fld.deep_meta)
+        deep_meta['copy'] = False
+        state = dict(cls=type(fld), name=fld.name, crds=fld.crds,
+                     center=fld.center, time=fld.time, meta=meta,
+                     deep_meta=deep_meta, pretty_name=fld.pretty_name,
+                     fname=None, dtype=dat.dtype.str, shape=dat.shape,
+                     data=None)
+        if dat.size == 0:
+            state['data'] = np.array(dat)
+            return state
+
+        fd, fname = tempfile.mkstemp(prefix="viscid-", suffix=".dat",
+                                     dir=directory)
+        os.close(fd)
+        self.fnames.append(fname)
+        mm = np.memmap(fname, dtype=dat.dtype, mode='w+', shape=dat.shape)
+        mm[...] = dat
+        mm.flush()
+        del mm
+        state['fname'] = fname
+        return state
+
+    @property
+    def nbytes(self):
+        return sum(int(np.prod(st['shape'])) * np.dtype(st['dtype']).itemsize
+                   for st in self.patch_states)
+
+    def open(self):
+        """Make the field from the shared file"""
+        return _open_shared_field(self.patch_states, self.skeleton)
+
+    def close(self):
+        """Remove the shared files
+
+        Workers that already have the field keep their mapping.
+        """
+        for fname in self.fnames:
+            try:
+                os.remove(fname)
+            except OSError:
+                pass
+        self.fnames = []
+
+    def __reduce__(self):
+        return (_open_shared_field, (self.patch_states, self.skeleton))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, value, traceback):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+def _open_shared_field(patch_states, skeleton):
+    from viscid.amr_field import AMRField
+
+    patches = []
+    for st in patch_states:
+        if st['fname'] is None:
+            dat = st['data']
+        else:
+            dat = np.memmap(st['fname'], dtype=np.dtype(st['dtype']),
+                            mode='c', shape=tuple(st['shape']))
+        patches.append(st['cls'](st['name'], st['crds'], dat,
+                                 center=st['center'], time=st['time'],
+                                 meta=st['meta'], deep_meta=st['deep_meta'],
+                                 pretty_name=st['pretty_name']))
+    if skeleton is None:
+        return patches[0]
+    return AMRField(patches, skeleton)
+
+def _field_nbytes(fld):
+    return sum(int(np.prod(p.shape)) * np.dtype(p.dtype).itemsize
+               for p in fld.patches)
+
+def _share_big_fields(args_iter, args_kw, shared):
+    """Swap fields bigger than shared_field_threshold for SharedFields
+
+    Each field is only shared once, and the SharedFields are appended to
+    shared so the caller can close them when the work is done.
+
+    Returns:
+        (args_iter, args_kw) where args_iter is a lazy iterator
+    """
+    from viscid.amr_field import AMRField
+    from viscid.field import Field
+
+    if shared_field_threshold is None:
+        return args_iter, args_kw
+    by_id = dict()
+
+    def _swap(arg):
+        if (isinstance(arg, (Field, AMRField)) and
+                _field_nbytes(arg) >= shared_field_threshold):
+            if id(arg) not in by_id:
+                by_id[id(arg)] = (arg, SharedField(arg))
+                shared.append(by_id[id(arg)][1])
+            return by_id[id(arg)][1]
+        return arg
+
+    args_kw = dict((k, _swap(v)) for k, v in args_kw.items())
+    args_iter = (tuple(_swap(a) for a in ai) for ai in args_iter)
+    return args_iter, args_kw
+
 def sanitize_nr_procs(nr_procs):
     if isinstance(nr_procs, string_types):
         nr_procs = nr_procs.strip().lower()
@@ -194,12 +597,36 @@ def sanitize_nr_procs(nr_procs):
     return int(nr_procs)
 
 def map(nr_procs, func, args_iter, args_kw=None, timeout=1e8,
-        daemonic=True, threads=False, pool=None, force_subprocess=False):
+        daemonic=True, threads=False, pool=None, force_subprocess=False,
+        persistent=None):
     """Just like ``subprocessing.map``?
 
     same as :meth:`map_async`, except it waits for the result to
     be ready and returns it
 
+    If `persistent` is True (default is `persistent_pools`), the work
+    is done by a process-wide pool of threads or processes that is made
+    on first use and reused by later calls, growing if a call asks for
+    more workers. At most `nr_procs` tasks from one call run at a time.
+    Shared pools are dropped in a forked child, and can be shut down
+    explicitly with :py:func:`shutdown`. Otherwise, each call makes
+    its own pool.
+
+    If a worker process dies before finishing its tasks, this raises
+    :py:class:`viscid.verror.WorkerLostError` instead of waiting on
+    them forever.
+
+    When using processes, Field and AMRField arguments (positional,
+    or values in `args_kw`) bigger than `shared_field_threshold` bytes
+    are sent to the workers as a :py:class:`SharedField` instead of
+    being pickled with every task.
+
+    Note:
+        Tasks sent to a persistent process pool are pickled, so they
+        can't use functions or module globals that were defined after
+        the pool was forked. A worker that can't unpickle its task
+        dies, and the pool is dropped so the next call makes a new one.
+
     Note:
         When using threads, this is WAY faster than map_async since
         map_async uses the builtin python ThreadPool. I have no idea
@@ -208,22 +635,45 @@ def map(nr_procs, func, args_iter, args_kw=None, timeout=1e8,
     nr_procs = sanitize_nr_procs(nr_procs)
     if args_kw is None:
         args_kw = {}
+    if persistent is None:
+        persistent = persistent_pools
+    # a task on a shared worker thread can't wait on its own pool
+    if threads and getattr(_worker_state, "active", False):
+        persistent = False
 
     # don't waste time spinning up a new process
-    if threads:
-        args = [(func, ai, args_kw) for ai in args_iter]
-        with futures.ThreadPoolExecutor(max_workers=nr_procs) as executor:
-            ret = [val for val in executor.map(_star_passthrough, args)]
-    elif pool is None and nr_procs == 1 and not force_subprocess:
-        args_iter = izip(repeat(func), args_iter, repeat(args_kw))
-        ret = [_star_passthrough(args) for args in args_iter]
-    else:
-        p, r = map_async(nr_procs, func, args_iter, args_kw=args_kw,
-                         daemonic=daemonic, threads=threads, pool=pool)
-        ret = r.get(int(timeout))
-        # in principle this join should return almost immediately since
-        # we already called r.get
-        p.join()
+    use_shared = (pool is None and persistent and (threads or daemonic) and
+                  (threads or nr_procs > 1 or force_subprocess))
+    use_procs = not threads and (pool is not None or nr_procs > 1 or
+                                 force_subprocess)
+
+    shared_flds = []
+    try:
+        if use_procs:
+            args_iter, args_kw = _share_big_fields(args_iter, args_kw,
+                                                   shared_flds)
+
+        if use_shared:
+            ret = _shared_map(nr_procs, func, args_iter, args_kw, threads,
+                              timeout)
+        elif threads:
+            args = [(func, ai, args_kw) for ai in args_iter]
+            with futures.ThreadPoolExecutor(max_workers=nr_procs) as executor:
+                ret = [val for val in executor.map(_star_passthrough, args)]
+        elif not use_procs:
+            args_iter = izip(repeat(func), args_iter, repeat(args_kw))
+            ret = [_star_passthrough(args) for args in args_iter]
+        else:
+            p, r = map_async(nr_procs, func, args_iter, args_kw=args_kw,
+                             daemonic=daemonic, threads=threads, pool=pool)
+            workers = list(getattr(p, "_pool", []))
+            ret = _wait_for_result(r, workers, timeout)
+            # in principle this join should return almost immediately since
+            # we already called r.get
+            p.join()
+    finally:
+        for shared_fld in shared_flds:
+            shared_fld.close()
 
     return ret
 
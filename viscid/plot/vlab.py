@@ -94,7 +94,8 @@ def lines2source(lines, scalars=None, name="NoName"):
     Args:
         lines (list): List of 3xN, 4xN, 6xN ndarrays of xyz, xyzs, or
             xyzrgb data for N points along the line. N need not be the
-            same for all lines.
+            same for all lines. A :py:class:`viscid.PackedLines` is
+            used without copying the vertices.
         scalars (ndarray, list): Scalars for each point, or each line.
             See :py:func:`viscid.vutil.prepare_lines` for more details
         name (str): name of vtk object
@@ -1091,7 +1091,7 @@ def plot2d_lines(lines, scalars=None, symdir="", ax=None,
 
     Args:
         lines (list): list of 3xN ndarrays describing N xyz points
-            along a line
+            along a line, or a :py:class:`viscid.PackedLines`
         scalars (list, ndarray): a bunch of floats, rgb tuples, or
             '#0000ff' colors. These can be given as one per line,
             or one per vertex. See
@@ -1209,7 +1209,7 @@ def plot3d_lines(lines, scalars=None, ax=None, show=False, subsample=2,
 
     Args:
         lines (list): list of 3xN ndarrays describing N xyz points
-            along a line
+            along a line, or a :py:class:`viscid.PackedLines`
         scalars (list, ndarray): a bunch of floats, rgb tuples, or
             '#0000ff' colors. These can be given as one per line,
             or one per vertex. See
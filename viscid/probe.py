@@ -0,0 +1,166 @@
+"""Extract time series of fields at points, like a virtual spacecraft"""
+
+from __future__ import print_function, division
+from collections import deque
+
+import numpy as np
+
+from viscid import parallel
+from viscid.compat import futures, string_types
+from viscid.interp_plan import get_interp_plan
+from viscid.seed import to_seeds
+
+
+__all__ = ['timeseries']
+
+
+def timeseries(vfile, fields, points_or_slices, time_slice=":", nr_procs=1,
+               prefetch=2, kind="linear"):
+    """Extract time series of fields at many points at once
+
+    Time steps are streamed through a bounded prefetch queue: up to
+    `nr_procs` threads read the data for upcoming time steps while
+    the current one is interpolated. For each time step, only the
+    hyperslab that bounds the points is read from disk (if the reader
+    supports it), and all the fields are interpolated in one call to
+    :py:func:`viscid.interp_many`. For plain node or cell centered
+    fields, the seeds are located once with an
+    :py:class:`viscid.InterpPlan` that is reused for every time step
+    with the same coordinates. Each grid's cache is cleared once its
+    data is read, so memory use is bounded by `nr_procs + prefetch`
+    time steps worth of hyperslabs.
+
+    Parameters:
+        vfile (Dataset): a file or dataset with a time series
+        fields (str, list): name or list of names of fields; anything
+            that works with ``grid[name]``
+        points_or_slices: points as anything
+            :py:func:`viscid.seed.to_seeds` understands, or a slice
+            string like ``'x=8.0f, y=0.0f, z=0.0f'``
+        time_slice (str): which time steps, as in
+            :py:meth:`viscid.dataset.DatasetTemporal.iter_times`
+        nr_procs (int): number of threads reading time steps
+        prefetch (int): max number of time steps read ahead of the
+            one being interpolated
+        kind (str): either 'linear' or 'nearest', passed to
+            :py:func:`viscid.interp_many`
+
+    Returns:
+        (times, data) where times is a 1d ndarray of the nt times, and
+        data is an ndarray shaped (nt, nr_points) for scalars, or
+        (nt, nr_points, nr_comps) for vectors. If points_or_slices is
+        a slice, data is shaped (nt, ) + the shape of the slice. If
+        `fields` is a list, then data is a list of these arrays.
+
+    Example:
+        >>> f = viscid.load_file("run.3d.xdmf")
+        >>> pts = np.array([[8.0, 9.0, 10.0], [0.0, 0.0, 0.0],
+        >>>                 [0.0, 0.0, 0.0]])
+        >>> t, (pp, b) = viscid.timeseries(f, ['pp', 'b'], pts,
+        >>>                                nr_procs=4)
+        >>> pp.shape, b.shape
+        ((nt, 3), (nt, 3, 3))
+    """
+    single_field = isinstance(fields, string_types)
+    if single_field:
+        fields = [fields]
+
+    if isinstance(points_or_slices, string_types):
+        seeds, pts, slc = None, None, points_or_slices
+    else:
+        seeds = to_seeds(points_or_slices)
+        pts, slc = seeds.get_points(), None
+
+    grids = vfile.get_times(time_slice)
+    nr_procs = max(1, parallel.sanitize_nr_procs(nr_procs))
+
+    def _read(grid):
+        """Read the (small) sub-fields needed for one time step"""
+        subs = []
+        for name in fields:
+            fld = grid[name]
+            if slc is None:
+                sub = fld.slice_and_keep(_bounding_selection(fld, pts))
+            else:
+                sub = fld[slc]
+            if hasattr(sub, "resolve"):
+                sub.resolve()
+            subs.append(sub)
+        grid.clear_cache()
+        return grid.time, subs
+
+    times = []
+    data = [[] for _ in fields]
+    for time, subs in _iter_prefetched(_read, grids, nr_procs, prefetch):
+        times.append(time)
+        if seeds is None:
+            vals = [np.array(getattr(sub, "data", sub)) for sub in subs]
+        else:
+            vals = _interp_step(subs, seeds, kind)
+        for i, val in enumerate(vals):
+            data[i].append(val)
+
+    times = np.array(times)
+    data = [np.array(d) for d in data]
+    if single_field:
+        data = data[0]
+    return times, data
+
+def _interp_step(subs, seeds, kind):
+    """Interpolate the fields of one time step to seeds"""
+    from viscid.cython import interp_many
+
+    vals = [None] * len(subs)
+    leftover = []
+    for i, sub in enumerate(subs):
+        if sub.nr_patches == 1 and sub.center.lower() in ("node", "cell"):
+            plan = get_interp_plan(sub.crds, seeds, center=sub.center,
+                                   kind=kind)
+            vals[i] = plan.apply(sub, wrap=False)
+        else:
+            leftover.append(i)
+    if leftover:
+        many = interp_many([subs[i] for i in leftover], seeds, kind=kind,
+                           wrap=False)
+        for i, val in zip(leftover, many):
+            vals[i] = val
+    return vals
+
+def _iter_prefetched(func, items, nr_workers, prefetch):
+    """map func over items on a thread pool, keeping results in order
+
+    At most `nr_workers + prefetch` results are in flight at once.
+    """
+    with futures.ThreadPoolExecutor(max_workers=nr_workers) as executor:
+        pending = deque()
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) > nr_workers + prefetch:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def _bounding_selection(fld, pts):
+    """Selection string of the smallest box of cells containing pts
+
+    The box is padded so that linear interpolation inside it is the
+    same as it would be on the whole field.
+    """
+    sel = []
+    for ax in fld.crds.axes:
+        if ax not in "xyz":
+            # don't know how to map points to non-cartesian axes
+            return ""
+        crd = fld.get_crd(ax)
+        n = len(crd)
+        row = pts["xyz".index(ax)]
+        lo = np.searchsorted(crd, np.min(row), side='right') - 1
+        hi = np.searchsorted(crd, np.max(row), side='left') + 1
+        lo = max(min(lo, n - 2), 0)
+        hi = min(max(hi, lo + 2), n)
+        sel.append("{0}={1}:{2}".format(ax, lo, hi))
+    return ", ".join(sel)
+
+##
+## EOF
+##
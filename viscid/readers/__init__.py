@@ -69,6 +69,8 @@ def load_file(fname, force_reload=False, **kwargs):
             accepted, see :doc:`/tips_and_tricks` for more info.
         fname (str): a file name, relative to CWD
         force_reload (bool): Force reload if file is already in memory
+        nr_procs (int): parse files, and the time steps of temporal
+            collections, on this many threads
         **kwargs: passed to the VFile constructor
 
     See Also:
@@ -86,6 +88,8 @@ def load_files(fnames, force_reload=False, **kwargs):
         fnames (list): list of file names. Glob patterns and slices are
             accepted, see :doc:`/tips_and_tricks` for more info.
         force_reload (bool): Force reload if file is already in memory
+        nr_procs (int): parse files, and the time steps of temporal
+            collections, on this many threads
         **kwargs: passed to the VFile constructor
 
     See Also:
@@ -41,17 +41,57 @@ class GGCMFortbinFileWrapper(object):
                 pass
         return self._file_meta
 
-    def read_field(self, fld_name, pos=None):
+    def read_field(self, fld_name, pos=None, slab=None):
         """Read a field given a seekable location
 
         Parameters:
             fld_name(str): name of field we're expecting to read
             pos(int): position in file we can seek to
+            slab(tuple): (start, stop) range of the slowest varying
+                (last) axis to read; since the data is stored in
+                Fortran order, this range is contiguous on disk
 
         Returns:
             tuple (field name, dict of meta data, array)
         """
 
+        meta = self._find_field(fld_name, pos=pos)
+
+        dims = list(meta['dims'])
+        offset = 0
+        if slab is not None:
+            plane_nelem = int(np.prod(dims[:-1]))
+            offset = 4 * plane_nelem * slab[0]
+            dims[-1] = slab[1] - slab[0]
+
+        self._file.seek(meta['file_position'] + meta['header_size'] + offset)
+        data = np.fromfile(self._file, dtype=np.dtype(self._endian + 'f'),
+                           count=int(np.prod(dims)))
+        return meta, data.reshape(dims, order='F')
+
+    def memmap_field(self, fld_name, pos=None):
+        """Memory map a field given a seekable location
+
+        The map is copy-on-write, so in-place math on the result never
+        touches the file, and pages that are only read are shared
+        through the page cache with any other process mapping the
+        same file.
+
+        Parameters:
+            fld_name(str): name of field we're expecting to map
+            pos(int): position in file we can seek to
+
+        Returns:
+            tuple (dict of meta data, Fortran ordered np.memmap)
+        """
+        meta = self._find_field(fld_name, pos=pos)
+        arr = np.memmap(self.filename, dtype=np.dtype(self._endian + 'f'),
+                        mode='c',
+                        offset=meta['file_position'] + meta['header_size'],
+                        shape=tuple(meta['dims']), order='F')
+        return meta, arr
+
+    def _find_field(self, fld_name, pos=None):
         if pos is not None:
             self._file.seek(pos)
             found_fld, meta = self.inquire_next()
@@ -61,11 +101,7 @@ class GGCMFortbinFileWrapper(object):
                                                        fld_name, pos))
         else:
             meta = self.inquire(fld_name)
-
-        self._file.seek(meta['file_position'] + meta['header_size'])
-        data = np.fromfile(self._file, dtype=np.dtype(self._endian + 'f'),
-                           count=meta['nelem'])
-        return meta, data.reshape(meta['dims'], order='F')
+        return meta
 
     def inquire_all_fields(self, reinquire=False):
         if reinquire:
@@ -218,7 +254,22 @@ class GGCMFortbinFileWrapper(object):
 
 
 class FortbinDataWrapper(vfile.DataWrapper):
-    """Interface for lazily pointing to a field in a binary file"""
+    """Interface for lazily pointing to a field in a binary file
+
+    Attributes:
+        use_mmap (bool): If True, memory map fields instead of reading
+            them into fresh arrays. Loading is then nearly free, only
+            the pages that are touched are read, and they are shared
+            with other processes through the page cache. Files in
+            native byte order flow into Fields without any copies;
+            others get byteswapped once when loaded. Set this in
+            a viscidrc file with
+            ``readers.ggcm_fortbin.FortbinDataWrapper.use_mmap: true``
+    """
+    _hypersliceable = True  # can read slices from disk
+
+    use_mmap = False
+
     file_wrapper = None
     filename = None
     fld_name = None
@@ -250,12 +301,20 @@ class FortbinDataWrapper(vfile.DataWrapper):
     def dtype(self):
         return np.dtype("float32")
 
-    def __array__(self, *args, **kwargs):
+    def _read(self, slab=None):
+        """Read the field (or a slab of z planes) as a zyx array"""
         with self.file_wrapper as f:
-            # fld_name, meta, arr = f.read_field_at(self.loc, ndim)
-            meta, arr = f.read_field(self.fld_name, pos=self.file_position)
-            arr = np.array(arr.flatten(order='F').reshape(meta['dims'][::-1]),
-                           order='C')
+            if self.use_mmap:
+                meta, arr = f.memmap_field(self.fld_name,
+                                           pos=self.file_position)
+                if slab is not None:
+                    arr = arr[..., slab[0]:slab[1]]
+            else:
+                meta, arr = f.read_field(self.fld_name,
+                                         pos=self.file_position, slab=slab)
+            # transposing the fortran ordered xyz array gives a c ordered
+            # zyx array without a copy
+            arr = arr.T
 
         # meta's dims are xyz (from file), but ex
         if meta['dims'] != self.expected_shape:
@@ -264,7 +323,13 @@ class FortbinDataWrapper(vfile.DataWrapper):
                                    self.fld_name,
                                    self.filename, meta['dims'],
                                    self.expected_shape))
-        return arr.astype(self.dtype)
+        if self.use_mmap:
+            # keep the file's byte order rather than byteswap a copy
+            return arr
+        return arr.astype(self.dtype, copy=False)
+
+    def __array__(self, *args, **kwargs):
+        return self._read()
 
     def read_direct(self, *args, **kwargs):
         return self.__array__()
@@ -273,7 +338,37 @@ class FortbinDataWrapper(vfile.DataWrapper):
         return self.shape[0]
 
     def __getitem__(self, item):
-        return self.__array__().__getitem__(item)
+        """Read only the z planes that `item` touches"""
+        if not isinstance(item, tuple):
+            item = (item, )
+        if not item:
+            return self._read()
+
+        nz = self.shape[0]
+        slc0 = item[0]
+        if hasattr(slc0, "__index__"):
+            i = slc0.__index__()
+            i = i + nz if i < 0 else i
+            if not 0 <= i < nz:
+                raise IndexError("index {0} is out of bounds for axis 0 with "
+                                 "size {1}".format(slc0, nz))
+            slab, slab_slc0 = (i, i + 1), 0
+        elif isinstance(slc0, slice):
+            start, stop, step = slc0.indices(nz)
+            inds = np.arange(start, stop, step)
+            if len(inds) == 0:
+                return self._read()[item]
+            lo, hi = inds.min(), inds.max() + 1
+            slab = (lo, hi)
+            if step > 0:
+                slab_slc0 = slice(0, hi - lo, step)
+            else:
+                slab_slc0 = inds - lo
+        else:
+            # Ellipsis, newaxis, fancy indexing, etc.
+            return self._read()[item]
+
+        return self._read(slab=slab)[(slab_slc0, ) + item[1:]]
 
 
 class GGCMFileFortbinMHD(openggcm.GGCMFileFortran):  # pylint: disable=abstract-method
@@ -1,10 +1,13 @@
 from __future__ import print_function
+import hashlib
+import json
 import os
 import re
 from datetime import datetime, timedelta
 
 import numpy as np
 
+from viscid import logger
 from viscid import grid
 from viscid.readers import vfile
 from viscid.readers import openggcm
@@ -20,6 +23,30 @@ except ImportError as e:
 
 read_ascii = False
 
+# Sidecar field indices: if use_index, the first full scan of a jrrle file
+# writes the name -> position / dims / time of each field to an index file
+# so that later opens of the file can seek straight to any field. Index
+# files are written next to the data file as .{basename}.vidx, or into
+# index_dir if it's given. Both are settable from a viscidrc file, i.e.,
+# ``readers.ggcm_jrrle.use_index: true``
+use_index = False
+index_dir = None
+_INDEX_VERSION = 1
+
+
+def index_fname(filename):
+    """Get the name of the sidecar index file for a jrrle file"""
+    filename = os.path.abspath(filename)
+    dirname, basename = os.path.split(filename)
+    if index_dir is None:
+        return os.path.join(dirname, "." + basename + ".vidx")
+    else:
+        # files with the same basename from different runs can share
+        # an index_dir, so prefix the name with a hash of the full path
+        path_hash = hashlib.md5(filename.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(os.path.expanduser(os.path.expandvars(index_dir)),
+                            "{0}_{1}.vidx".format(path_hash, basename))
+
 
 class JrrleFileWrapper(FortranFile):
     """Interface for actually opening / reading a jrrle file"""
@@ -32,8 +59,65 @@ class JrrleFileWrapper(FortranFile):
 
         self.fields_seen = OrderedDict()
         self.seen_all_fields = False
+        self._tried_index = False
         super(JrrleFileWrapper, self).__init__(filename)
 
+    def load_index(self):
+        """Fill fields_seen from the sidecar index
+
+        The index is only used if the size and mtime it recorded still
+        match the data file.
+
+        Returns:
+            True if a valid index was loaded
+        """
+        self._tried_index = True
+        try:
+            stat = os.stat(self.filename)
+            with open(index_fname(self.filename), 'r') as f:
+                index = json.load(f)
+            if (index['version'] != _INDEX_VERSION or
+                    index['size'] != stat.st_size or
+                    index['mtime'] != stat.st_mtime):
+                return False
+            fields_seen = OrderedDict()
+            for fld_name, meta in index['fields']:
+                meta = dict((str(k), v) for k, v in meta.items())
+                meta['timestr'] = str(meta['timestr'])
+                meta['dims'] = tuple(meta['dims'])
+                fields_seen[str(fld_name)] = meta
+        except (IOError, OSError, ValueError, KeyError, TypeError):
+            return False
+
+        self.fields_seen = fields_seen
+        self.seen_all_fields = True
+        return True
+
+    def save_index(self):
+        """Write fields_seen to the sidecar index
+
+        This is a no-op unless all fields have been seen. Failure to
+        write the index (read-only directory, etc.) is not an error.
+        """
+        if not self.seen_all_fields:
+            return
+        idx_fname = index_fname(self.filename)
+        try:
+            stat = os.stat(self.filename)
+            index = dict(version=_INDEX_VERSION, size=stat.st_size,
+                         mtime=stat.st_mtime,
+                         fields=list(self.fields_seen.items()))
+            idx_dir = os.path.dirname(idx_fname)
+            if not os.path.isdir(idx_dir):
+                os.makedirs(idx_dir)
+            # write then rename so concurrent readers never see half an index
+            tmp_fname = "{0}.{1}.tmp".format(idx_fname, os.getpid())
+            with open(tmp_fname, 'w') as f:
+                json.dump(index, f)
+            os.rename(tmp_fname, idx_fname)
+        except (IOError, OSError) as e:
+            logger.debug("Could not write jrrle index '%s': %s", idx_fname, e)
+
     def read_field(self, fld_name, ndim):
         """Read a field given a seekable location
 
@@ -57,6 +141,11 @@ class JrrleFileWrapper(FortranFile):
         if self.seen_all_fields:
             return
 
+        # inquire may have just tried the index, don't parse it twice
+        if (use_index and not reinquire and not self._tried_index and
+                self.load_index()):
+            return
+
         self.rewind()
         while not self.seen_all_fields:
             self.inquire_next()
@@ -65,7 +154,16 @@ class JrrleFileWrapper(FortranFile):
             #     print(last_seen, "lives at", meta["file_position"])
             self.advance_one_line()
 
+        if use_index:
+            self.save_index()
+
     def inquire(self, fld_name):
+        if use_index and not self.seen_all_fields and not self._tried_index:
+            # with an index, either it's valid and every field is one seek
+            # away, or do one full scan now so the next open has an index
+            if not self.load_index():
+                self.inquire_all_fields()
+
         try:
             meta = self.fields_seen[fld_name]
             self.seek(meta['file_position'])
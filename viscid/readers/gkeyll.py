@@ -18,7 +18,7 @@ except ImportError:
     HAS_H5PY = False
 
 from viscid.readers.vfile_bucket import ContainerFile
-from viscid.readers.hdf5 import FileHDF5, H5pyDataWrapper
+from viscid.readers.hdf5 import FileHDF5, H5pyDataWrapper, h5_file_pool
 from viscid import grid
 from viscid import field
 from viscid.coordinate import wrap_crds
@@ -341,7 +341,7 @@ class GkeyllFile(FileHDF5, ContainerFile):  # pylint: disable=abstract-method
         # FIXME: To get the time at load, we have to open all hdf5 files
         # which defeats the purpose of making templates etc. in attempt to
         # be lazy. Maybe there's a way to use frame above?
-        with h5py.File(filename, 'r') as f:
+        with h5_file_pool.open(filename) as f:
             step = f['timeData'].attrs['vsStep']
             time = f['timeData'].attrs['vsTime']
         self.set_info("step", step)
@@ -417,7 +417,7 @@ class GkeyllFile(FileHDF5, ContainerFile):  # pylint: disable=abstract-method
                                "".format(repr(gridType)))
 
     def make_crds(self, fname):
-        with h5py.File(fname, 'r') as f:
+        with h5_file_pool.open(fname) as f:
             clist = []
 
             # FIXME: xyz
@@ -1,10 +1,13 @@
 from __future__ import print_function
+from contextlib import contextmanager
 import os
+import threading
 
 import numpy as np
 
 import viscid
 from viscid import logger
+from viscid.compat import OrderedDict
 from viscid.readers import vfile
 
 
@@ -16,6 +19,153 @@ except ImportError:
     logger.warn("h5py library not found, no hdf5 support.")
 
 
+class H5FilePool(object):
+    """Bounded LRU pool of read-only h5py.File handles
+
+    Opening an hdf5 file costs a handful of syscalls and a superblock
+    read, which adds up for temporal datasets where every field of
+    every time step goes through its own open / close, especially over
+    sshfs. All H5pyDataWrappers and FileLazyHDF5 files share the
+    module level ``h5_file_pool``, which keeps up to `max_open` files
+    open and closes the least recently used one when it needs room.
+    Handles that are in use are never evicted.
+
+    Note:
+        The pool remembers which process opened its handles, so after
+        a fork the child forgets the handles it inherited and opens
+        its own as needed.
+
+    Attributes:
+        max_open (int): maximum number of files held open at once; 0
+            disables pooling, i.e., files are opened and closed on
+            every access. This can be set in a viscidrc file with
+            ``readers.hdf5.H5FilePool.max_open: 64``
+    """
+    max_open = 32
+
+    def __init__(self, max_open=None):
+        if max_open is not None:
+            self.max_open = max_open
+        self._lock = None
+        self._handles = None
+        self._nr_users = None
+        self._pid = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._reset()
+
+    def _reset(self):
+        self._lock = threading.RLock()
+        # fname -> h5py.File, least recently used first
+        self._handles = OrderedDict()
+        # id(h5py.File) -> number of active users
+        self._nr_users = {}
+        self._pid = os.getpid()
+
+    def _check_pid(self):
+        if self._pid != os.getpid():
+            # forked, the parent's handles are not ours to use or to close
+            self._reset()
+            self.reset_stats()
+
+    @contextmanager
+    def open(self, fname):
+        """Context manager that yields an open read-only h5py.File
+
+        Args:
+            fname (str): file name
+
+        Yields:
+            h5py.File
+        """
+        self._check_pid()
+        fname = os.path.abspath(fname)
+
+        if self.max_open <= 0:
+            with h5py.File(fname, 'r') as f:
+                yield f
+            return
+
+        with self._lock:
+            f = self._handles.pop(fname, None)
+            if f is not None and f.id.valid:
+                self.hits += 1
+            else:
+                self.misses += 1
+                f = h5py.File(fname, 'r')
+            self._handles[fname] = f
+            self._nr_users[id(f)] = self._nr_users.get(id(f), 0) + 1
+            self._evict()
+
+        try:
+            yield f
+        finally:
+            with self._lock:
+                self._release(f)
+
+    def _release(self, f):
+        nr_users = self._nr_users.pop(id(f), 1) - 1
+        if nr_users > 0:
+            self._nr_users[id(f)] = nr_users
+        elif not any(f is h for h in self._handles.values()):
+            # closed or evicted while in use, so we're the last user
+            f.close()
+        self._evict()
+
+    def _evict(self):
+        for fname in list(self._handles.keys()):
+            if len(self._handles) <= max(self.max_open, 0):
+                break
+            f = self._handles[fname]
+            if self._nr_users.get(id(f), 0) == 0:
+                del self._handles[fname]
+                f.close()
+                self.evictions += 1
+
+    def close(self, fname=None):
+        """Close a pooled handle, or all of them if fname is None
+
+        Handles that are in use are closed when their last user is
+        done with them.
+        """
+        self._check_pid()
+        with self._lock:
+            if fname is None:
+                fnames = list(self._handles.keys())
+            else:
+                fnames = [os.path.abspath(fname)]
+            for fname in fnames:
+                f = self._handles.pop(fname, None)
+                if f is not None and self._nr_users.get(id(f), 0) == 0:
+                    f.close()
+
+    def resize(self, max_open):
+        """Change `max_open` for this pool and evict to fit"""
+        self._check_pid()
+        with self._lock:
+            self.max_open = max_open
+            self._evict()
+
+    @property
+    def nr_open(self):
+        return len(self._handles)
+
+    @property
+    def stats(self):
+        """dict of hits, misses, evictions, nr_open, and max_open"""
+        return dict(hits=self.hits, misses=self.misses,
+                    evictions=self.evictions, nr_open=self.nr_open,
+                    max_open=self.max_open)
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+h5_file_pool = H5FilePool()
+
+
 class H5pyDataWrapper(vfile.DataWrapper):
     """  """
     _hypersliceable = True  # can read slices from disk
@@ -41,7 +191,7 @@ class H5pyDataWrapper(vfile.DataWrapper):
 
     def _read_info(self):
         try:
-            with h5py.File(self.fname, 'r') as f:
+            with h5_file_pool.open(self.fname) as f:
                 dset = self._resolve_loc(f)
                 self._shape = list(dset.shape)
                 if self.comp_dim is not None:
@@ -106,7 +256,7 @@ class H5pyDataWrapper(vfile.DataWrapper):
     def read_direct(self, arr, **kwargs):
         source_sel = kwargs.pop("source_sel", None)
         source_sel = self._inject_comp_slice(source_sel)
-        with h5py.File(self.fname, 'r') as f:
+        with h5_file_pool.open(self.fname) as f:
             fill_arr = arr
             if self.transpose:
                 # FIXME: the temp array here isn't pretty, but transposing
@@ -121,7 +271,7 @@ class H5pyDataWrapper(vfile.DataWrapper):
 
     def __getitem__(self, item):
         item = self._inject_comp_slice(item)
-        with h5py.File(self.fname, 'r') as f:
+        with h5_file_pool.open(self.fname) as f:
             arr = self._resolve_loc(f)[item]
             if self.transpose:
                 return np.transpose(arr)
@@ -151,9 +301,17 @@ class FileLazyHDF5(vfile.VFile):
         return H5pyDataWrapper(self.fname, handle)
 
     def resolve_path(self, path, first=False):
-        with h5py.File(self.fname, 'r') as f:
+        with h5_file_pool.open(self.fname) as f:
             return viscid.resolve_path(f, path, first=first)
 
+    def reload(self):
+        h5_file_pool.close(self.fname)
+        super(FileLazyHDF5, self).reload()
+
+    def unload(self, **kwargs):
+        h5_file_pool.close(self.fname)
+        super(FileLazyHDF5, self).unload(**kwargs)
+
     def find_items(self, item):
         return self.resolve_path(item)[0]
 
@@ -247,7 +405,9 @@ class FileHDF5(vfile.VFile):
         crd_shape = [len(arr) for arr in crd_arrs]
         time = flds[0].time
 
-        # write arrays to the hdf5 file
+        # write arrays to the hdf5 file, but first make sure we're not
+        # holding a read-only handle to a file we're about to clobber
+        h5_file_pool.close(fname)
         with h5py.File(fname, 'w') as f:
             for axis_name, arr in zip(crd_names, crd_arrs):
                 loc = cls._CRDS_GROUP + '/' + axis_name
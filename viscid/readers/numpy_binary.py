@@ -7,6 +7,8 @@ grid """
 # import string
 from __future__ import print_function
 import os
+import struct
+import zipfile
 
 import numpy as np
 
@@ -15,7 +17,15 @@ from viscid.readers import vfile
 from viscid import coordinate
 
 class NPZDataWrapper(vfile.DataWrapper):
-    """  """
+    """Lazy wrapper for one array in an npz file
+
+    Arrays that are stored uncompressed (np.savez) are memory mapped
+    straight out of the zip archive, so slicing only reads the part of
+    the file that's asked for. Compressed arrays (np.savez_compressed)
+    have to be inflated in full on every read.
+    """
+    _hypersliceable = True  # can read slices from disk
+
     fname = None
     loc = None
 
@@ -60,17 +70,61 @@ class NPZDataWrapper(vfile.DataWrapper):
         with np.load(self.fname) as f:
             return getattr(f[self.loc], func_name)(*args, **kwargs)
 
+    def _memmap(self):
+        """Memory map the array inside the zip archive
+
+        Returns:
+            np.memmap, or None if the array is compressed or otherwise
+            can't be mapped
+        """
+        try:
+            with zipfile.ZipFile(self.fname) as zf:
+                info = zf.getinfo(self.loc + ".npy")
+            if info.compress_type != zipfile.ZIP_STORED:
+                return None
+
+            with open(self.fname, 'rb') as f:
+                # the local file header has its own name / extra field
+                # lengths which can differ from the central directory
+                f.seek(info.header_offset)
+                local_header = struct.unpack("<4s5H3L2H", f.read(30))
+                if local_header[0] != b"PK\x03\x04":
+                    return None
+                f.seek(local_header[-2] + local_header[-1], 1)
+
+                version = np.lib.format.read_magic(f)
+                if version == (1, 0):
+                    header = np.lib.format.read_array_header_1_0(f)
+                else:
+                    header = np.lib.format.read_array_header_2_0(f)
+                shape, fortran_order, dtype = header
+                offset = f.tell()
+
+            if dtype.hasobject or not shape:
+                return None
+            order = 'F' if fortran_order else 'C'
+            return np.memmap(self.fname, dtype=dtype, mode='r', offset=offset,
+                             shape=shape, order=order)
+        except (KeyError, ValueError, IOError, struct.error):
+            return None
+
     def __array__(self, *args, **kwargs):
         return self.wrap_func("__array__", *args, **kwargs)
 
-    def read_direct(self, *args, **kwargs):
-        raise NotImplementedError()
+    def read_direct(self, arr, **kwargs):
+        source_sel = kwargs.pop("source_sel", None)
+        if source_sel is None:
+            source_sel = Ellipsis
+        arr[...] = self[source_sel]
 
     def len(self):
         return self.wrap_func("len")
 
     def __getitem__(self, item):
-        return self.wrap_func("__getitem__", item)
+        mm = self._memmap()
+        if mm is None:
+            return self.wrap_func("__getitem__", item)
+        return np.array(mm[item])
 
 
 class FileNumpyNPZ(vfile.VFile):
@@ -102,7 +156,7 @@ class FileNumpyNPZ(vfile.VFile):
         g = self._make_grid(self, **self._grid_opts)
 
         with np.load(self.fname) as f:
-            fld_names = f.keys()
+            fld_names = list(f.keys())
 
             crd_names = []
             # try to get crds names from an array of strings called _KEY_CRDS
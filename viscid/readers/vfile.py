@@ -77,6 +77,9 @@ class VFile(Dataset):
     fname = None
     dirname = None
 
+    # number of threads container files may use to parse their children
+    nr_procs = 1
+
     # this is for files that stay open after being parsed,
     # for instance hdf5 File object
     file = None
@@ -84,10 +87,13 @@ class VFile(Dataset):
     # grids = None  # already part of Dataset
 
     def __init__(self, fname, parent_bucket=None, grid_type=None, grid_opts=None,
-                 **kwargs):
+                 nr_procs=None, **kwargs):
         """  """
         super(VFile, self).__init__(fname, **kwargs)
 
+        if nr_procs is not None:
+            self.nr_procs = nr_procs
+
         if grid_type is not None:
             self._grid_type = grid_type
         if grid_opts is not None:
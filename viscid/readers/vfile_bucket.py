@@ -2,8 +2,11 @@
 
 from __future__ import print_function
 import os
+import threading
+from time import time
 
 from viscid import logger
+from viscid import parallel
 from viscid.bucket import Bucket
 from viscid.compat import OrderedDict, string_types
 from viscid.readers.vfile import VFile
@@ -17,6 +20,8 @@ class VFileBucket(Bucket):
 
     def __init__(self, **kwargs):
         super(VFileBucket, self).__init__(ordered=True, **kwargs)
+        # files may be loaded concurrently, see load_files(nr_procs=...)
+        self._lock = threading.RLock()
 
     # This routine is just sort of confusing
     # def add(self, fname, file):
@@ -37,7 +42,7 @@ class VFileBucket(Bucket):
             return fls[0]
 
     def load_files(self, fnames, index_handle=True, file_type=None,
-                   force_reload=False, _add_ref=False, **kwargs):
+                   force_reload=False, nr_procs=1, _add_ref=False, **kwargs):
         """Load files, and add them to the bucket
 
         Initialize obj before it's put into the list, whatever is returned
@@ -49,6 +54,11 @@ class VFileBucket(Bucket):
             index_handle: ??
             file_type: a class that is a subclass of VFile, if given,
                 use this file type, don't use the autodetect mechanism
+            nr_procs (int): number of threads used to parse file
+                groups concurrently; this is also given to the files
+                so that containers (like XDMF temporal collections)
+                can parse their time steps concurrently. Time steps
+                are still merged in time order.
             kwargs: passed to file constructor
 
         Returns:
@@ -99,53 +109,83 @@ class VFileBucket(Bucket):
             except KeyError:
                 types_detected[_ftype] = [value]
 
-        # see if the file's already been loaded, or load it, and add it
-        # to the bucket and all that good stuff
-        file_lst = []
+        # group all file names of a given type
+        typed_groups = []
         for ftype, vals in types_detected.items():
             names = [v[0] for v in vals]
-            # group all file names of a given type
-            groups = ftype.group_fnames(names)
+            typed_groups += [(ftype, group) for group in ftype.group_fnames(names)]
 
-            # iterate all the groups and add them
-            for group in groups:
-                f = None
-
-                handle_name = ftype.collective_name(group)
-
-                try:
-                    f = self[handle_name]
-                    if force_reload:
-                        f.reload()
-                except KeyError:
-                    try:
-                        f = ftype(group, parent_bucket=self, **kwargs)
-                        f.handle_name = handle_name
-                    except IOError as e:
-                        s = " IOError on file: {0}\n".format(handle_name)
-                        s += "              File Type: {0}\n".format(handle_name)
-                        s += "              {0}".format(str(e))
-                        logger.warn(s)
-                    except ValueError as e:
-                        # ... why am i explicitly catching ValueErrors?
-                        # i'm probably breaking something by re-raising
-                        # this exception, but i didn't document what :(
-                        s = " ValueError on file load: {0}\n".format(handle_name)
-                        s += "              File Type: {0}\n".format(handle_name)
-                        s += "              {0}".format(str(e))
-                        logger.warn(s)
-                        # re-raise the last expection
-                        raise
-
-                self.set_item([handle_name], f, index_handle=index_handle,
-                              _add_ref=_add_ref)
-                file_lst.append(f)
+        # see if the file's already been loaded, or load it, and add it
+        # to the bucket and all that good stuff
+        nr_procs = parallel.sanitize_nr_procs(nr_procs)
+        if nr_procs > 1:
+            kwargs["nr_procs"] = nr_procs
+        args_kw = dict(index_handle=index_handle, force_reload=force_reload,
+                       _add_ref=_add_ref, kwargs=kwargs)
+
+        t0 = time()
+        file_lst = parallel.map(max(1, min(nr_procs, len(typed_groups))),
+                                self._load_group, typed_groups,
+                                args_kw=args_kw, threads=nr_procs > 1)
+        if nr_procs > 1:
+            logger.info("Loaded %d file group(s) in %.3g s with nr_procs=%d",
+                        len(typed_groups), time() - t0, nr_procs)
 
         if len(file_lst) == 0:
             logger.warn("No files loaded for '{0}', is the path "
                         "correct?".format(orig_fnames))
         return file_lst
 
+    def _load_group(self, ftype, group, index_handle=True, force_reload=False,
+                    _add_ref=False, kwargs=None):
+        """Load one group of files, this can be called from many threads"""
+        if kwargs is None:
+            kwargs = {}
+
+        f = None
+        handle_name = ftype.collective_name(group)
+
+        with self._lock:
+            try:
+                f = self[handle_name]
+            except KeyError:
+                pass
+
+        if f is not None:
+            if force_reload:
+                f.reload()
+        else:
+            try:
+                # parse without the lock so other groups can load meanwhile
+                f = ftype(group, parent_bucket=self, **kwargs)
+                f.handle_name = handle_name
+                logger.debug("Parsed %s in %.3g s", handle_name,
+                             time() - f.load_time)
+            except IOError as e:
+                s = " IOError on file: {0}\n".format(handle_name)
+                s += "              File Type: {0}\n".format(handle_name)
+                s += "              {0}".format(str(e))
+                logger.warn(s)
+            except ValueError as e:
+                # ... why am i explicitly catching ValueErrors?
+                # i'm probably breaking something by re-raising
+                # this exception, but i didn't document what :(
+                s = " ValueError on file load: {0}\n".format(handle_name)
+                s += "              File Type: {0}\n".format(handle_name)
+                s += "              {0}".format(str(e))
+                logger.warn(s)
+                # re-raise the last expection
+                raise
+
+        with self._lock:
+            # another thread may have loaded the same file while we were
+            # parsing, if so, theirs wins
+            if handle_name in self and self[handle_name] is not f:
+                f = self[handle_name]
+            self.set_item([handle_name], f, index_handle=index_handle,
+                          _add_ref=_add_ref)
+        return f
+
     def remove_item(self, item, do_unload=True):
         if do_unload:
             item.unload()
@@ -184,6 +224,7 @@ class ContainerFile(VFile):  # pylint: disable=abstract-method
     child_bucket = None
     _child_files = None
     _child_ref_count = None
+    _child_lock = None
 
     def __init__(self, fname, parent_bucket=None, **kwargs):
         if parent_bucket is None:
@@ -192,6 +233,7 @@ class ContainerFile(VFile):  # pylint: disable=abstract-method
             self.child_bucket = parent_bucket
         self._child_files = []
         self._child_ref_count = {}
+        self._child_lock = threading.Lock()
         super(ContainerFile, self).__init__(fname, parent_bucket=parent_bucket,
                                             **kwargs)
 
@@ -199,11 +241,12 @@ class ContainerFile(VFile):  # pylint: disable=abstract-method
         """Add file to self.child_bucket and remember it for when I unload"""
         f = self.child_bucket.load_file(fname, _add_ref=True, **kwargs)
         if f is not None:
-            try:
-                self._child_ref_count[f.handle_name] += 1
-            except KeyError:
-                self._child_files.append(f)
-                self._child_ref_count[f.handle_name] = 1
+            with self._child_lock:
+                try:
+                    self._child_ref_count[f.handle_name] += 1
+                except KeyError:
+                    self._child_files.append(f)
+                    self._child_ref_count[f.handle_name] = 1
         return f
 
     def reload(self):
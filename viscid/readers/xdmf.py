@@ -10,6 +10,7 @@ import numpy as np
 
 from viscid.compat import element_tree
 from viscid import logger
+from viscid import parallel
 from viscid.readers.vfile_bucket import ContainerFile
 from viscid.readers.hdf5 import FileLazyHDF5
 from viscid import amr_grid
@@ -113,7 +114,7 @@ class FileXDMF(ContainerFile):  # pylint: disable=abstract-method
         #     root = tree.getroot()
         grids = []
         tree = element_tree.parse(fname)
-        element_tree.xinclude(tree, base_url=fname)
+        element_tree.xinclude(tree, base_url=fname, nr_procs=self.nr_procs)
         root = tree.getroot()
 
         # search for all root grids, and parse them
@@ -133,7 +134,8 @@ class FileXDMF(ContainerFile):  # pylint: disable=abstract-method
                 ret[opt] = type(defval)(el.get(opt, defval))
         return ret
 
-    def _parse_grid(self, el, parent_node=None, time=None):
+    def _parse_grid(self, el, parent_node=None, time=None,
+                    _add_to_parent=True):
         attrs = self._fill_attrs(el)
         grd = None
         crds = None
@@ -183,10 +185,29 @@ class FileXDMF(ContainerFile):  # pylint: disable=abstract-method
             else:
                 logger.warn("Unknown collection type %s, ignoring grid", ct)
 
-            for i, subgrid in enumerate(el.findall("./Grid")):
-                t = times[i] if (times is not None and i < len(times)) else time
-                # print(subgrid, grd, t)
-                self._parse_grid(subgrid, parent_node=grd, time=time)
+            subgrids = el.findall("./Grid")
+            # spatial collections (maybe AMR) reuse the skeleton of the
+            # previous time step through self._last_amr_skeleton, so only
+            # time steps that are plain grids are parsed in parallel
+            flat = all(self._fill_attrs(sg)["GridType"] != "Collection"
+                       for sg in subgrids)
+            if (ct == "Temporal" and flat and self.nr_procs > 1 and
+                    len(subgrids) > 1):
+                # time steps are independent, so parse them on a thread
+                # pool, but add them here since adding isn't thread safe;
+                # the temporal dataset keeps them in time order
+                args_kw = dict(parent_node=grd, time=time, _add_to_parent=False)
+                subgrds = parallel.map(self.nr_procs, self._parse_grid,
+                                       [(sg, ) for sg in subgrids],
+                                       args_kw=args_kw, threads=True)
+                for subgrd in subgrds:
+                    if subgrd is not None:
+                        grd.add(subgrd)
+            else:
+                for i, subgrid in enumerate(subgrids):
+                    t = times[i] if (times is not None and i < len(times)) else time
+                    # print(subgrid, grd, t)
+                    self._parse_grid(subgrid, parent_node=grd, time=time)
             if len(grd.children) > 0:
                 grd.activate(0)
 
@@ -243,7 +264,7 @@ class FileXDMF(ContainerFile):  # pylint: disable=abstract-method
                 if is_amr:
                     self._last_amr_skeleton = grd.skeleton
 
-            if parent_node is not None:
+            if parent_node is not None and _add_to_parent:
                 parent_node.add(grd)
 
         return grd  # can be None
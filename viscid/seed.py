@@ -9,7 +9,8 @@ import numpy as np
 import viscid
 from viscid.compat import izip
 
-__all__ = ['make_rotation_matrix', 'to_seeds', 'SeedGen', 'Point',
+__all__ = ['make_rotation_matrix', 'to_seeds', 'space_filling_order',
+           'SeedGen', 'Point',
            'MeshPoints', 'RectilinearMeshPoints', 'Line', 'Plane', 'Volume',
            'Sphere', 'SphericalCap', 'Circle', 'SphericalPatch',
            'PolarIonosphere']
@@ -28,6 +29,12 @@ def to_seeds(pts):
     else:
         return Point(pts)
 
+def _slice_indices(n, slc):
+    """Flat indices of the points selected by slc out of n points"""
+    if slc is None:
+        return np.arange(n)
+    return np.arange(*slc.indices(n))
+
 def make_rotation_matrix(origin, p1, p2, roll=0.0, new_x=None):
     """Make a matrix that rotates origin-p2 to origin-p1
 
@@ -99,6 +106,68 @@ def make_rotation_matrix(origin, p1, p2, roll=0.0, new_x=None):
     return np.dot(Rroll, R)
 
 
+def space_filling_order(pts, curve="hilbert", nbits=10):
+    """Order points along a space filling curve
+
+    Points that are close together in space end up close together in
+    the returned order, which is useful to give each worker a compact
+    set of seeds, or to keep consecutive points in the same cells.
+
+    Args:
+        pts (ndarray): 3xN array of xyz points
+        curve (str): either 'hilbert' or 'morton' (z-order)
+        nbits (int): bits per axis used to quantize the points within
+            their bounding box
+
+    Returns:
+        ndarray: N indices such that ``pts[:, order]`` is sorted along
+        the curve
+    """
+    pts = np.asarray(pts, dtype='f8').reshape(3, -1)
+    curve = curve.strip().lower()
+    if pts.shape[1] == 0:
+        return np.zeros((0,), dtype='i8')
+
+    # quantize each axis to [0, 2**nbits) within the bounding box
+    lo = np.min(pts, axis=1).reshape(3, 1)
+    extent = (np.max(pts, axis=1).reshape(3, 1) - lo)
+    extent[extent == 0.0] = 1.0
+    X = ((pts - lo) / extent * ((1 << nbits) - 1)).astype('i8')
+
+    if curve == "hilbert":
+        # Skilling's transform (AIP Conf. Proc. 707, 381 (2004)) from axes
+        # to the transposed Hilbert index, vectorized over points
+        M = 1 << (nbits - 1)
+        Q = M
+        while Q > 1:
+            P = Q - 1
+            for i in range(3):
+                mask = (X[i] & Q) != 0
+                t = (X[0] ^ X[i]) & P
+                t[mask] = 0
+                X[0] ^= np.where(mask, P, t)
+                X[i] ^= t
+            Q >>= 1
+        # gray encode
+        for i in range(1, 3):
+            X[i] ^= X[i - 1]
+        t = np.zeros_like(X[0])
+        Q = M
+        while Q > 1:
+            t[(X[2] & Q) != 0] ^= Q - 1
+            Q >>= 1
+        X ^= t
+    elif curve != "morton":
+        raise ValueError("Unknown space filling curve: {0}".format(curve))
+
+    # interleave bits, x is most significant
+    key = np.zeros_like(X[0])
+    for b in range(nbits - 1, -1, -1):
+        for i in range(3):
+            key = (key << 1) | ((X[i] >> b) & 1)
+    return np.argsort(key, kind='mergesort')
+
+
 class SeedGen(object):
     """All about seeds
 
@@ -138,6 +207,10 @@ class SeedGen(object):
               combination of :py:meth:`_make_local_points` and
               :py:meth:`to_3d`. It can be overridden if there is a more
               efficient way te get points in 3d.
+            - :py:meth:`_make_local_points_slice`: Make only the local
+              points that map to a slice of the 3d points, so that
+              ``get_points(slc=...)`` doesn't make all the points
+              first. By default, this raises NotImplementedError.
             - :py:meth:`iter_points`:  If a seed generator can be made
               lazy, then this should return an iterator that yields
               (x, y, z) points.
@@ -277,21 +350,44 @@ class SeedGen(object):
         """Make a tuple of arrays that match :py:attr:`local_shape`"""
         raise NotImplementedError()
 
+    def _make_local_points_slice(self, slc):
+        """Make local points for only the 3d points selected by slc"""
+        raise NotImplementedError()
+
     def _make_3d_points(self):
         """Make a 3xN ndarray of N xyz points"""
         return self.to_3d(self._make_local_points())
 
+    def _make_3d_points_slice(self, slc):
+        """Make a 3xN ndarray of the xyz points selected by slc"""
+        try:
+            return self.to_3d(self._make_local_points_slice(slc))
+        except NotImplementedError:
+            return self._make_3d_points()[:, slc]
+
     def points(self, **kwargs):
         """Alias for :py:meth:`get_points`"""
         return self.get_points(**kwargs)
 
-    def get_points(self, **kwargs):  # pylint: disable=unused-argument
-        """Get a 3xN ndarray of N xyz points"""
+    def get_points(self, slc=None, **kwargs):  # pylint: disable=unused-argument
+        """Get a 3xN ndarray of N xyz points
+
+        Args:
+            slc (slice): if given, only make the points ``[:, slc]``.
+                Generators that can make a subset of points directly
+                don't make the rest.
+        """
         if self._points is not None:
-            return self._points
+            if slc is None:
+                return self._points
+            return self._points[:, slc]
+        if slc is not None and not self._cache:
+            return self._make_3d_points_slice(slc)
         pts = self._make_3d_points()
         if self._cache:
             self._points = pts
+        if slc is not None:
+            pts = pts[:, slc]
         return pts
 
     def iter_points(self, **kwargs):  # pylint: disable=unused-argument
@@ -523,6 +619,9 @@ class Line(SeedGen):
     def _make_local_points(self):
         return self._make_local_axes()
 
+    def _make_local_points_slice(self, slc):
+        return self._make_local_axes()[_slice_indices(self.n, slc)]
+
     def _make_uv_axes(self):
         return np.linspace(0.0, 1.0, self.n), np.array([0.0])
 
@@ -646,6 +745,15 @@ class Plane(SeedGen):
         plane_lmn[2, :] = n
         return plane_lmn
 
+    def _make_local_points_slice(self, slc):
+        il, im = np.divmod(_slice_indices(self.nl * self.nm, slc), self.nm)
+        plane_lmn = np.empty((3, len(il)), dtype=self.dtype)
+        l, m, n = self._make_local_axes()
+        plane_lmn[0, :] = l[il]
+        plane_lmn[1, :] = m[im]
+        plane_lmn[2, :] = n
+        return plane_lmn
+
     def _make_uv_axes(self):
         len_l, len_m = self.len_l, self.len_m
         l = np.linspace(len_l[0], len_l[1], self.nl).astype(self.dtype)
@@ -810,6 +918,15 @@ class Volume(SeedGen):
                                   np.prod(shape[i + 1:]))
         return arr
 
+    def _make_local_points_slice(self, slc):
+        crds = self._make_local_axes()
+        shape = self.local_shape
+        inds = np.unravel_index(_slice_indices(np.prod(shape), slc), shape)
+        arr = np.empty([len(shape)] + [len(inds[0])])
+        for i, (c, ind) in enumerate(izip(crds, inds)):
+            arr[i, :] = c[ind]
+        return arr
+
     def _make_uv_axes(self):
         axes = list(self._make_local_axes())
         axes.pop(self._get_uv_xind())
@@ -1046,6 +1163,21 @@ class Sphere(SeedGen):
             arr[2, :] = np.tile(theta, self.nphi)
         return arr
 
+    def _make_local_points_slice(self, slc):
+        r, theta, phi = self._make_local_axes()
+        inds = _slice_indices(self.ntheta * self.nphi, slc)
+        arr = np.empty((3, len(inds)), dtype=self.dtype)
+        arr[0, :] = r
+        if self.theta_phi:
+            itheta, iphi = np.divmod(inds, self.nphi)
+            arr[1, :] = theta[itheta]
+            arr[2, :] = phi[iphi]
+        else:
+            iphi, itheta = np.divmod(inds, self.ntheta)
+            arr[1, :] = phi[iphi]
+            arr[2, :] = theta[itheta]
+        return arr
+
     def _make_uv_axes(self):
         # well this decision tree is a mess, sorry about that
         theta_endpoints = self._resolve_theta_endpoints()
@@ -1297,6 +1429,15 @@ class SphericalPatch(SeedGen):
         arr[1, :] = np.tile(beta, self.nalpha)
         return arr
 
+    def _make_local_points_slice(self, slc):
+        alpha, beta = self._make_local_axes()
+        ialpha, ibeta = np.divmod(_slice_indices(self.nr_points, slc),
+                                  self.nbeta)
+        arr = np.zeros((2, len(ialpha)), dtype=self.dtype)
+        arr[0, :] = alpha[ialpha]
+        arr[1, :] = beta[ibeta]
+        return arr
+
     def _make_uv_axes(self):
         alpha = np.linspace(-1.0 * self.max_alpha, 1.0 * self.max_alpha,
                             self.nalpha)
@@ -4,7 +4,7 @@ from __future__ import print_function
 
 
 __all__ = ['UnimportedModule', 'DeferredImportError', 'BackendNotFound',
-           'NoBasetimeError', 'KeyboardInterruptError']
+           'NoBasetimeError', 'KeyboardInterruptError', 'WorkerLostError']
 
 
 class UnimportedModule(object):
@@ -52,6 +52,11 @@ class KeyboardInterruptError(Exception):
     """Deprecated and unused"""
     pass
 
+
+class WorkerLostError(RuntimeError):
+    """A worker process died, so the tasks it was running never finish"""
+    pass
+
 ##
 ## EOF
 ##
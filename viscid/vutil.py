@@ -24,7 +24,7 @@ import numpy as np
 
 __all__ = ["timeit", "resolve_path", "find_item", "find_items",
            "get_trilinear_field", "slice_globbed_filenames", "glob2",
-           "interact"]
+           "interact", "PackedLines"]
 
 
 tree_prefix = ".   "
@@ -309,6 +309,82 @@ def _string_colors_as_hex(scalars):
         scalars = [s.ljust(9, 'f') for s in scalars]
     return np.asarray(scalars)
 
+class PackedLines(object):
+    """Lines packed into a single array, CSR style
+
+    All the vertices live in one contiguous `vertices` array with
+    shape (3, N), and line i is ``vertices[:, offsets[i]:offsets[i + 1]]``
+    so `offsets` has nlines + 1 entries. This is what
+    :py:func:`viscid.calc_streamlines` gives back with ``packed=True``.
+
+    PackedLines behave like a sequence of 3xN ndarrays (len, indexing,
+    iteration all give views into `vertices`), so they can go anywhere
+    a list of lines can. :py:func:`prepare_lines` (and so the line
+    plotting functions) and :py:func:`viscid.integrate_along_lines`
+    use `vertices` directly without concatenating anything.
+    """
+    def __init__(self, vertices, offsets):
+        """Wrap vertices / offsets arrays
+
+        Parameters:
+            vertices (ndarray): (nr_comps, N) array of all the points
+            offsets (sequence): nlines + 1 ints, where the first is 0
+                and the last is N
+
+        Raises:
+            ValueError: if offsets don't describe vertices
+        """
+        self.vertices = np.asarray(vertices)
+        self.offsets = np.asarray(offsets, dtype=np.intp)
+        if (self.offsets.ndim != 1 or len(self.offsets) == 0 or
+                self.offsets[0] != 0 or
+                self.offsets[-1] != self.vertices.shape[1]):
+            raise ValueError("offsets must go from 0 to the number of "
+                             "vertices ({0})".format(self.vertices.shape[1]))
+
+    @classmethod
+    def from_lines(cls, lines):
+        """Pack a list of (nr_comps, N) ndarrays"""
+        lines = [np.asarray(line) for line in lines]
+        offsets = np.cumsum([0] + [line.shape[1] for line in lines])
+        if lines:
+            vertices = np.concatenate(lines, axis=1)
+        else:
+            vertices = np.empty((3, 0), dtype='f')
+        return cls(vertices, offsets)
+
+    @property
+    def nr_points(self):
+        """total number of vertices of all the lines"""
+        return self.vertices.shape[1]
+
+    @property
+    def counts(self):
+        """ndarray of the number of vertices in each line"""
+        return np.diff(self.offsets)
+
+    def tolist(self):
+        """list of ndarrays (views into vertices), one for each line"""
+        return [self[i] for i in range(len(self))]
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self[i] for i in range(*item.indices(len(self)))]
+        n = len(self)
+        i = int(item)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("line index {0} out of range".format(item))
+        return self.vertices[:, self.offsets[i]:self.offsets[i + 1]]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
 def prepare_lines(lines, scalars=None, do_connections=False, other=None):
     """Concatenate and standardize a list of lines
 
@@ -316,7 +392,9 @@ def prepare_lines(lines, scalars=None, do_connections=False, other=None):
         lines (list): Must be a list of 3xN or 4xN ndarrays of xyz(s)
             data for N points along the line. N need not be the same
             for all lines. Can alse be 6xN such that lines[:][3:, :]
-            are interpreted as rgb colors
+            are interpreted as rgb colors. Can also be a
+            :py:class:`PackedLines`, in which case the vertices are
+            used as is.
         scalars (sequence): can be one of::
 
               - single hex color (ex, `#FD7400`)
@@ -353,12 +431,20 @@ def prepare_lines(lines, scalars=None, do_connections=False, other=None):
         ValueError: If rgb data is not in a valid range or the shape
             of scalars is not understood
     """
-    nlines = len(lines)
-    npts = [line.shape[1] for line in lines]
-    N = np.sum(npts)
-    first_idx = np.cumsum([0] + npts[:-1])
-    vertices = [np.asarray(line) for line in lines]
-    vertices = np.concatenate(lines, axis=1)
+    if isinstance(lines, PackedLines):
+        # already concatenated
+        nlines = len(lines)
+        npts = lines.counts
+        N = lines.nr_points
+        first_idx = lines.offsets[:-1]
+        vertices = lines.vertices
+    else:
+        nlines = len(lines)
+        npts = [line.shape[1] for line in lines]
+        N = np.sum(npts)
+        first_idx = np.cumsum([0] + npts[:-1])
+        vertices = [np.asarray(line) for line in lines]
+        vertices = np.concatenate(lines, axis=1)
     if vertices.dtype.kind not in 'fc':
         vertices = np.asarray(vertices, dtype='f')
 
@@ -409,9 +495,7 @@ def prepare_lines(lines, scalars=None, do_connections=False, other=None):
             scalars = scalars.repeat(N, axis=1)
         elif scalars.shape == (1, nlines) or scalars.shape == (nlines, 1):
             # one scalar for each line, so broadcast it
-            scalars = scalars.reshape(nlines, 1)
-            scalars = [scalars[i].repeat(ni) for i, ni in enumerate(npts)]
-            scalars = np.concatenate(scalars, axis=0).reshape(1, N)
+            scalars = np.repeat(scalars.reshape(nlines), npts).reshape(1, N)
         elif scalars.shape == (N, 1) or scalars.shape == (1, N):
             # catch these so they're not interpreted as colors if
             # nlines == 1 and N == 3; ie. 1 line with 3 points
@@ -423,12 +507,7 @@ def prepare_lines(lines, scalars=None, do_connections=False, other=None):
                 # the guard against shapes (3, 3) and (4, 4) mean that
                 # these square shapes are assumed Nlines x {3,4}
                 scalars = scalars.T
-            nccomps = scalars.shape[1]  # 3 for rgb, 4 for rgba
-            colors = []
-            for i, ni in enumerate(npts):
-                c = scalars[i].reshape(nccomps, 1).repeat(ni, axis=1)
-                colors.append(c)
-            scalars = np.concatenate(colors, axis=1)
+            scalars = np.repeat(scalars, npts, axis=0).T
         elif scalars.shape in [(3, N), (N, 3), (4, N), (N, 4)]:
             # one rgb(a) color for each vertex
             if (scalars.shape in [(3, N), (4, N)] and
@@ -488,9 +567,7 @@ def prepare_lines(lines, scalars=None, do_connections=False, other=None):
             if arr is None:
                 pass
             elif arr.shape == (1, nlines) or arr.shape == (nlines, 1):
-                arr = arr.reshape(nlines, 1)
-                arr = [arr[i].repeat(ni) for i, ni in enumerate(npts)]
-                other[key] = np.concatenate(arr, axis=0).reshape(1, N)
+                other[key] = np.repeat(arr.reshape(nlines), npts).reshape(1, N)
             else:
                 try:
                     other[key] = arr.reshape(-1, N)
@@ -499,13 +576,13 @@ def prepare_lines(lines, scalars=None, do_connections=False, other=None):
                                        "".format(key))
 
     if do_connections:
-        connections = [None] * nlines
-        for i, ni in enumerate(npts):
-            # i0 is the index of the first point of the i'th line in lines
-            i0 = first_idx[i]
-            connections[i] = np.vstack([np.arange(i0, i0 + ni - 1.5),
-                                        np.arange(i0 + 1, i0 + ni - 0.5)]).T
-        connections = np.concatenate(connections, axis=0).astype('i')
+        # every vertex connects to the next one, except the last vertex
+        # of each line
+        npts = np.asarray(npts, dtype=np.intp)
+        is_last = np.zeros((N,), dtype=np.bool_)
+        is_last[(np.asarray(first_idx) + npts - 1)[npts > 0]] = True
+        i0 = np.flatnonzero(~is_last)
+        connections = np.vstack([i0, i0 + 1]).T.astype('i')
     else:
         connections = None
 